@@ -1,7 +1,41 @@
-"""Simplified Balatro-style poker scoring demo."""
+"""Simplified Balatro-style poker scoring demo.
 
-from .cards import Card, Deck
-from .game import SimpleGame
-from .scoring import HandResult, evaluate_hand
+The public names are imported on first access (PEP 562 ``__getattr__``), so
+``import balatro`` - which every ``balatro`` command and every ``balatro.*``
+import runs first - loads only the submodules actually used.
+"""
 
-__all__ = ["Card", "Deck", "SimpleGame", "HandResult", "evaluate_hand"]
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .cards import Card, Deck
+    from .game import SimpleGame
+    from .rules import Rules
+    from .scoring import HandResult, evaluate_hand
+
+_EXPORTS = {
+    "Card": "cards",
+    "Deck": "cards",
+    "SimpleGame": "game",
+    "HandResult": "scoring",
+    "Rules": "rules",
+    "evaluate_hand": "scoring",
+}
+
+__all__ = ["Card", "Deck", "SimpleGame", "HandResult", "Rules", "evaluate_hand"]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,153 @@
+"""Monte Carlo estimates of the value of each possible discard.
+
+For every candidate discard (a set of hand indices, or none) the advisor
+estimates the expected score of the best five-card play after redrawing
+from the remaining deck. All candidates are scored against the same sampled
+draw orders (common random numbers): sample *s* deals its first *k* cards to
+every candidate that discards *k*, so differences between candidates are not
+swamped by sampling noise and each sample is generated only once.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import combinations
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple
+
+from .cards import Card
+from .solver import best_play_codes
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .game import SimpleGame
+
+# Samples drawn between time-budget checks.
+BATCH_SIZE = 32
+
+
+@dataclass(frozen=True)
+class DiscardEstimate:
+    """Expected best-play score after discarding ``discard`` (hand indices)."""
+
+    discard: Tuple[int, ...]
+    mean: float
+    stderr: float
+    samples: int
+
+
+def candidate_discards(hand_size: int, max_discard: int = 5) -> List[Tuple[int, ...]]:
+    """All discard index sets of size 0..``max_discard``; ``()`` means keep the hand."""
+
+    candidates: List[Tuple[int, ...]] = []
+    for size in range(min(max_discard, hand_size) + 1):
+        candidates.extend(combinations(range(hand_size), size))
+    return candidates
+
+
+def _accumulate(
+    hand: Sequence[int],
+    deck: Sequence[int],
+    candidates: Sequence[Tuple[int, ...]],
+    samples: int,
+    seed: int | None,
+    time_budget: float | None,
+) -> Tuple[List[float], List[float], int]:
+    """Score every candidate on up to ``samples`` shared draws; return sums, sums of squares and count."""
+
+    rng = random.Random(seed)
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    depth = min(max((len(c) for c in candidates), default=0), len(deck))
+    kept = [[code for i, code in enumerate(hand) if i not in candidate] for candidate in candidates]
+    sums = [0.0] * len(candidates)
+    squares = [0.0] * len(candidates)
+    cache: Dict[Tuple[int, ...], int] = {}
+    done = 0
+
+    while done < samples:
+        for _ in range(min(BATCH_SIZE, samples - done)):
+            draw = rng.sample(deck, depth)
+            for slot, (candidate, rest) in enumerate(zip(candidates, kept)):
+                new_hand = rest + draw[: len(candidate)]
+                key = tuple(sorted(new_hand))
+                value = cache.get(key)
+                if value is None:
+                    value = best_play_codes(new_hand).result.total if len(new_hand) >= 5 else 0
+                    cache[key] = value
+                sums[slot] += value
+                squares[slot] += value * value
+            done += 1
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+
+    return sums, squares, done
+
+
+def estimate_discards(
+    hand: Sequence[Card],
+    deck: Sequence[Card],
+    discards_remaining: int,
+    plays_remaining: int,
+    samples: int = 200,
+    time_budget: float | None = None,
+    max_discard: int = 5,
+    workers: int = 1,
+    seed: int | None = None,
+) -> List[DiscardEstimate]:
+    """Estimate the expected next-play score of every discard, best first.
+
+    ``samples`` caps the number of shared redraws; ``time_budget`` (seconds)
+    stops sampling early. With ``workers > 1`` the samples are split across a
+    process pool, each worker using its own seed derived from ``seed``.
+    """
+
+    if plays_remaining <= 0:
+        raise ValueError("No plays remaining in this round.")
+    if samples <= 0:
+        raise ValueError("samples must be positive")
+
+    hand_codes = [card.code for card in hand]
+    deck_codes = [card.code for card in deck]
+    candidates = candidate_discards(len(hand_codes), max_discard if discards_remaining > 0 else 0)
+
+    if workers <= 1:
+        sums, squares, count = _accumulate(hand_codes, deck_codes, candidates, samples, seed, time_budget)
+    else:
+        base = random.Random(seed).getrandbits(64)
+        shares = [samples // workers + (1 if i < samples % workers else 0) for i in range(workers)]
+        sums = [0.0] * len(candidates)
+        squares = [0.0] * len(candidates)
+        count = 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_accumulate, hand_codes, deck_codes, candidates, share, base + i, time_budget)
+                for i, share in enumerate(shares)
+                if share
+            ]
+            for future in futures:
+                part_sums, part_squares, part_count = future.result()
+                sums = [a + b for a, b in zip(sums, part_sums)]
+                squares = [a + b for a, b in zip(squares, part_squares)]
+                count += part_count
+
+    estimates = []
+    for candidate, total, square in zip(candidates, sums, squares):
+        mean = total / count
+        variance = max(square / count - mean * mean, 0.0)
+        estimates.append(DiscardEstimate(candidate, mean, math.sqrt(variance / count), count))
+    estimates.sort(key=lambda estimate: (-estimate.mean, len(estimate.discard)))
+    return estimates
+
+
+def advise(game: "SimpleGame", **kwargs) -> List[DiscardEstimate]:
+    """Run :func:`estimate_discards` on the current state of ``game``."""
+
+    return estimate_discards(
+        game.hand,
+        game.deck.remaining_cards(),
+        game.discards_remaining,
+        game.plays_remaining,
+        **kwargs,
+    )
@@ -0,0 +1,180 @@
+"""Incrementally maintained rank/suit statistics of a set of cards.
+
+:class:`CardCounts` keeps, for a multiset of compact card codes (duplicates
+from multi-deck rules included), how many copies of each card it holds, the
+rank histogram, the suit histogram, a rank mask per suit and, for each of the ten
+straight windows (A-2-3-4-5 up to 10-J-Q-K-A), how many of its ranks are
+present. Adding or removing a card touches only the entries for that card's
+rank and suit, so :class:`~balatro.game.SimpleGame` can keep the counts of
+its hand (and optionally of its undrawn deck) current as cards are drawn,
+played and discarded, and callers can ask what the hand can make, or could
+still make after drawing, without rescanning it.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, List, Set, Tuple
+
+from .cards import DECK_SIZE, RANK_SHIFT, RANKS, SUIT_MASK, SUITS
+from .tables import STRAIGHT_MASKS
+
+# Straight windows ordered by their top card; the wheel (A-2-3-4-5) comes first.
+WINDOWS: Tuple[int, ...] = tuple(sorted(STRAIGHT_MASKS, key=lambda mask: (mask & 0xFFF).bit_length()))
+_WINDOWS_BY_RANK: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(index for index, window in enumerate(WINDOWS) if window >> rank & 1) for rank in range(len(RANKS))
+)
+
+
+class CardCounts:
+    """Rank/suit histograms and straight-window counts of a multiset of cards."""
+
+    __slots__ = ("copies", "ranks", "suits", "suit_ranks", "windows", "size")
+
+    def __init__(self, codes: Iterable[int] = ()) -> None:
+        self.copies: List[int] = [0] * DECK_SIZE  # per card code
+        self.ranks: List[int] = [0] * len(RANKS)
+        self.suits: List[int] = [0] * len(SUITS)
+        self.suit_ranks: List[int] = [0] * len(SUITS)  # rank bitmask held in each suit
+        self.windows: List[int] = [0] * len(WINDOWS)  # distinct ranks present per straight window
+        self.size = 0
+        for code in codes:
+            self.add(code)
+
+    def add(self, code: int) -> None:
+        rank = code >> RANK_SHIFT
+        suit = code & SUIT_MASK
+        self.copies[code] += 1
+        self.ranks[rank] += 1
+        self.suits[suit] += 1
+        self.suit_ranks[suit] |= 1 << rank
+        self.size += 1
+        if self.ranks[rank] == 1:
+            windows = self.windows
+            for index in _WINDOWS_BY_RANK[rank]:
+                windows[index] += 1
+
+    def remove(self, code: int) -> None:
+        rank = code >> RANK_SHIFT
+        suit = code & SUIT_MASK
+        if not self.copies[code]:
+            raise ValueError(f"Card code {code} is not counted.")
+        self.copies[code] -= 1
+        self.ranks[rank] -= 1
+        self.suits[suit] -= 1
+        if not self.copies[code]:
+            self.suit_ranks[suit] &= ~(1 << rank)
+        self.size -= 1
+        if self.ranks[rank] == 0:
+            windows = self.windows
+            for index in _WINDOWS_BY_RANK[rank]:
+                windows[index] -= 1
+
+    def copy(self) -> "CardCounts":
+        twin = CardCounts.__new__(CardCounts)
+        twin.copies = list(self.copies)
+        twin.ranks = list(self.ranks)
+        twin.suits = list(self.suits)
+        twin.suit_ranks = list(self.suit_ranks)
+        twin.windows = list(self.windows)
+        twin.size = self.size
+        return twin
+
+    @property
+    def rank_mask(self) -> int:
+        return self.suit_ranks[0] | self.suit_ranks[1] | self.suit_ranks[2] | self.suit_ranks[3]
+
+    def has_code(self, code: int) -> bool:
+        return self.copies[code] > 0
+
+    def of_a_kind(self) -> List[int]:
+        """Rank counts, largest first (e.g. ``[3, 2, 1, 1, 1]``)."""
+
+        return sorted((count for count in self.ranks if count), reverse=True)
+
+    def flush_suits(self) -> List[int]:
+        """Suit indices holding at least five cards."""
+
+        return [suit for suit, count in enumerate(self.suits) if count >= 5]
+
+    def complete_windows(self) -> List[int]:
+        """Indices into :data:`WINDOWS` of the straights the cards contain."""
+
+        return [index for index, present in enumerate(self.windows) if present == 5]
+
+    def categories(self) -> Set[str]:
+        """Every ``HAND_SCORES`` category some five of these cards make."""
+
+        found = set()
+        if self.size < 5:
+            return found
+        found.add("High Card")
+        kinds = self.of_a_kind() + [0, 0]
+        if kinds[0] >= 2:
+            found.add("One Pair")
+        if kinds[0] >= 2 and kinds[1] >= 2:
+            found.add("Two Pair")
+        if kinds[0] >= 3:
+            found.add("Three of a Kind")
+        if kinds[0] >= 3 and kinds[1] >= 2:
+            found.add("Full House")
+        if kinds[0] >= 4:
+            found.add("Four of a Kind")
+        if self.flush_suits():
+            found.add("Flush")
+        if self.complete_windows():
+            found.add("Straight")
+            if any(suit_mask & window == window for suit_mask in self.suit_ranks for window in WINDOWS):
+                found.add("Straight Flush")
+        return found
+
+    def reachable(self, deck: "CardCounts", draws: int) -> Set[str]:
+        """Categories these cards could make after drawing ``draws`` cards from ``deck``.
+
+        Each category is checked on its own (e.g. "flush draw possible" means
+        some suit can reach five cards), assuming the best possible draws.
+        """
+
+        draws = max(0, min(draws, deck.size))
+        found = set()
+        if self.size + draws < 5:
+            return found
+        found.add("High Card")
+
+        # Cards needed to bring each rank to n of a kind, cheapest first.
+        def needs(n: int) -> List[Tuple[int, int]]:
+            costs = []
+            for rank, held in enumerate(self.ranks):
+                missing = max(0, n - held)
+                if missing <= deck.ranks[rank]:
+                    costs.append((missing, rank))
+            return sorted(costs)
+
+        for name, n in (("One Pair", 2), ("Three of a Kind", 3), ("Four of a Kind", 4)):
+            costs = needs(n)
+            if costs and costs[0][0] <= draws:
+                found.add(name)
+        pairs = needs(2)
+        if len(pairs) >= 2 and pairs[0][0] + pairs[1][0] <= draws:
+            found.add("Two Pair")
+        trips = needs(3)
+        for trip_cost, trip_rank in trips:
+            pair_cost = next((cost for cost, rank in pairs if rank != trip_rank), None)
+            if pair_cost is not None and trip_cost + pair_cost <= draws:
+                found.add("Full House")
+                break
+
+        if any(held + min(draws, deck.suits[suit]) >= 5 for suit, held in enumerate(self.suits)):
+            found.add("Flush")
+        held_mask, deck_mask = self.rank_mask, deck.rank_mask
+        for window in WINDOWS:
+            missing = window & ~held_mask
+            if missing & ~deck_mask == 0 and bin(missing).count("1") <= draws:
+                found.add("Straight")
+                break
+        for suit, held_mask in enumerate(self.suit_ranks):
+            for window in WINDOWS:
+                missing = window & ~held_mask
+                if missing & ~deck.suit_ranks[suit] == 0 and bin(missing).count("1") <= draws:
+                    found.add("Straight Flush")
+                    break
+        return found
@@ -0,0 +1,143 @@
+"""Versioned on-disk cache for procedurally rendered textures.
+
+Rendering the tabletop (a full-HD gradient, overlay and radius-90 blur)
+dominates UI start-up, so rendered images are saved to disk and loaded on
+later launches. Entries are stored uncompressed - a small header (magic,
+format version, mode, size) followed by the raw pixels - because decoding
+a full-HD PNG costs about half as much as rendering it, while raw pixels
+load several times faster. Each entry is keyed by a hash of everything that
+affects its pixels - sizes, colours, the font actually used and
+:data:`ASSET_VERSION` - so changing any of them simply misses the cache
+instead of showing stale art. Bump :data:`ASSET_VERSION` whenever the
+drawing code itself changes.
+
+The cache lives in ``$BALATRO_CACHE_DIR`` if set, otherwise in the
+platform's user cache directory; ``BALATRO_ASSET_CACHE=0`` disables it.
+Unreadable entries are re-rendered, and files are written atomically, so
+concurrent launches never see half-written images.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Dict
+
+if TYPE_CHECKING:  # pragma: no cover
+    from PIL import Image
+
+ASSET_VERSION = 1
+MAGIC = b"BLTX"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sH8sII")  # magic, format version, mode, width, height
+
+
+def default_cache_dir() -> Path:
+    override = os.environ.get("BALATRO_CACHE_DIR")
+    if override:
+        return Path(override)
+    if sys.platform == "win32":
+        root = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        root = Path.home() / "Library" / "Caches"
+    else:
+        root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return root / "balatro" / "textures"
+
+
+def asset_key(name: str, params: Dict[str, Any]) -> str:
+    """Stable hash of an asset's name, render parameters and :data:`ASSET_VERSION`."""
+
+    payload = json.dumps({"name": name, "version": ASSET_VERSION, "params": params}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:20]
+
+
+class AssetCache:
+    """Texture files under ``directory``, one per (name, render parameters)."""
+
+    def __init__(self, directory: str | os.PathLike[str] | None = None, enabled: bool = True) -> None:
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+        self.enabled = enabled
+        self.hits = self.misses = 0
+
+    @classmethod
+    def default(cls) -> "AssetCache":
+        return cls(enabled=os.environ.get("BALATRO_ASSET_CACHE", "1") != "0")
+
+    def path(self, name: str, params: Dict[str, Any]) -> Path:
+        return self.directory / f"{name}-{asset_key(name, params)}.tex"
+
+    def get_or_render(self, name: str, params: Dict[str, Any], render: Callable[[], Image.Image]) -> Image.Image:
+        """Load ``name`` rendered with ``params`` from disk, rendering and saving it on a miss."""
+
+        image = self.load(name, params)
+        if image is None:
+            image = render()
+            self.save(name, params, image)
+        return image
+
+    def load(self, name: str, params: Dict[str, Any]) -> Image.Image | None:
+        """The cached texture, or ``None`` on a miss (or when the cache is disabled)."""
+
+        if not self.enabled:
+            return None
+        try:
+            image = read_texture(self.path(name, params))
+        except (OSError, ValueError):  # missing, truncated or from another format version
+            self.misses += 1
+            return None
+        self.hits += 1
+        return image
+
+    def save(self, name: str, params: Dict[str, Any], image: Image.Image) -> None:
+        if self.enabled:
+            self._store(self.path(name, params), image)
+
+    def _store(self, path: Path, image: Image.Image) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(handle, "wb") as out:
+                    write_texture(out, image)
+                os.replace(temporary, path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+        except OSError:  # pragma: no cover - read-only or full disk: keep running uncached
+            pass
+
+    def clear(self) -> int:
+        """Delete every cached texture; return how many files were removed."""
+
+        removed = 0
+        if self.directory.is_dir():
+            for entry in self.directory.glob("*.tex"):
+                entry.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
+def write_texture(out: BinaryIO, image: Image.Image) -> None:
+    out.write(HEADER.pack(MAGIC, FORMAT_VERSION, image.mode.encode(), image.width, image.height))
+    out.write(image.tobytes())
+
+
+def read_texture(path: str | os.PathLike[str]) -> Image.Image:
+    with open(path, "rb") as handle:
+        data = handle.read()
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path}: truncated texture header")
+    magic, version, mode, width, height = HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"{path}: not a texture of format version {FORMAT_VERSION}")
+    mode_name = mode.rstrip(b"\0").decode()
+    # frombytes raises ValueError on a short (truncated) buffer.
+    from PIL import Image
+
+    return Image.frombytes(mode_name, (width, height), data[HEADER.size :])
@@ -0,0 +1,137 @@
+"""A single texture sheet holding every card face, filled in the background.
+
+The sheet has one column per rank and one row per (suit, selected) pair,
+so all 104 faces - 52 cards, plain and highlighted - live in one image.
+:meth:`CardAtlas.start` renders them on a worker thread (cards the caller
+needs first go first) while the UI keeps running; :meth:`CardAtlas.face`
+crops a finished face and returns ``None`` for one that is not drawn yet,
+and :meth:`CardAtlas.completed` reports newly finished faces so the UI can
+swap them in as they arrive. A complete sheet is saved to the
+:class:`~balatro.assets.AssetCache` and later launches load it in one read.
+
+Only the worker thread draws into the sheet; all access goes through a lock,
+so cropping from the Tk thread while the worker pastes is safe.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Set, Tuple
+
+from .assets import AssetCache
+from .cards import CARDS, RANKS, SUITS, Card, rank_index, suit_index
+
+if TYPE_CHECKING:  # pragma: no cover
+    from PIL import Image
+
+COLUMNS = len(RANKS)
+ROWS = len(SUITS) * 2
+
+Slot = Tuple[Card, bool]
+ALL_SLOTS: Tuple[Slot, ...] = tuple((card, selected) for selected in (False, True) for card in CARDS)
+
+
+class CardAtlas:
+    """Every card face, plain and selected, on one ``COLUMNS x ROWS`` sheet."""
+
+    def __init__(
+        self,
+        render: Callable[[Card, bool], Image.Image],
+        card_size: Tuple[int, int],
+        cache: AssetCache | None = None,
+        params: Dict[str, Any] | None = None,
+    ) -> None:
+        self.render = render
+        self.card_size = card_size
+        self.cache = cache
+        self.params = dict(params or {}, size=card_size)
+        self._lock = threading.Lock()
+        self._ready: Set[Tuple[int, bool]] = set()
+        self._completed: "queue.SimpleQueue[Slot]" = queue.SimpleQueue()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        sheet_size = (card_size[0] * COLUMNS, card_size[1] * ROWS)
+        sheet = cache.load("atlas", self.params) if cache is not None else None
+        if sheet is not None and sheet.size == sheet_size:
+            self.sheet = sheet.convert("RGBA")
+            self._ready = {(card.code, selected) for card, selected in ALL_SLOTS}
+            self.loaded = True
+        else:
+            from PIL import Image
+
+            self.sheet = Image.new("RGBA", sheet_size, (0, 0, 0, 0))
+            self.loaded = False
+
+    @property
+    def complete(self) -> bool:
+        return len(self._ready) == len(ALL_SLOTS)
+
+    def box(self, card: Card, selected: bool = False) -> Tuple[int, int, int, int]:
+        width, height = self.card_size
+        left = rank_index(card.code) * width
+        top = (suit_index(card.code) + (len(SUITS) if selected else 0)) * height
+        return (left, top, left + width, top + height)
+
+    def is_ready(self, card: Card, selected: bool = False) -> bool:
+        return (card.code, selected) in self._ready
+
+    def face(self, card: Card, selected: bool = False) -> Image.Image | None:
+        """The rendered face, or ``None`` if the worker has not drawn it yet."""
+
+        with self._lock:
+            if (card.code, selected) not in self._ready:
+                return None
+            return self.sheet.crop(self.box(card, selected))
+
+    def render_slot(self, card: Card, selected: bool = False) -> None:
+        image = self.render(card, selected)
+        with self._lock:
+            self.sheet.paste(image, self.box(card, selected))
+            self._ready.add((card.code, selected))
+        self._completed.put((card, selected))
+
+    def build(self, priority: Iterable[Slot] = ()) -> None:
+        """Render every missing face on the calling thread, ``priority`` first."""
+
+        order = list(dict.fromkeys([*priority, *ALL_SLOTS]))
+        for card, selected in order:
+            if self._stop.is_set():
+                return
+            if not self.is_ready(card, selected):
+                self.render_slot(card, selected)
+        if self.cache is not None and not self.loaded:
+            with self._lock:
+                sheet = self.sheet.copy()
+            self.cache.save("atlas", self.params, sheet)
+            self.loaded = True
+
+    def start(self, priority: Iterable[Slot] = ()) -> None:
+        """Run :meth:`build` on a daemon worker thread (no-op if running or complete)."""
+
+        if self.complete or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.build, args=(list(priority),), name="card-atlas", daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the worker finishes; return whether the atlas is complete."""
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.complete
+
+    def stop(self) -> None:
+        self._stop.set()
+        self.wait()
+
+    def completed(self) -> List[Slot]:
+        """Faces finished since the last call, in render order."""
+
+        done: List[Slot] = []
+        while True:
+            try:
+                done.append(self._completed.get_nowait())
+            except queue.Empty:
+                return done
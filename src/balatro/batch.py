@@ -0,0 +1,101 @@
+"""Vectorized hand evaluation over NumPy arrays of compact card codes.
+
+Importing this module requires NumPy (``pip install balatro[fast]``); use
+:func:`balatro.scoring.evaluate_hands`, which imports it on demand.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from .cards import DECK_SIZE, RANKS, RANK_SHIFT, SUIT_MASK
+from .scoring import CATEGORY_IDS, HAND_SCORES
+from .tables import STRAIGHT_MASKS
+
+# Rows evaluated per step; keeps the per-chunk temporaries cache-sized.
+CHUNK_SIZE = 1 << 15
+
+_CHIPS = np.array([chips for _, chips, _ in HAND_SCORES], dtype=np.int64)
+_MULTIPLIERS = np.array([mult for _, _, mult in HAND_SCORES], dtype=np.int64)
+
+_STRAIGHT_TABLE = np.zeros(1 << len(RANKS), dtype=bool)
+_STRAIGHT_TABLE[sorted(STRAIGHT_MASKS)] = True
+
+_PRECEDENCE = [
+    CATEGORY_IDS[name]
+    for name in (
+        "Straight Flush",
+        "Four of a Kind",
+        "Full House",
+        "Flush",
+        "Straight",
+        "Three of a Kind",
+        "Two Pair",
+        "One Pair",
+    )
+]
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Per-hand arrays parallel to the rows of the evaluated input."""
+
+    category: np.ndarray
+    chips: np.ndarray
+    multiplier: np.ndarray
+    total: np.ndarray
+
+    def names(self) -> list[str]:
+        return [HAND_SCORES[index][0] for index in self.category.tolist()]
+
+
+def _categorize(codes: np.ndarray) -> np.ndarray:
+    suits = codes & SUIT_MASK
+    flush = (suits == suits[:, :1]).all(axis=1)
+
+    # With ranks sorted per hand, equal neighbours mark repeated ranks: one
+    # link is a pair, two links a trip (if adjacent) or two pair, three links
+    # quads (if all adjacent) or a full house.
+    ranks = np.sort(codes >> RANK_SHIFT, axis=1)
+    links = ranks[:, 1:] == ranks[:, :-1]
+    link_count = links.sum(axis=1)
+    runs = links[:, :-1] & links[:, 1:]
+    triple = runs.any(axis=1)
+    quad = (runs[:, :-1] & runs[:, 1:]).any(axis=1)
+
+    rank_mask = np.bitwise_or.reduce(np.left_shift(1, ranks.astype(np.int32)), axis=1)
+    straight = (link_count == 0) & _STRAIGHT_TABLE[rank_mask]
+
+    # Same precedence as balatro.scoring.evaluate_hand; see _PRECEDENCE.
+    conditions = [
+        straight & flush,
+        quad,
+        (link_count == 3) & ~quad,
+        flush,
+        straight,
+        (link_count == 2) & triple,
+        link_count == 2,
+        link_count == 1,
+    ]
+    return np.select(conditions, _PRECEDENCE, default=CATEGORY_IDS["High Card"]).astype(np.int8)
+
+
+def evaluate_hands(codes: npt.ArrayLike) -> BatchResult:
+    hands = np.asarray(codes)
+    if hands.ndim != 2 or hands.shape[1] != 5:
+        raise ValueError("Expected an (N, 5) array of card codes.")
+    if not np.issubdtype(hands.dtype, np.integer):
+        raise ValueError("Card codes must be integers.")
+    if hands.size and (hands.min() < 0 or hands.max() >= DECK_SIZE):
+        raise ValueError(f"Card codes must be in the range 0..{DECK_SIZE - 1}.")
+
+    category = np.empty(len(hands), dtype=np.int8)
+    for start in range(0, len(hands), CHUNK_SIZE):
+        category[start : start + CHUNK_SIZE] = _categorize(hands[start : start + CHUNK_SIZE])
+
+    chips = _CHIPS[category]
+    multiplier = _MULTIPLIERS[category]
+    return BatchResult(category=category, chips=chips, multiplier=multiplier, total=chips * multiplier)
@@ -0,0 +1,663 @@
+"""Micro-benchmarks for the scoring, deck, game and rendering hot paths.
+
+Each benchmark is a setup function that returns a zero-argument callable;
+the callable is timed pytest-benchmark style: the iteration count is
+calibrated until one round takes at least ``min_time`` seconds, then
+``rounds`` rounds are timed and per-call statistics are kept. Benchmarks
+registered with ``track_memory`` (the deck rounds) also record the
+``tracemalloc`` peak bytes of one call. Results are written as JSON
+together with a description of the machine, and
+:func:`compare` flags benchmarks whose median got slower than a stored
+baseline by more than a threshold. Nothing here needs network access;
+benchmarks whose optional dependencies (NumPy, Pillow) are missing are
+reported as skipped.
+
+Command line::
+
+    balatro bench run --out bench.json            # all benchmarks
+    balatro bench run -k deck --compare base.json # a subset, checked against a baseline
+    balatro bench compare base.json bench.json --threshold 0.15
+    balatro bench startup --check                 # import-time budgets
+
+Start-up is measured separately: :func:`measure_startup` runs a command in
+a fresh interpreter under ``-X importtime`` and sums the time spent on
+imports a bare interpreter does not make; :data:`STARTUP_BUDGETS_MS` holds
+the budgets ``--check`` enforces (and the test suite, with
+``BALATRO_CHECK_BUDGETS=1`` set).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+FORMAT_VERSION = 1
+DEFAULT_THRESHOLD = 0.10
+
+Setup = Callable[[], Callable[[], object]]
+
+
+class Skip(Exception):
+    """Raised by a benchmark setup when it cannot run on this machine."""
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    group: str
+    name: str
+    setup: Setup
+    track_memory: bool = False
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.group}/{self.name}"
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    """Per-call timings of one benchmark, in seconds."""
+
+    name: str
+    group: str
+    rounds: int
+    iterations: int
+    min: float
+    median: float
+    mean: float
+    stddev: float
+    peak_bytes: int | None = None  # largest traced allocation peak of one call, if tracked
+
+    @property
+    def ops(self) -> float:
+        return 1.0 / self.median if self.median else 0.0
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline: float
+    current: float
+    ratio: float  # current / baseline median; above 1 is slower
+    regressed: bool
+
+
+BENCHMARKS: List[Benchmark] = []
+
+
+def benchmark(group: str, name: str, track_memory: bool = False) -> Callable[[Setup], Setup]:
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS.append(Benchmark(group, name, setup, track_memory))
+        return setup
+
+    return register
+
+
+def peak_allocation(func: Callable[[], object], calls: int = 200) -> int:
+    """Largest ``tracemalloc`` peak, in bytes above the starting usage, of one call to ``func``."""
+
+    import tracemalloc
+
+    func()  # warm caches so the first traced call is representative
+    tracemalloc.start()
+    try:
+        peak = 0
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            func()
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def measure(
+    func: Callable[[], object],
+    rounds: int = 5,
+    min_time: float = 0.05,
+    name: str = "",
+    group: str = "",
+    track_memory: bool = False,
+) -> BenchResult:
+    """Time ``func`` over ``rounds`` calibrated rounds and return per-call statistics.
+
+    With ``track_memory`` the result also holds :func:`peak_allocation`,
+    measured separately so tracing does not slow down the timed rounds.
+    """
+
+    if rounds <= 0:
+        raise ValueError("rounds must be positive")
+    func()  # warm up caches and lazily built tables
+    timer = time.perf_counter
+    iterations = 1
+    while True:
+        started = timer()
+        for _ in range(iterations):
+            func()
+        elapsed = timer() - started
+        if elapsed >= min_time:
+            break
+        iterations *= 10 if elapsed < min_time / 10 else 2
+
+    samples = []
+    for _ in range(rounds):
+        started = timer()
+        for _ in range(iterations):
+            func()
+        samples.append((timer() - started) / iterations)
+    return BenchResult(
+        name=name,
+        group=group,
+        rounds=rounds,
+        iterations=iterations,
+        min=min(samples),
+        median=statistics.median(samples),
+        mean=statistics.fmean(samples),
+        stddev=statistics.stdev(samples) if rounds > 1 else 0.0,
+        peak_bytes=peak_allocation(func) if track_memory else None,
+    )
+
+
+def machine_info() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def select(patterns: Sequence[str] = ()) -> List[Benchmark]:
+    """Benchmarks whose ``group/name`` contains any of ``patterns`` (all if empty)."""
+
+    if not patterns:
+        return list(BENCHMARKS)
+    return [bench for bench in BENCHMARKS if any(pattern in bench.full_name for pattern in patterns)]
+
+
+def run_suite(
+    benchmarks: Sequence[Benchmark] | None = None,
+    rounds: int = 5,
+    min_time: float = 0.05,
+    progress: Callable[[str], None] | None = None,
+) -> Dict[str, Any]:
+    """Run ``benchmarks`` (default: all) and return a JSON-serializable report."""
+
+    results: List[Dict[str, Any]] = []
+    skipped: Dict[str, str] = {}
+    for bench in BENCHMARKS if benchmarks is None else benchmarks:
+        try:
+            func = bench.setup()
+        except (Skip, ImportError) as exc:
+            skipped[bench.full_name] = str(exc)
+            continue
+        result = measure(func, rounds, min_time, bench.name, bench.group, bench.track_memory)
+        results.append(asdict(result))
+        if progress is not None:
+            progress(format_result(result))
+    return {
+        "version": FORMAT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "machine": machine_info(),
+        "benchmarks": results,
+        "skipped": skipped,
+    }
+
+
+def save(report: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2, ensure_ascii=False)
+        handle.write("\n")
+
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as handle:
+        report = json.load(handle)
+    if report.get("version") != FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported benchmark report version {report.get('version')!r}")
+    return report
+
+
+def _medians(report: Dict[str, Any]) -> Dict[str, float]:
+    return {f"{entry['group']}/{entry['name']}": entry["median"] for entry in report["benchmarks"]}
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> List[Comparison]:
+    """Compare medians of benchmarks present in both reports, slowest change first.
+
+    A benchmark regressed when its median grew by more than ``threshold``
+    (a fraction, so ``0.10`` means 10% slower).
+    """
+
+    if threshold < 0:
+        raise ValueError("threshold must not be negative")
+    before = _medians(baseline)
+    comparisons = []
+    for name, median in _medians(current).items():
+        if name not in before:
+            continue
+        ratio = median / before[name] if before[name] else float("inf")
+        comparisons.append(Comparison(name, before[name], median, ratio, ratio > 1 + threshold))
+    comparisons.sort(key=lambda comparison: -comparison.ratio)
+    return comparisons
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def format_result(result: BenchResult) -> str:
+    memory = f"  peak {result.peak_bytes:,} B/call" if result.peak_bytes is not None else ""
+    return (
+        f"{result.group + '/' + result.name:<40} median {_format_time(result.median):>10}"
+        f"  min {_format_time(result.min):>10}  ±{_format_time(result.stddev):>10}"
+        f"  ({result.ops:,.0f} ops/s){memory}"
+    )
+
+
+def format_comparison(comparisons: Sequence[Comparison], threshold: float = DEFAULT_THRESHOLD) -> str:
+    lines = [f"{'benchmark':<40} {'baseline':>10} {'current':>10}  change"]
+    for item in comparisons:
+        flag = "  REGRESSION" if item.regressed else ""
+        lines.append(
+            f"{item.name:<40} {_format_time(item.baseline):>10} {_format_time(item.current):>10}"
+            f"  {item.ratio - 1:+7.1%}{flag}"
+        )
+    regressions = sum(item.regressed for item in comparisons)
+    lines.append(f"{regressions} regression(s) above {threshold:.0%}")
+    return "\n".join(lines)
+
+
+# -- benchmarks ---------------------------------------------------------------
+
+# One representative hand per category, as "rank+suit" tokens.
+CATEGORY_HANDS = {
+    "High Card": "2♠ 5♥ 9♦ J♣ K♠",
+    "One Pair": "9♠ 9♥ 3♦ J♣ K♠",
+    "Two Pair": "9♠ 9♥ J♦ J♣ K♠",
+    "Three of a Kind": "9♠ 9♥ 9♦ J♣ K♠",
+    "Straight": "5♠ 6♥ 7♦ 8♣ 9♠",
+    "Flush": "2♥ 5♥ 9♥ J♥ K♥",
+    "Full House": "9♠ 9♥ 9♦ K♣ K♠",
+    "Four of a Kind": "9♠ 9♥ 9♦ 9♣ K♠",
+    "Straight Flush": "5♠ 6♠ 7♠ 8♠ 9♠",
+}
+
+BULK_HANDS = 10_000
+DECK_DRAWS = [8] + [5, 3] * 5  # deal, then refill after each play and discard of a round
+
+
+def _parse_hand(text: str):
+    from .cards import Card
+
+    return [Card(token[:-1], token[-1]) for token in text.split()]
+
+
+def _random_code_rows(count: int, seed: int = 0) -> List[List[int]]:
+    rng = random.Random(seed)
+    return [rng.sample(range(52), 5) for _ in range(count)]
+
+
+def _register_category(name: str, text: str) -> None:
+    @benchmark("scoring", f"evaluate_hand[{name}]")
+    def setup() -> Callable[[], object]:
+        from .scoring import evaluate_hand
+
+        hand = _parse_hand(text)
+        return lambda: evaluate_hand(hand)
+
+
+for _name, _text in CATEGORY_HANDS.items():
+    _register_category(_name, _text)
+
+
+@benchmark("bulk", f"evaluate_hand[{BULK_HANDS}]")
+def _bulk_evaluate_hand() -> Callable[[], object]:
+    from .cards import decode_cards
+    from .scoring import evaluate_hand
+
+    hands = [decode_cards(row) for row in _random_code_rows(BULK_HANDS)]
+    return lambda: [evaluate_hand(hand) for hand in hands]
+
+
+@benchmark("bulk", f"evaluate_hand[{BULK_HANDS}, table]")
+def _bulk_evaluate_hand_table() -> Callable[[], object]:
+    from .cards import decode_cards
+    from .scoring import evaluate_hand
+
+    hands = [decode_cards(row) for row in _random_code_rows(BULK_HANDS)]
+    return lambda: [evaluate_hand(hand, engine="table") for hand in hands]
+
+
+@benchmark("bulk", f"evaluate_codes[{BULK_HANDS}]")
+def _bulk_evaluate_codes() -> Callable[[], object]:
+    from .scoring import evaluate_codes
+
+    rows = _random_code_rows(BULK_HANDS)
+    return lambda: [evaluate_codes(row) for row in rows]
+
+
+@benchmark("bulk", f"evaluate_hand[{BULK_HANDS}, rules]")
+def _bulk_evaluate_rules() -> Callable[[], object]:
+    from .cards import decode_cards
+    from .rules import Rules
+
+    compiled = Rules.from_scores({"Flush": (100, 5), "Straight": (40, 6)}).compile()
+    hands = [decode_cards(row) for row in _random_code_rows(BULK_HANDS)]
+    return lambda: [compiled.evaluate(hand) for hand in hands]
+
+
+@benchmark("bulk", f"evaluate_hands[{BULK_HANDS}]")
+def _bulk_evaluate_hands() -> Callable[[], object]:
+    import numpy as np
+
+    from .scoring import evaluate_hands
+
+    hands = np.array(_random_code_rows(BULK_HANDS), dtype=np.int8)
+    return lambda: evaluate_hands(hands)
+
+
+@benchmark("store", f"record hands[{BULK_HANDS}]")
+def _store_record_hands() -> Callable[[], object]:
+    from .scoring import HAND_RESULTS
+    from .store import GameStore
+
+    results = [HAND_RESULTS[i % len(HAND_RESULTS)] for i in range(BULK_HANDS)]
+    store = GameStore(batch_size=BULK_HANDS)
+
+    def run() -> None:
+        for start in range(0, BULK_HANDS, 5):
+            store.start(start)
+            for result in results[start : start + 5]:
+                store.play((0, 1, 2, 3, 4), result)
+            store.end(0)
+        store.flush()
+
+    return run
+
+
+@benchmark("deck", "reset+draw round", track_memory=True)
+def _deck_round() -> Callable[[], object]:
+    from .cards import Deck
+
+    deck = Deck(random.Random(0))
+
+    def run() -> None:
+        deck.reset()
+        for count in DECK_DRAWS:
+            deck.draw(count)
+
+    return run
+
+
+@benchmark("deck", "new deck+draw round", track_memory=True)
+def _deck_fresh_round() -> Callable[[], object]:
+    from .cards import Deck
+
+    seeds = iter(range(1 << 62))
+
+    def run() -> None:
+        deck = Deck(random.Random(next(seeds)))
+        for count in DECK_DRAWS:
+            deck.draw(count)
+
+    return run
+
+
+@benchmark("deck", "draw+take_back 5")
+def _deck_take_back() -> Callable[[], object]:
+    from .cards import Deck
+
+    deck = Deck(random.Random(0))
+
+    def run() -> None:
+        deck.take_back(deck.draw(5))
+
+    return run
+
+
+def _register_game(policy_name: str) -> None:
+    @benchmark("game", f"round[{policy_name}]")
+    def setup() -> Callable[[], object]:
+        from .cards import Deck
+        from .game import SimpleGame
+        from .simulate import POLICIES, play_game
+
+        policy = POLICIES[policy_name]
+        game = SimpleGame(deck=Deck(random.Random()))
+        rng = random.Random()
+        seeds = iter(range(1 << 62))
+        return lambda: play_game(policy, next(seeds), game=game, rng=rng)
+
+
+for _policy in ("random", "greedy"):
+    _register_game(_policy)
+
+
+def _art_library(cache_dir: str | None = None):
+    try:
+        from .assets import AssetCache
+        from .ui import ArtLibrary
+    except ImportError as exc:
+        raise Skip(f"UI dependencies unavailable: {exc}") from exc
+    return ArtLibrary(AssetCache(cache_dir, enabled=cache_dir is not None))
+
+
+@benchmark("tables", "load precomputed")
+def _load_tables() -> Callable[[], object]:
+    from .tables import _Tables
+
+    return _Tables.load
+
+
+@benchmark("tables", "compute")
+def _compute_tables() -> Callable[[], object]:
+    from .tables import _Tables
+
+    return _Tables.compute
+
+
+@benchmark("ui", "render card face")
+def _render_card_face() -> Callable[[], object]:
+    art = _art_library()
+    card = _parse_hand("Q♥")[0]
+    return lambda: art._render_card_face(card)
+
+
+@benchmark("ui", "render card back")
+def _render_card_back() -> Callable[[], object]:
+    art = _art_library()
+    return art._render_card_back
+
+
+@benchmark("ui", "render background")
+def _render_background() -> Callable[[], object]:
+    art = _art_library()
+    return art._render_background
+
+
+@benchmark("ui", "build card atlas")
+def _build_atlas() -> Callable[[], object]:
+    art = _art_library()
+    from .atlas import CardAtlas
+    from .ui import CARD_SIZE
+
+    return lambda: CardAtlas(lambda card, selected: art._render_card_face(card, highlight=selected), CARD_SIZE).build()
+
+
+@benchmark("ui", "resample background 1280x720")
+def _resample_background() -> Callable[[], object]:
+    art = _art_library()
+    art.scaled_background_image((1920, 1080))  # render the base image once
+    return lambda: art.scaled_background_image((1280, 720))
+
+
+@benchmark("ui", "load background (cache warm)")
+def _load_background() -> Callable[[], object]:
+    import tempfile
+
+    art = _art_library(tempfile.mkdtemp(prefix="balatro-bench-"))
+    art.background_image()  # populate the cache
+    return art.background_image
+
+
+# -- start-up -----------------------------------------------------------------
+
+# Interpreter arguments of each measured command.
+STARTUP_COMMANDS: Dict[str, List[str]] = {
+    # What the ``balatro`` console script runs.
+    "balatro --help": ["-c", "import sys; sys.argv[1:] = ['--help']; from balatro.cli import main; main()"],
+    "import balatro.scoring": ["-c", "import balatro.scoring"],
+}
+# Milliseconds of imports beyond a bare interpreter; about three times what
+# a small cloud VM measures, so only real regressions trip them.
+STARTUP_BUDGETS_MS: Dict[str, float] = {
+    "balatro --help": 40.0,
+    "import balatro.scoring": 75.0,
+}
+
+
+@dataclass(frozen=True)
+class StartupResult:
+    name: str
+    import_ms: float  # median over runs
+    budget_ms: float | None
+    modules: Tuple[str, ...]  # imported beyond a bare interpreter, in import order
+    slowest: Tuple[Tuple[str, float], ...]  # top-level imports by cumulative milliseconds
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget_ms is not None and self.import_ms > self.budget_ms
+
+
+def _importtime(args: Sequence[str]) -> List[Tuple[int, str, int]]:
+    """``(depth, module, cumulative microseconds)`` for every import ``python args`` makes."""
+
+    env = dict(os.environ)
+    source_root = str(Path(__file__).resolve().parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [source_root, env.get("PYTHONPATH")]))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        env=env,
+        text=True,
+        check=True,
+    )
+    imports = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # the column header
+        stripped = name.lstrip(" ")
+        imports.append(((len(name) - len(stripped) - 1) // 2, stripped, int(cumulative)))
+    return imports
+
+
+def measure_startup(name: str, runs: int = 5) -> StartupResult:
+    """Import time of the start-up command ``name`` (a key of :data:`STARTUP_COMMANDS`)."""
+
+    if runs <= 0:
+        raise ValueError("runs must be positive")
+    baseline = {module for _, module, _ in _importtime(["-c", "pass"])}
+    _importtime(STARTUP_COMMANDS[name])  # warm the OS file cache (and bytecode, if writable)
+    totals = []
+    for _ in range(runs):
+        imports = [entry for entry in _importtime(STARTUP_COMMANDS[name]) if entry[1] not in baseline]
+        totals.append(sum(cumulative for depth, _, cumulative in imports if depth == 0) / 1000)
+    top = sorted(((module, us / 1000) for depth, module, us in imports if depth == 0), key=lambda item: -item[1])
+    return StartupResult(
+        name=name,
+        import_ms=statistics.median(totals),
+        budget_ms=STARTUP_BUDGETS_MS.get(name),
+        modules=tuple(module for _, module, _ in imports),
+        slowest=tuple(top[:5]),
+    )
+
+
+def format_startup(results: Sequence[StartupResult]) -> str:
+    lines = []
+    for result in results:
+        budget = f"budget {result.budget_ms:6.1f} ms" if result.budget_ms is not None else ""
+        flag = "  OVER BUDGET" if result.over_budget else ""
+        lines.append(f"{result.name:<40} {result.import_ms:7.1f} ms  {budget}{flag}")
+        lines.append("    " + ", ".join(f"{module} {ms:.1f}" for module, ms in result.slowest))
+    return "\n".join(lines)
+
+
+# -- command line -------------------------------------------------------------
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="balatro bench", description="Run and compare performance benchmarks.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run benchmarks and optionally save a JSON report")
+    run_parser.add_argument("-k", dest="patterns", action="append", default=[], help="only benchmarks containing this text")
+    run_parser.add_argument("--rounds", type=int, default=5)
+    run_parser.add_argument("--min-time", type=float, default=0.05, help="minimum seconds per round")
+    run_parser.add_argument("--out", help="write the JSON report to this file")
+    run_parser.add_argument("--compare", metavar="BASELINE", help="compare against a saved report")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    run_parser.add_argument("--list", action="store_true", help="list benchmark names and exit")
+
+    compare_parser = commands.add_parser("compare", help="compare two saved reports")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    startup_parser = commands.add_parser("startup", help="measure import time of short-lived commands")
+    startup_parser.add_argument("--runs", type=int, default=5)
+    startup_parser.add_argument("--check", action="store_true", help="exit with status 1 if a budget is exceeded")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "startup":
+        results = [measure_startup(name, args.runs) for name in STARTUP_COMMANDS]
+        print(format_startup(results))
+        return 1 if args.check and any(result.over_budget for result in results) else 0
+
+    if args.command == "compare":
+        comparisons = compare(load(args.baseline), load(args.current), args.threshold)
+        print(format_comparison(comparisons, args.threshold))
+        return 1 if any(item.regressed for item in comparisons) else 0
+
+    benchmarks = select(args.patterns)
+    if args.list:
+        for bench in benchmarks:
+            print(bench.full_name)
+        return 0
+    report = run_suite(benchmarks, args.rounds, args.min_time, progress=print)
+    for name, reason in report["skipped"].items():
+        print(f"{name:<40} skipped: {reason}")
+    if args.out:
+        save(report, args.out)
+    if args.compare:
+        comparisons = compare(load(args.compare), report, args.threshold)
+        print()
+        print(format_comparison(comparisons, args.threshold))
+        return 1 if any(item.regressed for item in comparisons) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
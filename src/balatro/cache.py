@@ -0,0 +1,198 @@
+"""Memoized hand evaluation keyed on a canonical, order-independent hand key.
+
+The category of five cards depends only on the multiset of their ranks and
+on whether they share a suit, so :func:`hand_key` packs the sorted ranks
+(4 bits each) plus a flush bit into a 21-bit integer. Card order and the
+actual suits are dropped: all 2,598,960 hands collapse onto 7,462 keys.
+
+:class:`EvaluationCache` keeps a bounded, thread-safe LRU map from key to
+:class:`~balatro.scoring.HandResult` with hit/miss statistics, computing
+misses with the reference evaluator. It is not meant to sit in front of the
+table engine (``engine="table"``): that engine resolves a hand in fewer
+operations than building its cache key takes, so it needs no memo.
+
+For process pools, :func:`precompute_table` builds a read-only ``bytes``
+table holding the category of every key; workers given the table (see
+:func:`init_worker`) answer every lookup from it without locking or
+evicting anything.
+
+Select the default cache as an evaluation engine with
+``scoring.set_engine("cached")``.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import combinations_with_replacement
+from typing import Callable, List, Sequence
+
+from .cards import RANK_SHIFT, RANKS, SUIT_MASK, Card, decode_cards
+from .scoring import HAND_RESULTS, HandResult, _evaluate_reference
+
+FLUSH_BIT = 1 << 20
+TABLE_SIZE = FLUSH_BIT << 1
+_UNSET = 0xFF
+
+
+def hand_key(codes: Sequence[int]) -> int:
+    """Canonical key of five compact card codes: sorted ranks plus a flush bit."""
+
+    c1, c2, c3, c4, c5 = codes
+    r1, r2, r3, r4, r5 = sorted((c1 >> RANK_SHIFT, c2 >> RANK_SHIFT, c3 >> RANK_SHIFT, c4 >> RANK_SHIFT, c5 >> RANK_SHIFT))
+    key = r1 << 16 | r2 << 12 | r3 << 8 | r4 << 4 | r5
+    suit = c1 & SUIT_MASK
+    if suit == c2 & SUIT_MASK == c3 & SUIT_MASK == c4 & SUIT_MASK == c5 & SUIT_MASK:
+        key |= FLUSH_BIT
+    return key
+
+
+def _representative(key: int) -> List[int]:
+    """Five card codes with the given key (used to evaluate a key on a miss)."""
+
+    ranks = [key >> shift & 0xF for shift in (16, 12, 8, 4, 0)]
+    if key & FLUSH_BIT:
+        return [rank << RANK_SHIFT for rank in ranks]
+    # Deal repeated ranks onto different suits and make sure two suits appear.
+    seen: dict = {}
+    codes = []
+    for rank in ranks:
+        suit = seen.get(rank, 0)
+        seen[rank] = suit + 1
+        codes.append(rank << RANK_SHIFT | suit)
+    if len({code & SUIT_MASK for code in codes}) == 1:
+        codes[-1] |= 1
+    return codes
+
+
+@lru_cache(maxsize=1)
+def precompute_table() -> bytes:
+    """Category id for every canonical key (``0xFF`` for impossible keys)."""
+
+    from .tables import classify_codes
+
+    table = bytearray([_UNSET]) * TABLE_SIZE
+    for ranks in combinations_with_replacement(range(len(RANKS)), 5):
+        if max(ranks.count(rank) for rank in ranks) > 4:
+            continue
+        key = ranks[0] << 16 | ranks[1] << 12 | ranks[2] << 8 | ranks[3] << 4 | ranks[4]
+        table[key] = classify_codes(_representative(key))
+        if len(set(ranks)) == 5:
+            table[key | FLUSH_BIT] = classify_codes(_representative(key | FLUSH_BIT))
+    return bytes(table)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class EvaluationCache:
+    """Bounded LRU cache of hand results keyed by :func:`hand_key`.
+
+    ``table`` (from :func:`precompute_table`) turns the cache into a read-only
+    lookup: every key is answered from it without taking the lock and counted
+    as a hit (exact in a single-threaded worker, approximate across threads).
+    """
+
+    def __init__(self, maxsize: int = 8192, table: bytes | None = None) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if table is not None and len(table) != TABLE_SIZE:
+            raise ValueError("table must come from precompute_table()")
+        self.maxsize = maxsize
+        self.table = table
+        self._entries: "OrderedDict[int, HandResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def evaluate(self, cards: Sequence[Card]) -> HandResult:
+        if len(cards) != 5:
+            raise ValueError("A hand must contain exactly 5 cards to score.")
+        return self.lookup(hand_key([card.code for card in cards]))
+
+    def evaluate_codes(self, codes: Sequence[int]) -> HandResult:
+        if len(codes) != 5:
+            raise ValueError("A hand must contain exactly 5 cards to score.")
+        return self.lookup(hand_key(codes))
+
+    def lookup(self, key: int) -> HandResult:
+        """Result for a canonical key, computing and storing it on a miss."""
+
+        if self.table is not None:
+            self._hits += 1
+            return HAND_RESULTS[self.table[key]]
+
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return result
+            self._misses += 1
+
+        result = _evaluate_reference(decode_cards(_representative(key)))
+        with self._lock:
+            self._entries[key] = result
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return result
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._entries), self.maxsize)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+_default: EvaluationCache | None = None
+_default_lock = threading.Lock()
+
+
+def default_cache() -> EvaluationCache:
+    """The process-wide cache behind the ``"cached"`` evaluation engine."""
+
+    global _default
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                _default = EvaluationCache()
+    return _default
+
+
+def install(cache: EvaluationCache | None = None) -> EvaluationCache:
+    """Make ``cache`` the default cache and select the ``"cached"`` engine."""
+
+    global _default
+    from .scoring import set_engine
+
+    if cache is not None:
+        _default = cache
+    set_engine("cached")
+    return default_cache()
+
+
+def init_worker(table: bytes) -> None:
+    """Process-pool initializer: evaluate through the shared read-only ``table``."""
+
+    install(EvaluationCache(table=table))
+
+
+def cached_evaluator() -> Callable[[List[Card]], HandResult]:
+    # Bound to whatever default cache is current when the engine is selected.
+    return default_cache().evaluate
@@ -1,43 +1,237 @@
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass
-from typing import Iterable, List
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
 
 SUITS = ["♠", "♥", "♦", "♣"]
 RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
 
+# Compact encoding: code = rank_index << RANK_SHIFT | suit_index, giving 0..51.
+RANK_SHIFT = 2
+SUIT_MASK = (1 << RANK_SHIFT) - 1
+DECK_SIZE = len(RANKS) * len(SUITS)
 
-@dataclass(frozen=True)
+
+def card_code(rank_index: int, suit_index: int) -> int:
+    return (rank_index << RANK_SHIFT) | suit_index
+
+
+def rank_index(code: int) -> int:
+    return code >> RANK_SHIFT
+
+
+def suit_index(code: int) -> int:
+    return code & SUIT_MASK
+
+
+@dataclass(frozen=True, slots=True, eq=False, init=False)
 class Card:
+    """A playing card.
+
+    Cards are interned: ``Card("A", "♠") is Card("A", "♠")``, so equality and
+    hashing fall back to identity and holding a card never allocates.
+    """
+
     rank: str
     suit: str
+    code: int = field(repr=False)
+
+    def __new__(cls, rank: str, suit: str) -> "Card":
+        try:
+            return _INTERNED[rank, suit]
+        except KeyError:
+            raise ValueError(f"Unknown card: {rank}{suit}") from None
+
+    @staticmethod
+    def from_code(code: int) -> "Card":
+        return CARDS[code]
+
+    def __reduce__(self) -> Tuple[object, Tuple[int]]:
+        # Unpickling goes through the intern table so identity survives process pools.
+        return (Card.from_code, (self.code,))
 
     def __str__(self) -> str:  # pragma: no cover - trivial formatting
         return f"{self.rank}{self.suit}"
 
 
+def _make_card(rank: str, suit: str, code: int) -> Card:
+    card = object.__new__(Card)
+    object.__setattr__(card, "rank", rank)
+    object.__setattr__(card, "suit", suit)
+    object.__setattr__(card, "code", code)
+    return card
+
+
+CARDS: Tuple[Card, ...] = tuple(
+    _make_card(RANKS[code >> RANK_SHIFT], SUITS[code & SUIT_MASK], code) for code in range(DECK_SIZE)
+)
+_INTERNED: Dict[Tuple[str, str], Card] = {(card.rank, card.suit): card for card in CARDS}
+
+
+def encode_cards(cards: Iterable[Card]) -> List[int]:
+    return [card.code for card in cards]
+
+
+def decode_cards(codes: Iterable[int]) -> List[Card]:
+    return [CARDS[code] for code in codes]
+
+
 class Deck:
-    def __init__(self, rng: random.Random | None = None) -> None:
+    """A deck dealt from a fixed buffer with a draw cursor.
+
+    Cards before the cursor have been dealt; :meth:`draw` only advances it,
+    so nothing is copied except the returned cards. Shuffling is lazy: it
+    just marks the undealt cards as unordered, and each draw then performs
+    one Fisher-Yates step per card, swapping the slot under the cursor with
+    slot ``cursor + int(rng.random() * (size - cursor))``. Only dealt
+    positions are ever shuffled.
+
+    ``cards`` replaces the standard 52 (repeats allowed, e.g. two decks).
+    With a seeded ``random.Random`` the deal is reproducible: starting from
+    the initial card order (at construction and after :meth:`reset`), the
+    same seed and the same sequence of calls deal the same cards. Seeded
+    decks deal different sequences than an eager ``rng.shuffle`` would.
+    """
+
+    # Class-level defaults let subclasses that only provide ``_cards`` deal in order.
+    _cursor = 0
+    _lazy = False
+    _initial: Tuple[Card, ...] | None = None
+    # False while the buffer / generator may be shared with a clone (copy-on-write).
+    _owns_cards = True
+    _owns_rng = True
+
+    def __init__(self, rng: random.Random | None = None, cards: Iterable[Card] | None = None) -> None:
         self._rng = rng or random.Random()
-        self._cards: List[Card] = [Card(rank, suit) for suit in SUITS for rank in RANKS]
+        self._initial = CARDS if cards is None else tuple(cards)
+        self._cards: List[Card] = list(self._initial)
+        self._cursor = 0
         self.shuffle()
 
+    def load(self, cards: Iterable[Card]) -> None:
+        """Replace the deck's cards (e.g. several standard decks) and reset it."""
+
+        self._initial = tuple(cards)
+        self._cards = list(self._initial)
+        self._owns_cards = True
+        self.reset()
+
     def shuffle(self) -> None:
-        self._rng.shuffle(self._cards)
+        self._lazy = True
+
+    def reset(self, seed: int | None = None) -> None:
+        """Return every card to the deck for a new game, reusing the buffer.
+
+        ``seed`` re-seeds the deck's random generator first, which makes the
+        next deal identical to that of ``Deck(random.Random(seed))``.
+        """
+
+        if seed is not None:
+            self._own_rng()
+            self._rng.seed(seed)
+        if self._initial is not None:
+            if self._owns_cards:
+                self._cards[:] = self._initial
+            else:
+                self._cards = list(self._initial)
+                self._owns_cards = True
+        self._cursor = 0
+        self.shuffle()
 
     def draw(self, count: int) -> List[Card]:
         if count < 0:
             raise ValueError("count must be non-negative")
-        if count > len(self._cards):
+        cards = self._cards
+        start = self._cursor
+        end = start + count
+        if end > len(cards):
             raise ValueError("Not enough cards left in the deck")
-        drawn, self._cards = self._cards[:count], self._cards[count:]
-        return drawn
+        if self._lazy:
+            if not self._owns_cards:
+                cards = self._own_cards()
+            if not self._owns_rng:
+                self._own_rng()
+            uniform = self._rng.random
+            size = len(cards)
+            for i in range(start, end):
+                j = i + int(uniform() * (size - i))
+                cards[i], cards[j] = cards[j], cards[i]
+        self._cursor = end
+        return cards[start:end]
+
+    def draw_codes(self, count: int) -> List[int]:
+        """Like :meth:`draw` but return compact card codes."""
+
+        return encode_cards(self.draw(count))
 
     def remaining(self) -> int:
-        return len(self._cards)
+        return len(self._cards) - self._cursor
+
+    def remaining_cards(self) -> List[Card]:
+        """Return the undrawn cards; their order carries no meaning for callers."""
+
+        return self._cards[self._cursor :]
 
     def take_back(self, cards: Iterable[Card]) -> None:
-        # Put cards back on the bottom of the deck and reshuffle to simplify reuse.
-        self._cards.extend(cards)
+        # Swap returned cards to just before the cursor and step it back; cards
+        # this deck never dealt are appended. Then reshuffle the undealt part.
+        buffer = self._own_cards()
+        for card in cards:
+            try:
+                position = buffer.index(card, 0, self._cursor)
+            except ValueError:
+                buffer.append(card)
+                continue
+            self._cursor -= 1
+            buffer[position], buffer[self._cursor] = buffer[self._cursor], buffer[position]
         self.shuffle()
+
+    def clone(self) -> "Deck":
+        """Return an independent copy of this deck.
+
+        The clone shares the card buffer and random generator with this deck;
+        whichever side first changes one of them copies it (copy-on-write), so
+        cloning costs a handful of attribute copies.
+        """
+
+        twin = object.__new__(type(self))
+        twin.__dict__.update(self.__dict__)
+        self._owns_cards = twin._owns_cards = False
+        self._owns_rng = twin._owns_rng = False
+        return twin
+
+    def get_state(self) -> Tuple[bytes, int, bool, object]:
+        """Return ``(buffer codes, cursor, shuffled, rng state)`` for :meth:`set_state`."""
+
+        rng = self.__dict__.get("_rng")
+        return (
+            bytes([card.code for card in self._cards]),
+            self._cursor,
+            self._lazy,
+            rng.getstate() if rng is not None else None,
+        )
+
+    def set_state(self, state: Tuple[bytes, int, bool, object]) -> None:
+        codes, cursor, lazy, rng_state = state
+        self._cards = [CARDS[code] for code in codes]
+        self._owns_cards = True
+        self._cursor = cursor
+        self._lazy = lazy
+        if rng_state is not None:
+            self._own_rng(keep_state=False)
+            self._rng.setstate(rng_state)
+
+    def _own_cards(self) -> List[Card]:
+        if not self._owns_cards:
+            self._cards = list(self._cards)
+            self._owns_cards = True
+        return self._cards
+
+    def _own_rng(self, keep_state: bool = True) -> None:
+        if not self._owns_rng:
+            rng = random.Random.__new__(type(self._rng))
+            if keep_state:
+                rng.setstate(self._rng.getstate())
+            self._rng = rng
+            self._owns_rng = True
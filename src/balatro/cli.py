@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import sys
-from typing import List
+from typing import TYPE_CHECKING, List
 
-from .game import SimpleGame
+if TYPE_CHECKING:  # pragma: no cover
+    from .game import SimpleGame
 
 
 def _launch_ui() -> None:
@@ -23,7 +24,25 @@ def _launch_ui() -> None:
     BalatroUI(root)
     root.mainloop()
 
-WELCOME = """欢迎来到简化版 Balatro！\n- 如果想直接看到图形界面，请运行：balatro --ui\n- 牌组只有标准扑克牌，没有小丑/星球/塔罗。\n- 每轮从 8 张手牌中选择 5 张打出，系统会计算得分。\n- 你可以弃牌来刷新手牌。出牌和弃牌在一局内各最多 5 次。\n- 使用指令：\n    p 0 1 2 3 4  出牌\n    d 0 1 2      弃牌\n    q             退出游戏\n"""
+WELCOME = """欢迎来到简化版 Balatro！\n- 如果想直接看到图形界面，请运行：balatro --ui\n- 牌组只有标准扑克牌，没有小丑/星球/塔罗。\n- 每轮从 8 张手牌中选择 5 张打出，系统会计算得分。\n- 你可以弃牌来刷新手牌。出牌和弃牌在一局内各最多 5 次。\n- 使用指令：\n    p 0 1 2 3 4  出牌\n    d 0 1 2      弃牌\n    h             提示最佳出牌\n    o [0 1 2]     查看弃掉这些牌后各牌型的概率（不带索引则为牌堆发 5 张）\n    q             退出游戏\n"""
+
+
+USAGE = """用法：balatro [--profile | --profile-out 文件] [命令]
+
+不带命令时在终端中开始一局游戏。
+
+命令：
+  --ui, ui              启动图形界面
+  --record 文件          开始一局并把每一步写入回放文件
+  replay 文件...         校验并汇总回放文件
+  sim, simulate         批量模拟对局（balatro sim --help 查看参数）
+  sweep                 规则参数扫描（balatro sweep --help 查看参数）
+  serve                 启动对局服务器
+  loadtest              对服务器进行压测
+  stats 数据库 [策略]     查看历史数据与排行榜
+  bench                 运行性能基准（balatro bench --help 查看参数）
+  -h, --help            显示本帮助
+"""
 
 
 def parse_indices(raw: str) -> List[int]:
@@ -33,12 +52,117 @@ def parse_indices(raw: str) -> List[int]:
         raise ValueError("请输入以空格分隔的数字索引，例如：0 1 2 3 4") from exc
 
 
+def _pop_profile_options(argv: List[str]) -> tuple[bool, str | None]:
+    """Remove ``--profile`` and ``--profile-out FILE`` from ``argv``."""
+
+    enabled = False
+    path = None
+    while argv and argv[0] in {"--profile", "--profile-out"}:
+        option = argv.pop(0)
+        enabled = True
+        if option == "--profile-out":
+            if not argv:
+                raise SystemExit("--profile-out 需要一个文件路径")
+            path = argv.pop(0)
+    return enabled, path
+
+
 def main() -> None:  # pragma: no cover - exercised via manual play
+    args = sys.argv[1:]
+    profile, profile_out = _pop_profile_options(args)
+    sys.argv[1:] = args
+    if not profile:
+        _main()
+        return
+
+    from .instrument import profile_session
+
+    with profile_session(profile_out, out=lambda line: print(line, file=sys.stderr)):
+        _main()
+
+
+def _main() -> None:  # pragma: no cover - exercised via manual play
+    if len(sys.argv) > 1 and sys.argv[1] in {"-h", "--help", "help"}:
+        print(USAGE, end="")
+        return
+
     if len(sys.argv) > 1 and sys.argv[1] in {"--ui", "ui"}:
         _launch_ui()
         return
 
-    game = SimpleGame()
+    if len(sys.argv) > 1 and sys.argv[1] in {"sim", "simulate"}:
+        from .simulate import main as simulate_main
+
+        simulate_main(sys.argv[2:])
+        return
+
+    if len(sys.argv) > 1 and sys.argv[1] in {"serve", "loadtest"}:
+        from .server import loadtest_main
+        from .server import main as serve_main
+
+        (serve_main if sys.argv[1] == "serve" else loadtest_main)(sys.argv[2:])
+        return
+
+    if len(sys.argv) > 1 and sys.argv[1] == "sweep":
+        from .sweep import main as sweep_main
+
+        sweep_main(sys.argv[2:])
+        return
+
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        from .bench import main as bench_main
+
+        sys.exit(bench_main(sys.argv[2:]))
+
+    if len(sys.argv) > 1 and sys.argv[1] == "stats":
+        _stats(sys.argv[2:])
+        return
+
+    if len(sys.argv) > 1 and sys.argv[1] == "replay":
+        _replay(sys.argv[2:])
+        return
+
+    recorder = None
+    if len(sys.argv) > 2 and sys.argv[1] == "--record":
+        from .replay import RecordedGame, ReplayWriter
+
+        recorder = ReplayWriter(sys.argv[2])
+        game = RecordedGame(recorder)
+    else:
+        from .game import SimpleGame
+
+        game = SimpleGame()
+    try:
+        _play(game)
+    finally:
+        if recorder is not None:
+            game.finish()
+            recorder.close()
+
+
+def _replay(paths: List[str]) -> None:  # pragma: no cover - thin CLI wrapper
+    from .replay import ReplayError, replay, summarize
+
+    for path in paths:
+        try:
+            games = replay(path)
+        except ReplayError as exc:
+            print(f"❌ {path}：回放校验失败：{exc}")
+            sys.exit(1)
+        summary = summarize(path)
+        print(f"{path}：{games} 局校验通过，共出牌 {summary.hands} 次，总分 {summary.total_score}")
+
+
+def _stats(args: List[str]) -> None:  # pragma: no cover - thin CLI wrapper
+    from .store import GameStore, format_stats
+
+    if not args:
+        raise SystemExit("用法：balatro stats GAMES.db [策略名]")
+    with GameStore(args[0]) as store:
+        print(format_stats(store, policy=args[1] if len(args) > 1 else None))
+
+
+def _play(game: "SimpleGame") -> None:  # pragma: no cover - exercised via manual play
     game.start()
 
     print(WELCOME)
@@ -49,9 +173,9 @@ def main() -> None:  # pragma: no cover - exercised via manual play
             f"剩余出牌：{game.plays_remaining}/{game.max_plays}，剩余弃牌：{game.discards_remaining}/{game.max_discards}"
         )
 
-        raw = input("输入指令（p 出牌 / d 弃牌 / q 退出）：").strip()
+        raw = input("输入指令（p 出牌 / d 弃牌 / h 提示 / q 退出）：").strip()
         if raw.lower() in {"q", "quit", "exit"}:
-            sys.exit(0)
+            return
 
         try:
             parts = raw.split()
@@ -59,6 +183,21 @@ def main() -> None:  # pragma: no cover - exercised via manual play
                 raise ValueError("请输入有效的指令。")
 
             command, *rest = parts
+            if command.lower() in {"h", "hint"}:
+                play = game.best_play()
+                print(f"提示：打出 {' '.join(map(str, play.indices))}，牌型：{play.result.name}，总分：{play.result.total}")
+                draws = game.reachable_categories() - game.available_categories()
+                if draws:
+                    print(f"弃牌后仍有机会凑成：{'、'.join(sorted(draws))}")
+                print()
+                continue
+            if command.lower() in {"o", "odds"}:
+                from .odds import format_odds, game_odds
+
+                odds = game_odds(game, parse_indices(" ".join(rest)) if rest else None)
+                print("\n".join(format_odds(odds)))
+                print(f"期望得分：{odds.expected_total:.1f}\n")
+                continue
             if command.lower() in {"d", "discard"}:
                 indices = parse_indices(" ".join(rest))
                 game.discard_cards(indices)
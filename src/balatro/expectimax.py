@@ -0,0 +1,264 @@
+"""Exact expected-score optimizer for the endgame of a :class:`SimpleGame`.
+
+The value of a state (hand, undrawn cards, plays and discards left) is the
+expected total of all remaining plays under optimal decisions: the maximum
+over every legal play or discard of its immediate score plus the average
+value over every possible redraw. Redraws are enumerated combinatorially
+and collapsed before recursing:
+
+* States are keyed by their per-suit rank masks with the suits sorted, so
+  states that differ only by a relabelling of suits share one entry.
+* Ranks that are present but no straight can be completed through (some
+  rank of every straight containing them is gone from the hand and the
+  deck) only matter through their counts, so they are shuffled among their
+  own positions in order of how many copies are held and left. The set of
+  present ranks - and with it every straight still possible - is left
+  unchanged, so states of different value are never merged. States that
+  differ by a permutation of such ranks usually share an entry; ties keep
+  their rank order, so the key is not fully canonical.
+* Redraws leading to the same canonical state are merged and weighted by
+  their multiplicity instead of being expanded one by one.
+
+Subresults live in a bounded LRU cache. The search is exponential in the
+deck size and intended for the last few draws of a round; :attr:`stats`
+shows how the work grows as the deck gets larger.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import combinations
+from math import comb
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple
+
+from .cards import RANK_SHIFT, RANKS, SUIT_MASK, SUITS, Card
+from .scoring import HAND_RESULTS
+from .solver import best_play_codes
+from .tables import STRAIGHT_MASKS, classify_codes
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .game import SimpleGame
+
+StateKey = Tuple[Tuple[Tuple[int, int], ...], int, int]
+
+
+@dataclass(frozen=True)
+class DiscardValue:
+    """Exact expected remaining score if ``discard`` (hand indices) is discarded now.
+
+    ``discard == ()`` is the value of not discarding, i.e. playing optimally.
+    """
+
+    discard: Tuple[int, ...]
+    expected: float
+
+
+@dataclass
+class SolverStats:
+    nodes: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@lru_cache(maxsize=None)
+def _dead_ranks(present: int) -> Tuple[int, ...]:
+    """Ranks of ``present`` in no straight that can still be completed from it."""
+
+    live = 0
+    for mask in STRAIGHT_MASKS:
+        if present & mask == mask:
+            live |= mask
+    dead = present & ~live
+    return tuple(rank for rank in range(len(RANKS)) if dead >> rank & 1)
+
+
+def _canonical(hand: Sequence[int], deck: Sequence[int]) -> Tuple[Tuple[int, int], ...]:
+    # Copies held (high nibble) and left in the deck (low nibble) of each rank.
+    counts = [0] * len(RANKS)
+    present = 0
+    for code in hand:
+        rank = code >> RANK_SHIFT
+        counts[rank] += 16
+        present |= 1 << rank
+    for code in deck:
+        rank = code >> RANK_SHIFT
+        counts[rank] += 1
+        present |= 1 << rank
+    dead = _dead_ranks(present)
+    order = sorted(dead, key=counts.__getitem__)
+
+    hand_masks = [0] * len(SUITS)
+    deck_masks = [0] * len(SUITS)
+    if order == list(dead):
+        for code in hand:
+            hand_masks[code & SUIT_MASK] |= 1 << (code >> RANK_SHIFT)
+        for code in deck:
+            deck_masks[code & SUIT_MASK] |= 1 << (code >> RANK_SHIFT)
+    else:
+        relabel = list(range(len(RANKS)))
+        for target, rank in zip(dead, order):
+            relabel[rank] = target
+        for code in hand:
+            hand_masks[code & SUIT_MASK] |= 1 << relabel[code >> RANK_SHIFT]
+        for code in deck:
+            deck_masks[code & SUIT_MASK] |= 1 << relabel[code >> RANK_SHIFT]
+    return tuple(sorted(zip(hand_masks, deck_masks)))
+
+
+class ExpectimaxSolver:
+    """Exact optimizer; reuse one instance to share its cache across queries."""
+
+    def __init__(self, hand_size: int = 8, max_discard: int = 5, cache_size: int = 200_000) -> None:
+        if cache_size <= 0:
+            raise ValueError("cache_size must be positive")
+        self.hand_size = hand_size
+        self.max_discard = max_discard
+        self.cache_size = cache_size
+        self.stats = SolverStats()
+        self._cache: "OrderedDict[StateKey, float]" = OrderedDict()
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.stats = SolverStats()
+
+    def value(self, hand: Sequence[Card], deck: Sequence[Card], plays: int, discards: int) -> float:
+        """Exact expected total of the remaining plays under optimal decisions."""
+
+        return self._value(
+            tuple(card.code for card in hand), tuple(card.code for card in deck), plays, discards
+        )
+
+    def discard_values(
+        self, hand: Sequence[Card], deck: Sequence[Card], plays: int, discards: int
+    ) -> List[DiscardValue]:
+        """Exact value of each discard option (plus ``()`` for none), best first."""
+
+        hand_codes = tuple(card.code for card in hand)
+        deck_codes = tuple(card.code for card in deck)
+        options = [DiscardValue((), self._best_play_value(hand_codes, deck_codes, plays, discards))]
+        if discards > 0 and plays > 0:
+            for size in range(1, min(self.max_discard, len(hand_codes)) + 1):
+                for discard in combinations(range(len(hand_codes)), size):
+                    kept = tuple(code for i, code in enumerate(hand_codes) if i not in discard)
+                    expected = self._expected_after_draw(kept, deck_codes, plays, discards - 1)
+                    options.append(DiscardValue(discard, expected))
+        options.sort(key=lambda option: (-option.expected, len(option.discard)))
+        return options
+
+    def _lookup(self, key: StateKey) -> float | None:
+        cached = self._cache.get(key)
+        if cached is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+            self._cache.move_to_end(key)
+        return cached
+
+    def _store(self, key: StateKey, value: float) -> None:
+        self._cache[key] = value
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _value(
+        self,
+        hand: Tuple[int, ...],
+        deck: Tuple[int, ...],
+        plays: int,
+        discards: int,
+        canonical: Tuple[Tuple[int, int], ...] | None = None,
+    ) -> float:
+        if plays <= 0 or len(hand) < 5:
+            return 0.0
+        if plays == 1 and discards == 0:
+            return float(best_play_codes(hand).result.total)
+
+        key = (canonical or _canonical(hand, deck), plays, discards)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        self.stats.nodes += 1
+
+        best = self._best_play_value(hand, deck, plays, discards)
+        if discards > 0:
+            for size in range(1, min(self.max_discard, len(hand)) + 1):
+                for discard in combinations(range(len(hand)), size):
+                    kept = tuple(code for i, code in enumerate(hand) if i not in discard)
+                    best = max(best, self._expected_after_draw(kept, deck, plays, discards - 1))
+
+        self._store(key, best)
+        return best
+
+    def _best_play_value(self, hand: Tuple[int, ...], deck: Tuple[int, ...], plays: int, discards: int) -> float:
+        if plays <= 0 or len(hand) < 5:
+            return 0.0
+        if plays == 1:
+            return float(best_play_codes(hand).result.total)
+        best = 0.0
+        for played in combinations(range(len(hand)), 5):
+            score = HAND_RESULTS[classify_codes([hand[i] for i in played])].total
+            kept = tuple(code for i, code in enumerate(hand) if i not in played)
+            best = max(best, score + self._expected_after_draw(kept, deck, plays - 1, discards))
+        return best
+
+    def _expected_after_draw(self, kept: Tuple[int, ...], deck: Tuple[int, ...], plays: int, discards: int) -> float:
+        """Average value over every way of refilling ``kept`` from ``deck``."""
+
+        if plays <= 0:
+            return 0.0
+        draw = min(self.hand_size - len(kept), len(deck))
+        if draw <= 0:
+            return self._value(kept, deck, plays, discards)
+
+        # Pre-draw states are cached too (flagged by negative plays) since many
+        # discard and play options leave the same kept cards up to suit relabelling.
+        key = (_canonical(kept, deck), -plays, discards)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        self.stats.nodes += 1
+
+        if plays == 1 and discards == 0:
+            # Every redraw is terminal: score it directly, merging would cost more than it saves.
+            if len(kept) + draw < 5:
+                expected = 0.0
+            else:
+                total = sum(best_play_codes(kept + drawn).result.total for drawn in combinations(deck, draw))
+                expected = total / comb(len(deck), draw)
+            self._store(key, expected)
+            return expected
+
+        # Merge redraws that lead to the same canonical state before recursing.
+        outcomes: Dict[Tuple[Tuple[int, int], ...], Tuple[Tuple[int, ...], Tuple[int, ...]]] = {}
+        weights: Counter = Counter()
+        for drawn in combinations(range(len(deck)), draw):
+            hand = kept + tuple(deck[i] for i in drawn)
+            rest = tuple(code for i, code in enumerate(deck) if i not in drawn)
+            canonical = _canonical(hand, rest)
+            weights[canonical] += 1
+            if canonical not in outcomes:
+                outcomes[canonical] = (hand, rest)
+
+        total = 0.0
+        for canonical, (hand, rest) in outcomes.items():
+            total += weights[canonical] * self._value(hand, rest, plays, discards, canonical)
+        expected = total / comb(len(deck), draw)
+        self._store(key, expected)
+        return expected
+
+
+def solve(game: "SimpleGame", solver: ExpectimaxSolver | None = None) -> List[DiscardValue]:
+    """Exact discard values for the current state of ``game``."""
+
+    solver = solver or ExpectimaxSolver(hand_size=game.hand_size)
+    return solver.discard_values(
+        game.hand, game.deck.remaining_cards(), game.plays_remaining, game.discards_remaining
+    )
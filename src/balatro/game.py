@@ -1,10 +1,25 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import TYPE_CHECKING, List, Set, Tuple
 
-from .cards import Card, Deck
+from .analysis import CardCounts
+from .cards import CARDS, Card, Deck, encode_cards
 from .scoring import HandResult, evaluate_hand
+from .solver import Play, best_play
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .rules import Rules
+
+
+@dataclass(frozen=True)
+class GameSnapshot:
+    """Immutable, hashable copy of a game's mutable state (see ``SimpleGame.snapshot``)."""
+
+    hand: bytes  # compact card codes
+    deck: Tuple[bytes, int, bool, object]  # Deck.get_state()
+    plays_remaining: int
+    discards_remaining: int
 
 
 @dataclass
@@ -13,21 +28,112 @@ class SimpleGame:
     hand: List[Card] = field(default_factory=list)
     max_plays: int = 5
     max_discards: int = 5
+    track_deck: bool = False
+    hand_size: int = 8
+    # Custom scoring and limits; when set they override max_plays, max_discards,
+    # hand_size and the deck's cards.
+    rules: "Rules | None" = None
     plays_remaining: int = field(init=False)
     discards_remaining: int = field(init=False)
+    # Hand (and deck) counts; built on first use, then updated per action while
+    # ``_counted_hand`` is still the live hand list.
+    _counts: CardCounts | None = field(init=False, repr=False, compare=False, default=None)
+    _counted_hand: List[Card] | None = field(init=False, repr=False, compare=False, default=None)
+    _deck_counts: CardCounts | None = field(init=False, repr=False, compare=False, default=None)
 
     def __post_init__(self) -> None:
+        if self.rules is not None:
+            self.max_plays = self.rules.max_plays
+            self.max_discards = self.rules.max_discards
+            self.hand_size = self.rules.hand_size
+            if self.rules.decks != 1:
+                self.deck.load(self.rules.deck_cards())
         self.plays_remaining = self.max_plays
         self.discards_remaining = self.max_discards
 
     def start(self) -> None:
         """Reset the deck and draw a fresh set of cards."""
-        # Reuse existing deck (handy for deterministic tests) but always reshuffle.
-        self.deck.shuffle()
-        self.hand = self.deck.draw(8)
+        # Reuse existing deck (handy for deterministic tests): reset() returns every
+        # card to it and reshuffles without rebuilding the cards.
+        self.deck.reset()
+        self.hand = self.deck.draw(self.hand_size)
         self.plays_remaining = self.max_plays
         self.discards_remaining = self.max_discards
 
+    def snapshot(self) -> GameSnapshot:
+        return GameSnapshot(
+            bytes([card.code for card in self.hand]),
+            self.deck.get_state(),
+            self.plays_remaining,
+            self.discards_remaining,
+        )
+
+    def restore(self, snapshot: GameSnapshot) -> None:
+        self.hand = [CARDS[code] for code in snapshot.hand]
+        self.deck.set_state(snapshot.deck)
+        self.plays_remaining = snapshot.plays_remaining
+        self.discards_remaining = snapshot.discards_remaining
+
+    def clone(self) -> "SimpleGame":
+        """Return an independent game in the same state; the deck is copied on write."""
+        twin = object.__new__(type(self))
+        twin.__dict__.update(self.__dict__)
+        twin.deck = self.deck.clone()
+        twin.hand = list(self.hand)
+        if self._counts is not None and self._counted_hand is self.hand:
+            twin._counts = self._counts.copy()
+            twin._counted_hand = twin.hand
+            if self._deck_counts is not None:
+                twin._deck_counts = self._deck_counts.copy()
+        return twin
+
+    @property
+    def counts(self) -> CardCounts:
+        """Rank/suit histograms and straight windows of the hand.
+
+        Built on first access after a deal, then kept up to date as cards are
+        played, discarded and drawn, so games that never ask pay nothing.
+        """
+        if self._counts is None or self._counted_hand is not self.hand:
+            self._recount()
+        return self._counts
+
+    @property
+    def deck_counts(self) -> CardCounts:
+        """Counts of the undrawn cards; maintained incrementally when ``track_deck`` is set."""
+        if not self.track_deck:
+            return CardCounts(card.code for card in self.deck.remaining_cards())
+        if self._deck_counts is None or self._counted_hand is not self.hand:
+            self._recount()
+        return self._deck_counts
+
+    def available_categories(self) -> Set[str]:
+        """Categories some five cards of the current hand make."""
+        return self.counts.categories()
+
+    def reachable_categories(self, draws: int | None = None) -> Set[str]:
+        """Categories still reachable by drawing ``draws`` cards (default: a full discard)."""
+        if draws is None:
+            draws = min(5, len(self.hand)) if self.discards_remaining > 0 else 0
+        return self.counts.reachable(self.deck_counts, draws)
+
+    def _recount(self) -> None:
+        self._counts = CardCounts(card.code for card in self.hand)
+        self._counted_hand = self.hand
+        self._deck_counts = (
+            CardCounts(card.code for card in self.deck.remaining_cards()) if self.track_deck else None
+        )
+
+    def hand_codes(self) -> List[int]:
+        """Return the current hand as compact card codes."""
+        return encode_cards(self.hand)
+
+    def best_play(self) -> Play:
+        """Return the indices of the highest-scoring 5 cards in the hand and their score."""
+        if not self.hand:
+            raise ValueError("Game has not been started. Call start() first.")
+        return best_play(self.hand, self.rules)
+
     def play_cards(self, indices: List[int]) -> HandResult:
         if not self.hand:
             raise ValueError("Game has not been started. Call start() first.")
@@ -46,16 +152,11 @@ class SimpleGame:
         except IndexError as exc:  # pragma: no cover - safety net
             raise ValueError("Selected indices are out of range for the current hand.") from exc
 
-        result = evaluate_hand(cards)
+        result = evaluate_hand(cards) if self.rules is None else self.rules.compile().evaluate(cards)
 
         # Remove played cards and replenish hand if possible.
-        for index in sorted(indices, reverse=True):
-            del self.hand[index]
-        needed = max(0, 8 - len(self.hand))
-        if needed:
-            draw_count = min(needed, self.deck.remaining())
-            if draw_count:
-                self.hand.extend(self.deck.draw(draw_count))
+        self._remove(indices)
+        self._refill()
 
         self.plays_remaining -= 1
 
@@ -80,13 +181,29 @@ class SimpleGame:
         except IndexError as exc:  # pragma: no cover - safety net
             raise ValueError("Selected indices are out of range for the current hand.") from exc
 
+        self._remove(indices)
+        self._refill()
+
+        self.discards_remaining -= 1
+
+    def _remove(self, indices: List[int]) -> None:
+        counts = self._counts if self._counted_hand is self.hand else None
         for index in sorted(indices, reverse=True):
+            if counts is not None:
+                counts.remove(self.hand[index].code)
             del self.hand[index]
 
-        needed = max(0, 8 - len(self.hand))
+    def _refill(self) -> None:
+        """Draw back up to ``hand_size`` cards, or as many as the deck still holds."""
+        needed = max(0, self.hand_size - len(self.hand))
         if needed:
             draw_count = min(needed, self.deck.remaining())
             if draw_count:
-                self.hand.extend(self.deck.draw(draw_count))
-
-        self.discards_remaining -= 1
+                drawn = self.deck.draw(draw_count)
+                self.hand.extend(drawn)
+                if self._counted_hand is self.hand:
+                    counts, deck_counts = self._counts, self._deck_counts
+                    for card in drawn:
+                        counts.add(card.code)
+                        if deck_counts is not None:
+                            deck_counts.remove(card.code)
@@ -0,0 +1,168 @@
+"""Opt-in call counting and timing for the game's hot paths.
+
+Instrumentation works by swapping timing wrappers in for the instrumented
+functions while it is enabled and putting the originals back when it is
+disabled, so the disabled state costs nothing: no flag checks are left on
+any call path. The instrumented points are:
+
+* ``evaluate_hand`` - hand classification and scoring
+* ``Deck.draw``     - dealing cards
+* ``refill``        - ``SimpleGame._refill``, the hand top-up after a play or discard
+* ``policy:<name>`` - each policy in :data:`balatro.simulate.POLICIES`
+
+Timings are inclusive (``refill`` contains its ``Deck.draw`` calls) and only
+cover the current process; simulations run with ``--workers`` are not seen.
+
+Usage::
+
+    with instrument.instrumented():
+        simulate.run(1000, simulate.POLICIES["greedy"])
+    print(instrument.format_report(instrument.snapshot()))
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+_counters: Dict[str, List[int]] = {}  # name -> [calls, nanoseconds]
+_patched: List[Tuple[Any, str, Any]] = []  # (owner, attribute, original)
+
+
+@dataclass(frozen=True)
+class FunctionStats:
+    name: str
+    calls: int
+    seconds: float
+
+    @property
+    def mean(self) -> float:
+        return self.seconds / self.calls if self.calls else 0.0
+
+
+def _timed(name: str, func: Callable) -> Callable:
+    counter = _counters.setdefault(name, [0, 0])
+    clock = time.perf_counter_ns
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        started = clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            counter[0] += 1
+            counter[1] += clock() - started
+
+    return wrapper
+
+
+def _patch(owner: Any, attribute: str, name: str) -> None:
+    original = owner[attribute] if isinstance(owner, dict) else getattr(owner, attribute)
+    wrapper = _timed(name, original)
+    if isinstance(owner, dict):
+        owner[attribute] = wrapper
+    else:
+        setattr(owner, attribute, wrapper)
+    _patched.append((owner, attribute, original))
+
+
+def is_enabled() -> bool:
+    return bool(_patched)
+
+
+def enable() -> None:
+    """Install the timing wrappers; a no-op if they are already installed."""
+
+    if _patched:
+        return
+    from . import game, scoring, simulate
+    from .cards import Deck
+
+    package = importlib.import_module(__package__)
+    # evaluate_hand is imported by name, so wrap every module-level reference.
+    for owner in (scoring, game, package):
+        if "evaluate_hand" in vars(owner):
+            _patch(owner, "evaluate_hand", "evaluate_hand")
+    _patch(Deck, "draw", "Deck.draw")
+    _patch(game.SimpleGame, "_refill", "refill")
+    for policy_name in list(simulate.POLICIES):
+        _patch(simulate.POLICIES, policy_name, f"policy:{policy_name}")
+
+
+def disable() -> None:
+    """Restore the original functions; collected counts are kept."""
+
+    while _patched:
+        owner, attribute, original = _patched.pop()
+        if isinstance(owner, dict):
+            owner[attribute] = original
+        else:
+            setattr(owner, attribute, original)
+
+
+def reset() -> None:
+    """Zero all counters (wrappers keep their counter objects)."""
+
+    for counter in _counters.values():
+        counter[0] = counter[1] = 0
+
+
+def snapshot() -> Dict[str, FunctionStats]:
+    """Current counts and accumulated time per instrumented function."""
+
+    return {
+        name: FunctionStats(name, calls, nanoseconds / 1e9)
+        for name, (calls, nanoseconds) in _counters.items()
+        if calls
+    }
+
+
+@contextmanager
+def instrumented(clear: bool = True) -> Iterator[None]:
+    """Enable instrumentation for the duration of a ``with`` block."""
+
+    if clear:
+        reset()
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+
+
+def format_report(stats: Dict[str, FunctionStats]) -> str:
+    lines = [f"{'function':<20} {'calls':>10} {'total s':>10} {'mean us':>10}"]
+    for item in sorted(stats.values(), key=lambda item: -item.seconds):
+        lines.append(f"{item.name:<20} {item.calls:>10,} {item.seconds:>10.3f} {item.mean * 1e6:>10.2f}")
+    return "\n".join(lines)
+
+
+@contextmanager
+def profile_session(cprofile_path: str | None = None, out: Callable[[str], None] = print) -> Iterator[None]:
+    """Instrument a whole session and report when it ends.
+
+    With ``cprofile_path`` the session also runs under :mod:`cProfile` and the
+    stats are dumped there (readable by ``pstats``, snakeviz or flameprof).
+    """
+
+    profiler = None
+    if cprofile_path:
+        import cProfile
+
+        profiler = cProfile.Profile()
+    with instrumented():
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                profiler.dump_stats(cprofile_path)
+            out(format_report(snapshot()))
+            if cprofile_path:
+                out(f"cProfile stats written to {cprofile_path}")
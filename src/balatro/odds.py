@@ -0,0 +1,306 @@
+"""Exact probabilities of each hand category after drawing from the deck.
+
+:func:`category_odds` answers: keeping ``kept`` and drawing ``draws`` cards
+uniformly from ``deck``, how many of the ``C(len(deck), draws)`` possible
+draws make each ``HAND_SCORES`` category as the best five-card hand? The
+count is exact and does not visit individual draws:
+
+* draws are grouped by the multiset of ranks they contain, each weighted by
+  the number of ways to pick suits for it (``prod C(available, drawn)``);
+  pairs, trips, straights and the like depend only on that multiset;
+* for the few multisets where a flush is possible, the suit choices are
+  counted with a small dynamic program over per-suit counts, and straight
+  flushes by inclusion-exclusion over the specific cards they need.
+
+Results are cached by a count signature (each suit's held and undrawn rank
+masks, with the suits sorted), so positions that differ only by suit
+relabelling share one entry. :data:`CLASSIC_FREQUENCIES` is the textbook
+five-card table that ``category_odds([], CARDS, 5)`` must reproduce.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import combinations
+from math import comb
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple
+
+from .cards import CARDS, RANK_SHIFT, RANKS, SUIT_MASK, SUITS, Card
+from .scoring import CATEGORY_IDS, HAND_RESULTS, HAND_SCORES
+from .tables import STRAIGHT_MASKS
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .game import SimpleGame
+
+Signature = Tuple[Tuple[Tuple[int, int], ...], int]
+
+# Number of 5-card hands of each category from a full 52-card deck.
+CLASSIC_FREQUENCIES: Dict[str, int] = {
+    "High Card": 1_302_540,
+    "One Pair": 1_098_240,
+    "Two Pair": 123_552,
+    "Three of a Kind": 54_912,
+    "Straight": 10_200,
+    "Flush": 5_108,
+    "Full House": 3_744,
+    "Four of a Kind": 624,
+    "Straight Flush": 40,
+}
+
+_HIGH, _PAIR, _TWO_PAIR, _TRIPS, _STRAIGHT, _FLUSH, _FULL_HOUSE, _QUADS, _STRAIGHT_FLUSH = (
+    CATEGORY_IDS[name] for name, _, _ in HAND_SCORES
+)
+_WINDOWS = tuple(STRAIGHT_MASKS)
+
+
+@dataclass(frozen=True)
+class CategoryOdds:
+    """Exact number of draws (out of ``total``) giving each category, by category id."""
+
+    counts: Tuple[int, ...]
+    total: int
+
+    def probability(self, name: str) -> float:
+        return self.counts[CATEGORY_IDS[name]] / self.total
+
+    def probabilities(self) -> Dict[str, float]:
+        return {name: count / self.total for (name, _, _), count in zip(HAND_SCORES, self.counts)}
+
+    @property
+    def expected_total(self) -> float:
+        """Expected score of the best five-card hand."""
+
+        return sum(result.total * count for result, count in zip(HAND_RESULTS, self.counts)) / self.total
+
+
+def signature(kept: Sequence[int], deck: Sequence[int], draws: int) -> Signature:
+    held = [0] * len(SUITS)
+    undrawn = [0] * len(SUITS)
+    for code in kept:
+        held[code & SUIT_MASK] |= 1 << (code >> RANK_SHIFT)
+    for code in deck:
+        undrawn[code & SUIT_MASK] |= 1 << (code >> RANK_SHIFT)
+    return tuple(sorted(zip(held, undrawn))), draws
+
+
+def category_odds(kept: Sequence[Card], deck: Sequence[Card], draws: int) -> CategoryOdds:
+    """Distribution of the best category of ``kept`` plus ``draws`` cards drawn from ``deck``."""
+
+    if draws < 0 or draws > len(deck):
+        raise ValueError("draws must be between 0 and the number of cards in the deck")
+    if len(kept) + draws < 5:
+        raise ValueError("At least 5 cards are needed to make a hand.")
+    return _odds(signature([card.code for card in kept], [card.code for card in deck], draws))
+
+
+def game_odds(game: "SimpleGame", discard: Sequence[int] | None = None) -> CategoryOdds:
+    """Odds for ``game``: after discarding ``discard`` and refilling, or for 5 fresh cards.
+
+    With ``discard=None`` the odds describe five cards dealt from the
+    remaining deck, i.e. the composition of what is left to draw.
+    """
+
+    deck = game.deck.remaining_cards()
+    if discard is None:
+        return category_odds([], deck, min(5, len(deck)))
+    if len(set(discard)) != len(discard) or any(not 0 <= i < len(game.hand) for i in discard):
+        raise ValueError("Discard indices must be unique and within the hand.")
+    kept = [card for i, card in enumerate(game.hand) if i not in discard]
+    return category_odds(kept, deck, min(game.hand_size - len(kept), len(deck)))
+
+
+def classic_table() -> Dict[str, int]:
+    """Category counts of all 5-card hands from a full deck, computed by this engine."""
+
+    odds = category_odds([], CARDS, 5)
+    return {name: count for (name, _, _), count in zip(HAND_SCORES, odds.counts)}
+
+
+def _rank_category(counts: Sequence[int], mask: int) -> int:
+    first = second = 0
+    for count in counts:
+        if count > first:
+            first, second = count, first
+        elif count > second:
+            second = count
+    if first >= 4:
+        return _QUADS
+    if first >= 3 and second >= 2:
+        return _FULL_HOUSE
+    for window in _WINDOWS:
+        if mask & window == window:
+            return _STRAIGHT
+    if first >= 3:
+        return _TRIPS
+    if second >= 2:
+        return _TWO_PAIR
+    if first >= 2:
+        return _PAIR
+    return _HIGH
+
+
+@lru_cache(maxsize=4096)
+def _odds(key: Signature) -> CategoryOdds:
+    suits, draws = key
+    held_masks = [held for held, _ in suits]
+    deck_masks = [undrawn for _, undrawn in suits]
+    suit_ids = range(len(suits))
+    ranks = range(len(RANKS))
+    held_counts = [sum(mask >> rank & 1 for mask in held_masks) for rank in ranks]
+    available = [tuple(s for s in suit_ids if deck_masks[s] >> rank & 1) for rank in ranks]
+    held_mask = 0
+    for mask in held_masks:
+        held_mask |= mask
+    held_per_suit = [bin(mask).count("1") for mask in held_masks]
+    total = comb(sum(len(suits_) for suits_ in available), draws)
+    counts = [0] * len(HAND_SCORES)
+
+    # Straight-flush events: (suit, missing ranks) whose cards are all still undrawn.
+    events: List[Tuple[int, int]] = []
+    for s in suit_ids:
+        for window in _WINDOWS:
+            missing = window & ~held_masks[s]
+            if missing == 0:
+                counts[_STRAIGHT_FLUSH] = total  # already held
+                return CategoryOdds(tuple(counts), total)
+            if missing & ~deck_masks[s] == 0 and bin(missing).count("1") <= draws:
+                events.append((s, missing))
+    held_flush = any(count >= 5 for count in held_per_suit)
+
+    drawn = [0] * len(RANKS)
+
+    def leaf(weight: int) -> None:
+        combined = [held + extra for held, extra in zip(held_counts, drawn)]
+        picks = [(rank, take) for rank, take in enumerate(drawn) if take]
+        drawn_mask = 0
+        for rank, _ in picks:
+            drawn_mask |= 1 << rank
+        category = _rank_category(combined, held_mask | drawn_mask)
+
+        straight_flushes = 0
+        applicable = [event for event in events if event[1] & ~drawn_mask == 0]
+        if applicable:
+            straight_flushes = _count_required(applicable, picks, available)
+
+        if category >= _FULL_HOUSE:
+            counts[_STRAIGHT_FLUSH] += straight_flushes
+            counts[category] += weight - straight_flushes
+            return
+        flushes = weight if held_flush else _count_flushes(picks, available, held_per_suit)
+        counts[_STRAIGHT_FLUSH] += straight_flushes
+        counts[_FLUSH] += flushes - straight_flushes
+        counts[category] += weight - flushes
+
+    def walk(rank: int, left: int, weight: int) -> None:
+        if left == 0:
+            leaf(weight)
+            return
+        if rank == len(RANKS):
+            return
+        size = len(available[rank])
+        for take in range(min(left, size), -1, -1):
+            drawn[rank] = take
+            walk(rank + 1, left - take, weight * comb(size, take))
+        drawn[rank] = 0
+
+    walk(0, draws, 1)
+    return CategoryOdds(tuple(counts), total)
+
+
+def _count_required(
+    events: Sequence[Tuple[int, int]], picks: Sequence[Tuple[int, int]], available: Sequence[Tuple[int, ...]]
+) -> int:
+    """Suit choices for ``picks`` that complete at least one event (inclusion-exclusion)."""
+
+    result = 0
+    for size in range(1, len(events) + 1):
+        sign = 1 if size % 2 else -1
+        for group in combinations(events, size):
+            required: Dict[int, set] = {}
+            for suit, missing in group:
+                rank = 0
+                while missing:
+                    if missing & 1:
+                        required.setdefault(rank, set()).add(suit)
+                    missing >>= 1
+                    rank += 1
+            ways = 1
+            for rank, take in picks:
+                fixed = len(required.get(rank, ()))
+                if fixed > take:
+                    ways = 0
+                    break
+                ways *= comb(len(available[rank]) - fixed, take - fixed)
+            result += sign * ways
+    return result
+
+
+def _count_flushes(
+    picks: Sequence[Tuple[int, int]], available: Sequence[Tuple[int, ...]], held_per_suit: Sequence[int]
+) -> int:
+    """Suit choices for the drawn ``(rank, count)`` picks that give some suit five or more cards."""
+
+    reach = [0] * len(held_per_suit)
+    for rank, _ in picks:
+        for suit in available[rank]:
+            reach[suit] += 1
+    relevant = [s for s, held in enumerate(held_per_suit) if held + reach[s] >= 5]
+    if not relevant:
+        return 0
+    need = [5 - held_per_suit[s] for s in relevant]
+    if all(a + b > sum(take for _, take in picks) for a, b in combinations(need, 2)):
+        # At most one suit can reach five: the flush counts of the suits simply add up.
+        return sum(_count_suit(picks, available, s, n) for s, n in zip(relevant, need))
+
+    # states: capped per-relevant-suit counts -> number of suit choices so far
+    states: Dict[Tuple[int, ...], int] = {tuple([0] * len(relevant)): 1}
+    for rank, take in picks:
+        options = available[rank]
+        tracked = [s in options for s in relevant]
+        if not any(tracked):
+            # no relevant suit here: every choice leaves the state unchanged
+            factor = comb(len(options), take)
+            states = {state: ways * factor for state, ways in states.items()}
+            continue
+        moves: Dict[Tuple[int, ...], int] = {}
+        for chosen in combinations(options, take):
+            step = tuple(int(s in chosen) for s in relevant)
+            moves[step] = moves.get(step, 0) + 1
+        following: Dict[Tuple[int, ...], int] = {}
+        for state, ways in states.items():
+            for step, multiplicity in moves.items():
+                new = tuple(min(a + b, n) for a, b, n in zip(state, step, need))
+                following[new] = following.get(new, 0) + ways * multiplicity
+        states = following
+    return sum(ways for state, ways in states.items() if any(a >= n for a, n in zip(state, need)))
+
+
+def _count_suit(picks: Sequence[Tuple[int, int]], available: Sequence[Tuple[int, ...]], suit: int, need: int) -> int:
+    """Suit choices for ``picks`` that put at least ``need`` cards in ``suit``."""
+
+    # by_count[j]: choices with j cards of the suit so far (j capped at need)
+    by_count = [1] + [0] * need
+    for rank, take in picks:
+        size = len(available[rank])
+        if suit not in available[rank]:
+            factor = comb(size, take)
+            by_count = [ways * factor for ways in by_count]
+            continue
+        without, with_suit = comb(size - 1, take), comb(size - 1, take - 1)
+        shifted = [0] * (need + 1)
+        for j, ways in enumerate(by_count):
+            if ways:
+                shifted[j] += ways * without
+                shifted[min(j + 1, need)] += ways * with_suit
+        by_count = shifted
+    return by_count[need]
+
+
+def format_odds(odds: CategoryOdds) -> List[str]:
+    """One ``name  probability`` line per category, strongest first."""
+
+    lines = []
+    for (name, _, _), count in reversed(list(zip(HAND_SCORES, odds.counts))):
+        lines.append(f"{name:<16} {count / odds.total:8.2%}")
+    return lines
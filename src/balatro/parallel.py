@@ -0,0 +1,159 @@
+"""Run simulations across a process pool.
+
+Games are split into contiguous chunks of game indices and each chunk is
+played with :func:`balatro.simulate.iter_games`, so game ``i`` is always dealt
+from ``game_seed(seed, i)`` no matter which worker plays it. Chunk summaries
+only hold integer counts, so merging them in completion order gives the
+same totals for any worker count or chunk size.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Set, Tuple, Union
+
+from .simulate import POLICIES, Policy, SimulationSummary, iter_games
+
+PolicySpec = Union[str, Policy]
+
+# Target wall time per chunk: long enough to amortize pickling and IPC.
+TARGET_CHUNK_SECONDS = 0.25
+PILOT_GAMES = 32
+MIN_CHUNK, MAX_CHUNK = 16, 100_000
+
+
+@dataclass(frozen=True)
+class ScalingPoint:
+    workers: int
+    games_per_second: float
+    speedup: float
+
+
+def _resolve(policy: PolicySpec) -> Policy:
+    return POLICIES[policy] if isinstance(policy, str) else policy
+
+
+def run_chunk(policy: PolicySpec, seed: int, start: int, count: int) -> SimulationSummary:
+    """Play games ``start .. start + count - 1``; runs inside worker processes."""
+
+    summary = SimulationSummary()
+    began = time.perf_counter()
+    for record in iter_games(count, _resolve(policy), seed, start):
+        summary.add(record)
+    summary.elapsed = time.perf_counter() - began
+    return summary
+
+
+def auto_chunk_size(pilot: SimulationSummary, games: int, workers: int) -> int:
+    """Pick a chunk size from a pilot run's per-game time.
+
+    Chunks aim for :data:`TARGET_CHUNK_SECONDS` of work but are capped so every
+    worker still gets several chunks to balance uneven game lengths.
+    """
+
+    per_game = pilot.elapsed / pilot.games if pilot.games else 0.0
+    size = int(TARGET_CHUNK_SECONDS / per_game) if per_game > 0 else MAX_CHUNK
+    balanced = -(-games // (workers * 4)) if games else MIN_CHUNK
+    return max(MIN_CHUNK, min(size, balanced, MAX_CHUNK))
+
+
+def _chunks(start: int, stop: int, size: int) -> Iterator[Tuple[int, int]]:
+    for first in range(start, stop, size):
+        yield first, min(size, stop - first)
+
+
+def run_parallel(
+    games: int,
+    policy: PolicySpec = "greedy",
+    seed: int = 0,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    on_chunk: Callable[[SimulationSummary], None] | None = None,
+    shared_table: bool = False,
+) -> SimulationSummary:
+    """Play ``games`` games on ``workers`` processes and return the merged summary.
+
+    ``policy`` is a name from :data:`balatro.simulate.POLICIES` or a picklable
+    module-level callable. ``on_chunk`` receives the running summary after each
+    chunk is merged. Without ``chunk_size`` a pilot chunk is timed in-process
+    (and counted) to choose one. With ``shared_table`` every worker scores
+    hands through the read-only table of :func:`balatro.cache.precompute_table`.
+    """
+
+    workers = workers or os.cpu_count() or 1
+    total = SimulationSummary()
+    began = time.perf_counter()
+    next_game = 0
+
+    if chunk_size is None:
+        pilot = run_chunk(policy, seed, 0, min(PILOT_GAMES, games))
+        total.merge(pilot)
+        next_game = pilot.games
+        if on_chunk is not None:
+            on_chunk(total)
+        chunk_size = auto_chunk_size(pilot, games - next_game, workers)
+
+    chunks = _chunks(next_game, games, chunk_size)
+    if workers == 1:
+        for start, count in chunks:
+            total.merge(run_chunk(policy, seed, start, count))
+            if on_chunk is not None:
+                on_chunk(total)
+    else:
+        pool_options = {}
+        if shared_table:
+            from .cache import init_worker, precompute_table
+
+            pool_options = {"initializer": init_worker, "initargs": (precompute_table(),)}
+        with ProcessPoolExecutor(max_workers=workers, **pool_options) as pool:
+            pending: Set[Future] = set()
+            # Keep a couple of chunks queued per worker instead of submitting everything up front.
+            for start, count in chunks:
+                pending.add(pool.submit(run_chunk, policy, seed, start, count))
+                if len(pending) >= workers * 2:
+                    pending = _drain(pending, total, on_chunk, FIRST_COMPLETED)
+            _drain(pending, total, on_chunk)
+
+    total.elapsed = time.perf_counter() - began
+    return total
+
+
+def _drain(
+    pending: Set[Future],
+    total: SimulationSummary,
+    on_chunk: Callable[[SimulationSummary], None] | None,
+    return_when: str = "ALL_COMPLETED",
+) -> Set[Future]:
+    done, still_pending = wait(pending, return_when=return_when)
+    for future in done:
+        total.merge(future.result())
+        if on_chunk is not None:
+            on_chunk(total)
+    return still_pending
+
+
+def scaling_report(
+    games: int, policy: PolicySpec = "greedy", seed: int = 0, max_workers: int | None = None
+) -> List[ScalingPoint]:
+    """Measure games/second for 1..``max_workers`` processes on the same games."""
+
+    max_workers = max_workers or os.cpu_count() or 1
+    points: List[ScalingPoint] = []
+    baseline = 0.0
+    for workers in range(1, max_workers + 1):
+        summary = run_parallel(games, policy, seed, workers)
+        rate = summary.games_per_second
+        baseline = baseline or rate
+        points.append(ScalingPoint(workers, rate, rate / baseline if baseline else 0.0))
+    return points
+
+
+def format_scaling(points: List[ScalingPoint]) -> str:
+    lines = ["workers  games/s      speedup"]
+    for point in points:
+        lines.append(f"{point.workers:>7}  {point.games_per_second:>11,.0f}  {point.speedup:>6.2f}x")
+    return "\n".join(lines)
+
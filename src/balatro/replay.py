@@ -0,0 +1,240 @@
+"""Append-only binary log of game sessions and a verifying replayer.
+
+A log is an 8-byte header followed by fixed-size 16-byte little-endian
+records ``(kind: u8, category: u8, mask: u16, total: u32, seed: u64)``:
+
+* ``START``   - a game dealt from ``Deck(random.Random(seed))``
+* ``PLAY``    - ``mask`` holds the played hand indices as bits, ``category``
+  and ``total`` the resulting score
+* ``DISCARD`` - ``mask`` holds the discarded hand indices
+* ``END``     - ``total`` is the final score of the game
+
+Because records have a fixed size, a log can be memory-mapped and scanned
+with :func:`struct.iter_unpack` without building any game objects, and a
+game is fully determined by its seed and actions, so :func:`replay` can
+re-execute it and check every logged score.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import random
+import struct
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Iterator, List, Sequence, Tuple
+
+from .cards import Deck
+from .game import SimpleGame
+from .scoring import CATEGORY_IDS, HAND_SCORES, HandResult
+
+MAGIC = b"BLRP"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")  # magic, version, record size
+RECORD = struct.Struct("<BBHIQ")
+
+START, PLAY, DISCARD, END = 1, 2, 3, 4
+
+Record = Tuple[int, int, int, int, int]
+
+
+class ReplayError(ValueError):
+    """Raised for malformed logs or when a replay disagrees with the log."""
+
+
+def indices_to_mask(indices: Sequence[int]) -> int:
+    mask = 0
+    for index in indices:
+        mask |= 1 << index
+    return mask
+
+
+def mask_to_indices(mask: int) -> List[int]:
+    return [index for index in range(mask.bit_length()) if mask >> index & 1]
+
+
+class ReplayWriter:
+    """Buffered appender; opening an existing log validates its header.
+
+    A torn trailing record (left by a crash mid-write) is truncated away
+    before appending, so new records stay aligned to the record size.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], buffer_size: int = 1 << 16) -> None:
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if size:
+            with open(path, "rb") as existing:
+                _check_header(existing.read(HEADER.size))
+            torn = (size - HEADER.size) % RECORD.size
+            if torn:
+                os.truncate(path, size - torn)
+        self._file: BinaryIO = open(path, "ab", buffering=buffer_size)
+        if self._file.tell() == 0:
+            self._file.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        self._pack = RECORD.pack
+
+    def start(self, seed: int) -> None:
+        self._file.write(self._pack(START, 0, 0, 0, seed))
+
+    def play(self, indices: Sequence[int], result: HandResult) -> None:
+        self._file.write(self._pack(PLAY, CATEGORY_IDS[result.name], indices_to_mask(indices), result.total, 0))
+
+    def discard(self, indices: Sequence[int]) -> None:
+        self._file.write(self._pack(DISCARD, 0, indices_to_mask(indices), 0, 0))
+
+    def end(self, score: int) -> None:
+        self._file.write(self._pack(END, 0, 0, score, 0))
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "ReplayWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class RecordedGame:
+    """A :class:`SimpleGame` whose actions are appended to a :class:`ReplayWriter`.
+
+    Every :meth:`start` deals a new game from a fresh seed. Other attributes
+    (``hand``, ``plays_remaining``, ``best_play`` ...) are forwarded to the game.
+    """
+
+    def __init__(self, writer: ReplayWriter, seed: int | None = None) -> None:
+        self.writer = writer
+        self.game = SimpleGame(deck=Deck(random.Random()))
+        self.score = 0
+        self._next_seed = seed
+        self._active = False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.game, name)
+
+    def start(self) -> None:
+        self.finish()
+        seed = self._next_seed if self._next_seed is not None else random.SystemRandom().getrandbits(63)
+        self._next_seed = None
+        self.game.deck.reset(seed)
+        self.game.start()
+        self.writer.start(seed)
+        self.score = 0
+        self._active = True
+
+    def play_cards(self, indices: List[int]) -> HandResult:
+        result = self.game.play_cards(indices)
+        self.writer.play(indices, result)
+        self.score += result.total
+        return result
+
+    def discard_cards(self, indices: List[int]) -> None:
+        self.game.discard_cards(indices)
+        self.writer.discard(indices)
+
+    def finish(self) -> None:
+        """Log the end of the current game, if one is in progress."""
+
+        if self._active:
+            self.writer.end(self.score)
+            self._active = False
+
+
+def _check_header(data: bytes) -> None:
+    if len(data) < HEADER.size:
+        raise ReplayError("File is too short to be a replay log.")
+    magic, version, record_size = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ReplayError("Not a replay log.")
+    if version != VERSION or record_size != RECORD.size:
+        raise ReplayError(f"Unsupported replay log version {version}.")
+
+
+def scan(path: str | os.PathLike[str]) -> Iterator[Record]:
+    """Yield raw ``(kind, category, mask, total, seed)`` records via a memory map.
+
+    A zero-length file is an empty log: :class:`ReplayWriter` creates one
+    before its buffered header reaches the disk.
+    """
+
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:  # mmap cannot map an empty file
+            return
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        _check_header(mapped[: HEADER.size])
+        body = memoryview(mapped)[HEADER.size :]
+        usable = len(body) - len(body) % RECORD.size  # ignore a torn trailing record
+        try:
+            yield from RECORD.iter_unpack(body[:usable])
+        finally:
+            body.release()
+
+
+@dataclass
+class ReplaySummary:
+    games: int = 0
+    hands: int = 0
+    discards: int = 0
+    total_score: int = 0
+    categories: List[int] = field(default_factory=lambda: [0] * len(HAND_SCORES))
+
+
+def summarize(path: str | os.PathLike[str]) -> ReplaySummary:
+    """Aggregate a log without reconstructing any games."""
+
+    summary = ReplaySummary()
+    categories = summary.categories
+    for kind, category, _, total, _ in scan(path):
+        if kind == PLAY:
+            summary.hands += 1
+            summary.total_score += total
+            categories[category] += 1
+        elif kind == START:
+            summary.games += 1
+        elif kind == DISCARD:
+            summary.discards += 1
+    return summary
+
+
+def replay(path: str | os.PathLike[str]) -> int:
+    """Re-execute every logged game and verify each score; return the game count."""
+
+    game = SimpleGame(deck=Deck(random.Random()))
+    games = 0
+    score = 0
+    active = False
+    for number, (kind, category, mask, total, seed) in enumerate(scan(path)):
+        if kind == START:
+            game.deck.reset(seed)
+            game.start()
+            games += 1
+            score = 0
+            active = True
+            continue
+        if not active:
+            raise ReplayError(f"Record {number}: action outside of a game.")
+        try:
+            if kind == PLAY:
+                result = game.play_cards(mask_to_indices(mask))
+                if CATEGORY_IDS[result.name] != category or result.total != total:
+                    raise ReplayError(
+                        f"Record {number}: logged {HAND_SCORES[category][0]} for {total}, "
+                        f"replay scored {result.name} for {result.total}."
+                    )
+                score += result.total
+            elif kind == DISCARD:
+                game.discard_cards(mask_to_indices(mask))
+            elif kind == END:
+                if total != score:
+                    raise ReplayError(f"Record {number}: logged final score {total}, replay scored {score}.")
+                active = False
+            else:
+                raise ReplayError(f"Record {number}: unknown record kind {kind}.")
+        except ReplayError:
+            raise
+        except ValueError as exc:
+            raise ReplayError(f"Record {number}: action rejected on replay: {exc}") from exc
+    return games
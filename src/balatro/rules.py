@@ -0,0 +1,307 @@
+"""Configurable scoring and game rules, compiled into lookup tables.
+
+:class:`Rules` holds the chips and multiplier of every category, the
+optional extra categories (Five of a Kind, Flush House, Flush Five, which
+need duplicate cards and therefore ``decks > 1``), the hand size and the
+play/discard limits. :meth:`Rules.compile` turns it into
+:class:`CompiledRules` once: categories are classified with the same packed
+lookup tables as the default engine and mapped through a per-rules result
+tuple, so custom rules cost one extra tuple index.
+
+Category ids extend :data:`balatro.scoring.CATEGORY_IDS`: 0-8 are the
+standard categories and 9-11 the extra ones, ordered by strength. When an
+extra category is not part of the rules, a hand of that shape scores as the
+strongest standard category it contains (Flush House as Full House, Five
+of a Kind and Flush Five as Four of a Kind).
+
+:func:`evaluate_variants` scores many rule variants over the same hands in
+a single pass: every hand is classified once, and the variants only differ
+in how categories map to scores.
+"""
+
+from __future__ import annotations
+
+import random
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from itertools import combinations
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Mapping, Sequence, Tuple
+
+from .cards import CARDS, Card, Deck
+from .scoring import CATEGORY_IDS, HAND_SCORES, HandResult
+from .tables import CARD_BITS, classify, classify_codes
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .solver import Play
+
+EXTRA_HAND_SCORES: List[Tuple[str, int, int]] = [
+    ("Five of a Kind", 120, 12),
+    ("Flush House", 140, 14),
+    ("Flush Five", 160, 16),
+]
+CATEGORY_NAMES: Tuple[str, ...] = tuple(name for name, _, _ in HAND_SCORES + EXTRA_HAND_SCORES)
+ALL_CATEGORY_IDS: Dict[str, int] = {name: index for index, name in enumerate(CATEGORY_NAMES)}
+
+_FLUSH = CATEGORY_IDS["Flush"]
+_FULL_HOUSE = CATEGORY_IDS["Full House"]
+_QUADS = CATEGORY_IDS["Four of a Kind"]
+_FIVE = ALL_CATEGORY_IDS["Five of a Kind"]
+_FLUSH_HOUSE = ALL_CATEGORY_IDS["Flush House"]
+_FLUSH_FIVE = ALL_CATEGORY_IDS["Flush Five"]
+_SUIT_BITS = 0xF000
+
+Score = Tuple[str, int, int]
+
+
+@dataclass(frozen=True)
+class Rules:
+    """Scoring table and game limits; hashable, so it can key caches."""
+
+    scores: Tuple[Score, ...] = tuple(HAND_SCORES)
+    hand_size: int = 8
+    max_plays: int = 5
+    max_discards: int = 5
+    decks: int = 1
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "scores", tuple((name, int(chips), int(mult)) for name, chips, mult in self.scores))
+        names = [name for name, _, _ in self.scores]
+        unknown = set(names) - set(CATEGORY_NAMES)
+        if unknown:
+            raise ValueError(f"Unknown hand categories: {sorted(unknown)}")
+        if len(set(names)) != len(names):
+            raise ValueError("Each category may only be scored once.")
+        missing = [name for name, _, _ in HAND_SCORES if name not in names]
+        if missing:
+            raise ValueError(f"Rules must score every standard category; missing {missing}")
+        if any(chips < 0 or mult < 0 for _, chips, mult in self.scores):
+            raise ValueError("Chips and multipliers must be non-negative.")
+        if self.hand_size < 5:
+            raise ValueError("hand_size must be at least 5")
+        if self.max_plays < 1 or self.max_discards < 0:
+            raise ValueError("max_plays must be positive and max_discards non-negative")
+        if self.decks < 1:
+            raise ValueError("decks must be at least 1")
+
+    @classmethod
+    def from_scores(cls, scores: Mapping[str, Tuple[int, int]], **options: int) -> "Rules":
+        """Build rules from ``{name: (chips, mult)}``, filling in unlisted standard categories."""
+
+        merged = {name: (chips, mult) for name, chips, mult in HAND_SCORES}
+        merged.update(scores)
+        return cls(tuple((name, chips, mult) for name, (chips, mult) in merged.items()), **options)
+
+    def with_score(self, name: str, chips: int, multiplier: int) -> "Rules":
+        """A copy with ``name`` scored as ``chips`` x ``multiplier`` (adds extra categories)."""
+
+        scores = [score for score in self.scores if score[0] != name]
+        scores.append((name, chips, multiplier))
+        return replace(self, scores=tuple(scores))
+
+    def with_options(self, **options: int) -> "Rules":
+        return replace(self, **options)
+
+    @property
+    def standard(self) -> bool:
+        """True when scoring matches the built-in tables (the solver's fast path applies)."""
+
+        return self.decks == 1 and self.scores == DEFAULT_RULES.scores
+
+    def deck_cards(self) -> Tuple[Card, ...]:
+        return CARDS * self.decks
+
+    def new_deck(self, rng: random.Random | None = None) -> Deck:
+        return Deck(rng, cards=self.deck_cards())
+
+    def compile(self) -> "CompiledRules":
+        return _compile(self)
+
+
+DEFAULT_RULES = Rules()
+
+
+def classify_extended(codes: Sequence[int]) -> int:
+    """Category id (0-11) of five card codes that may contain duplicate cards."""
+
+    bits = CARD_BITS
+    c1, c2, c3, c4, c5 = (bits[code] for code in codes)
+    ranks = (c1 | c2 | c3 | c4 | c5) >> 16
+    suited = c1 & c2 & c3 & c4 & c5 & _SUIT_BITS
+    if ranks & (ranks - 1) == 0:
+        return _FLUSH_FIVE if suited else _FIVE
+    if not suited or ranks.bit_count() == 5:
+        return classify(c1, c2, c3, c4, c5)
+    # A flush with repeated ranks: classify the ranks alone (drop one card's suit bits).
+    paired = classify(c1 & ~_SUIT_BITS, c2, c3, c4, c5)
+    if paired == _FULL_HOUSE:
+        return _FLUSH_HOUSE
+    return _QUADS if paired == _QUADS else _FLUSH
+
+
+@dataclass(frozen=True)
+class CompiledRules:
+    """Lookup tables for one :class:`Rules`: category id -> scored result."""
+
+    rules: Rules
+    results: Tuple[HandResult, ...]  # indexed by any category id 0-11
+    totals: Tuple[int, ...] = field(repr=False)
+    # Standard category ids by descending total, for the solver's category search.
+    search_order: Tuple[int, ...] = field(repr=False)
+    # Whether standard totals never drop as categories get stronger; the
+    # category search is only exact then (see :mod:`balatro.solver`).
+    monotone: bool = field(repr=False)
+
+    def classify_codes(self, codes: Sequence[int]) -> int:
+        """Category id (into :data:`CATEGORY_NAMES`) of five card codes under these rules."""
+
+        if self.rules.decks == 1:
+            return classify_codes(codes)
+        return _ALIASES[_scored_categories(self.rules)][classify_extended(codes)]
+
+    def evaluate_codes(self, codes: Sequence[int]) -> HandResult:
+        if len(codes) != 5:
+            raise ValueError("A hand must contain exactly 5 cards to score.")
+        if self.rules.decks == 1:
+            return self.results[classify_codes(codes)]
+        return self.results[classify_extended(codes)]
+
+    def evaluate(self, cards: Sequence[Card]) -> HandResult:
+        if len(cards) != 5:
+            raise ValueError("A hand must contain exactly 5 cards to score.")
+        bits = CARD_BITS
+        c1, c2, c3, c4, c5 = cards
+        if self.rules.decks == 1:
+            return self.results[classify(bits[c1.code], bits[c2.code], bits[c3.code], bits[c4.code], bits[c5.code])]
+        return self.results[classify_extended([c1.code, c2.code, c3.code, c4.code, c5.code])]
+
+    def best_play_codes(self, codes: Sequence[int]) -> "Play":
+        """Best five of ``codes`` under these rules (see :func:`balatro.solver.best_play_codes`)."""
+
+        from .solver import best_play_codes
+
+        return best_play_codes(codes, self.rules)
+
+
+def _scored_categories(rules: Rules) -> FrozenSet[str]:
+    return frozenset(name for name, _, _ in rules.scores)
+
+
+def _alias_table(scored: FrozenSet[str]) -> Tuple[int, ...]:
+    """Map every category id to the id it scores as when extras are missing."""
+
+    aliases = list(range(len(CATEGORY_NAMES)))
+    if "Five of a Kind" not in scored:
+        aliases[_FIVE] = _QUADS
+    if "Flush House" not in scored:
+        aliases[_FLUSH_HOUSE] = _FULL_HOUSE
+    if "Flush Five" not in scored:
+        aliases[_FLUSH_FIVE] = aliases[_FIVE]
+    return tuple(aliases)
+
+
+class _AliasCache(dict):
+    def __missing__(self, scored: FrozenSet[str]) -> Tuple[int, ...]:
+        self[scored] = table = _alias_table(scored)
+        return table
+
+
+_ALIASES = _AliasCache()
+
+
+@lru_cache(maxsize=256)
+def _compile(rules: Rules) -> CompiledRules:
+    by_name = {name: HandResult(name, chips, mult) for name, chips, mult in rules.scores}
+    aliases = _ALIASES[_scored_categories(rules)]
+    results = tuple(by_name[CATEGORY_NAMES[aliases[category]]] for category in range(len(CATEGORY_NAMES)))
+    totals = tuple(result.total for result in results)
+    order = tuple(sorted(range(len(HAND_SCORES)), key=lambda i: (totals[i], i), reverse=True))
+    monotone = all(totals[i] <= totals[i + 1] for i in range(len(HAND_SCORES) - 1))
+    return CompiledRules(rules, results, totals, order, monotone)
+
+
+# -- evaluating many variants at once ----------------------------------------------
+
+
+@dataclass(frozen=True)
+class VariantScore:
+    """Best-play scores of one rule variant over a set of hands."""
+
+    rules: Rules
+    hands: int
+    total: int
+    categories: Tuple[int, ...]  # best-play category counts, by id into CATEGORY_NAMES
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.hands if self.hands else 0.0
+
+
+def hand_categories(codes: Sequence[int]) -> FrozenSet[int]:
+    """Ids of every category some five of ``codes`` make (duplicates allowed)."""
+
+    if len(codes) == 5:
+        return frozenset((classify_extended(codes),))
+    return frozenset(classify_extended(five) for five in combinations(codes, 5))
+
+
+def classify_hands(hands: Iterable[Sequence[int]]) -> Counter:
+    """Count hands by the set of categories they can make; the shared step of every variant."""
+
+    shapes: Counter = Counter()
+    for codes in hands:
+        shapes[hand_categories(codes)] += 1
+    return shapes
+
+
+def evaluate_variants(
+    hands: Iterable[Sequence[int]] | Counter, variants: Sequence[Rules]
+) -> List[VariantScore]:
+    """Score the best play of every hand under each variant, classifying each hand once.
+
+    ``hands`` are card-code sequences of five or more cards (or the result of
+    :func:`classify_hands`). A hand's best play under a variant is its highest
+    scoring category, so only the distinct category sets are visited per variant.
+    """
+
+    shapes = hands if isinstance(hands, Counter) else classify_hands(hands)
+    count = sum(shapes.values())
+    scores = []
+    for rules in variants:
+        compiled = rules.compile()
+        totals, aliases = compiled.totals, _ALIASES[_scored_categories(rules)]
+        categories = [0] * len(CATEGORY_NAMES)
+        total = 0
+        for shape, hands_with_shape in shapes.items():
+            best = max(shape, key=lambda category: (totals[category], category))
+            categories[aliases[best]] += hands_with_shape
+            total += totals[best] * hands_with_shape
+        scores.append(VariantScore(rules, count, total, tuple(categories)))
+    return scores
+
+
+def sample_hands(rules: Rules, count: int, seed: int | None = None) -> List[List[int]]:
+    """Deal ``count`` independent hands of ``rules.hand_size`` cards from the rules' deck."""
+
+    deck = rules.new_deck(random.Random(seed))
+    hands = []
+    for _ in range(count):
+        deck.reset()
+        hands.append([card.code for card in deck.draw(rules.hand_size)])
+    return hands
+
+
+__all__ = [
+    "ALL_CATEGORY_IDS",
+    "CATEGORY_NAMES",
+    "CompiledRules",
+    "DEFAULT_RULES",
+    "EXTRA_HAND_SCORES",
+    "Rules",
+    "VariantScore",
+    "classify_extended",
+    "classify_hands",
+    "evaluate_variants",
+    "hand_categories",
+    "sample_hands",
+]
@@ -2,10 +2,15 @@ from __future__ import annotations
 
 from collections import Counter
 from dataclasses import dataclass
-from typing import Iterable, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Sequence
 
+from . import tables
 from .cards import Card, RANKS
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .batch import BatchResult
+    from .rules import Rules
+
 RANK_ORDER = {rank: index for index, rank in enumerate(RANKS)}
 
 
@@ -32,7 +37,10 @@ HAND_SCORES: list[tuple[str, int, int]] = [
     ("Straight Flush", 140, 8),
 ]
 
-HAND_LOOKUP = {name: HandResult(name, chips, mult) for name, chips, mult in HAND_SCORES}
+HAND_RESULTS: tuple[HandResult, ...] = tuple(HandResult(name, chips, mult) for name, chips, mult in HAND_SCORES)
+HAND_LOOKUP = {result.name: result for result in HAND_RESULTS}
+# Category ids are indices into HAND_SCORES / HAND_RESULTS.
+CATEGORY_IDS = {result.name: index for index, result in enumerate(HAND_RESULTS)}
 
 
 def _is_flush(cards: Iterable[Card]) -> bool:
@@ -48,10 +56,7 @@ def _is_straight(sorted_ranks: List[str]) -> bool:
     return all(b - a == 1 for a, b in zip(indices, indices[1:]))
 
 
-def evaluate_hand(cards: List[Card]) -> HandResult:
-    if len(cards) != 5:
-        raise ValueError("A hand must contain exactly 5 cards to score.")
-
+def _evaluate_reference(cards: List[Card]) -> HandResult:
     ranks = sorted((card.rank for card in cards), key=lambda r: RANK_ORDER[r])
     flush = _is_flush(cards)
     straight = _is_straight(ranks)
@@ -82,3 +87,86 @@ def evaluate_hand(cards: List[Card]) -> HandResult:
         return HAND_LOOKUP["One Pair"]
 
     return HAND_LOOKUP["High Card"]
+
+
+def _load_reference_engine() -> Callable[[List[Card]], HandResult]:
+    return _evaluate_reference
+
+
+def _load_table_engine() -> Callable[[List[Card]], HandResult]:
+    return tables.evaluate_cards
+
+
+def _load_cached_engine() -> Callable[[List[Card]], HandResult]:
+    from .cache import cached_evaluator
+
+    return cached_evaluator()
+
+
+# Engine name -> loader returning the evaluator; loaders run once per selection.
+ENGINES: Dict[str, Callable[[], Callable[[List[Card]], HandResult]]] = {
+    "reference": _load_reference_engine,
+    "table": _load_table_engine,
+    "cached": _load_cached_engine,
+}
+
+_engine = "reference"
+_evaluate: Callable[[List[Card]], HandResult] = _evaluate_reference
+
+
+def _resolve_engine(name: str) -> Callable[[List[Card]], HandResult]:
+    try:
+        loader = ENGINES[name]
+    except KeyError as exc:
+        raise ValueError(f"Unknown evaluation engine: {name!r}") from exc
+    return loader()
+
+
+def get_engine() -> str:
+    return _engine
+
+
+def set_engine(name: str) -> None:
+    """Select the backend used by :func:`evaluate_hand` when no engine is given."""
+
+    global _engine, _evaluate
+    _evaluate = _resolve_engine(name)
+    _engine = name
+
+
+def evaluate_hand(cards: List[Card], engine: str | None = None, rules: "Rules | None" = None) -> HandResult:
+    """Score five cards with the selected engine, or with ``rules`` when given."""
+
+    if len(cards) != 5:
+        raise ValueError("A hand must contain exactly 5 cards to score.")
+
+    if rules is not None:
+        return rules.compile().evaluate(cards)
+    evaluator = _evaluate if engine is None else _resolve_engine(engine)
+    return evaluator(cards)
+
+
+def evaluate_codes(codes: Sequence[int]) -> HandResult:
+    """Score five compact card codes (see :func:`balatro.cards.card_code`)."""
+
+    if len(codes) != 5:
+        raise ValueError("A hand must contain exactly 5 cards to score.")
+
+    return tables.evaluate_codes(codes)
+
+
+def evaluate_hands(codes: Any) -> "BatchResult":
+    """Score an ``(N, 5)`` array of card codes in one vectorized pass.
+
+    Returns a :class:`balatro.batch.BatchResult` with ``category`` (index into
+    ``HAND_SCORES``), ``chips``, ``multiplier`` and ``total`` arrays. Requires NumPy.
+    """
+
+    try:
+        from .batch import evaluate_hands as _evaluate_hands
+    except ImportError as exc:
+        if exc.name != "numpy":  # a broken import inside balatro, not a missing extra
+            raise
+        raise ImportError("evaluate_hands requires NumPy: pip install 'balatro[fast]'") from exc
+
+    return _evaluate_hands(codes)
@@ -0,0 +1,556 @@
+"""Asyncio game server: many :class:`SimpleGame` sessions over a local socket.
+
+The protocol is newline-delimited JSON over TCP or a Unix socket. Each
+request is one object with an ``op`` and, for most ops, a ``session`` id;
+an optional ``id`` is echoed back so clients can match responses::
+
+    {"id": 1, "op": "start", "seed": 42}
+    {"id": 2, "op": "play", "session": "3f2a...", "indices": [0, 1, 2, 3, 4]}
+
+Ops: ``start`` (new session, or restart an existing one), ``state``,
+``play``, ``discard``, ``hint`` (best play), ``close`` and ``ping``.
+Responses carry ``"ok": true`` and the game state, or ``"ok": false`` and
+an ``error`` message.
+
+Requests on one connection are answered in order, and a client may send
+any number of them without waiting (pipelining). The server only reads
+the next request once the previous response fits under the connection's
+write-buffer high-water mark, so a client that stops reading stalls its
+own connection instead of growing server memory (backpressure). Sessions
+untouched for ``idle_timeout`` seconds are evicted by a periodic sweep;
+with a :class:`balatro.store.GameStore` they are persisted and resumed.
+
+:class:`GameClient` is a pipelining client, and :func:`load_test` drives
+many connections at once and reports requests/second and latency
+percentiles (``balatro loadtest``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Sequence, Tuple
+
+from .cards import Deck
+from .game import SimpleGame
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .store import GameStore
+
+MAX_LINE = 64 * 1024
+WRITE_HIGH_WATER = 256 * 1024
+
+Response = Dict[str, Any]
+
+
+class RequestError(ValueError):
+    """A request the server rejects; reported to the client as ``"ok": false``."""
+
+
+@dataclass
+class Session:
+    id: str
+    game: SimpleGame
+    seed: int
+    score: int = 0
+    last_used: float = 0.0
+
+    def state(self) -> Response:
+        game = self.game
+        return {
+            "session": self.id,
+            "seed": self.seed,
+            "hand": [str(card) for card in game.hand],
+            "codes": [card.code for card in game.hand],
+            "plays_remaining": game.plays_remaining,
+            "discards_remaining": game.discards_remaining,
+            "deck_remaining": game.deck.remaining(),
+            "score": self.score,
+        }
+
+
+class SessionManager:
+    """Sessions keyed by id, ordered by last use so idle ones are evicted cheaply.
+
+    With a ``store`` every change is saved (buffered) to it, and sessions that
+    are no longer in memory - evicted, or from before a restart - are loaded
+    back on their next request.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 10_000,
+        idle_timeout: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+        store: "GameStore | None" = None,
+    ) -> None:
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.clock = clock
+        self.store = store
+        self._sessions: "OrderedDict[str, Session]" = OrderedDict()
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, session_id: Any) -> Session:
+        session = self._sessions.get(session_id) if isinstance(session_id, str) else None
+        if session is None and isinstance(session_id, str) and self.store is not None:
+            session = self._load(session_id)
+        if session is None:
+            raise RequestError(f"Unknown session: {session_id!r}")
+        self._touch(session)
+        return session
+
+    def save(self, session: Session) -> None:
+        if self.store is not None:
+            self.store.save_session(session.id, session.game, session.score, session.seed)
+
+    def _load(self, session_id: str) -> Session | None:
+        assert self.store is not None
+        stored = self.store.load_session(session_id)
+        if stored is None:
+            return None
+        self._make_room()
+        session = Session(session_id, stored.game, stored.seed, stored.score)
+        self._sessions[session_id] = session
+        return session
+
+    def _make_room(self) -> None:
+        if len(self._sessions) >= self.max_sessions:
+            self.evict_idle()
+            if len(self._sessions) >= self.max_sessions:
+                raise RequestError("Too many sessions; close some or try again later.")
+
+    def start(self, session_id: str | None = None, seed: int | None = None) -> Session:
+        if seed is None:
+            seed = random.getrandbits(63)
+        elif not isinstance(seed, int) or isinstance(seed, bool):
+            raise RequestError("seed must be an integer")
+        if session_id is not None and not isinstance(session_id, str):
+            raise RequestError("session must be a string")
+        session = self._sessions.get(session_id) if session_id is not None else None
+        if session is None:
+            self._make_room()
+            session_id = session_id if session_id is not None else secrets.token_hex(8)
+            session = Session(session_id, SimpleGame(deck=Deck(random.Random())), seed)
+            self._sessions[session_id] = session
+        session.seed, session.score = seed, 0
+        session.game.deck.reset(seed)
+        session.game.start()
+        self._touch(session)
+        self.save(session)
+        return session
+
+    def close(self, session_id: Any) -> None:
+        self.get(session_id)
+        del self._sessions[session_id]
+        if self.store is not None:
+            self.store.delete_session(session_id)
+
+    def evict_idle(self) -> int:
+        """Drop sessions idle for longer than ``idle_timeout``; return how many."""
+
+        cutoff = self.clock() - self.idle_timeout
+        evicted = 0
+        while self._sessions:
+            oldest = next(iter(self._sessions.values()))
+            if oldest.last_used > cutoff:
+                break
+            del self._sessions[oldest.id]
+            evicted += 1
+        self.evicted += evicted
+        return evicted
+
+    def _touch(self, session: Session) -> None:
+        session.last_used = self.clock()
+        self._sessions.move_to_end(session.id)
+
+
+def _indices(request: Response, hand_size: int) -> List[int]:
+    indices = request.get("indices")
+    if not isinstance(indices, list) or not all(
+        isinstance(i, int) and not isinstance(i, bool) for i in indices
+    ):
+        raise RequestError("indices must be a list of integers")
+    if not all(0 <= i < hand_size for i in indices):
+        raise RequestError(f"indices must be between 0 and {hand_size - 1}")
+    return indices
+
+
+class GameServer:
+    """Serve :class:`SessionManager` sessions over TCP (``host``/``port``) or a Unix socket (``path``)."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: str | None = None,
+        sessions: SessionManager | None = None,
+        sweep_interval: float | None = None,
+        write_high_water: int = WRITE_HIGH_WATER,
+    ) -> None:
+        self.host, self.port, self.path = host, port, path
+        self.write_high_water = write_high_water
+        self.sessions = sessions or SessionManager()
+        self.sweep_interval = sweep_interval or max(1.0, self.sessions.idle_timeout / 4)
+        self.requests = 0
+        self._server: asyncio.AbstractServer | None = None
+        self._sweeper: asyncio.Task | None = None
+        self._ops = {
+            "start": self._start,
+            "state": self._state,
+            "play": self._play,
+            "discard": self._discard,
+            "hint": self._hint,
+            "close": self._close,
+            "ping": lambda request: {},
+        }
+
+    @property
+    def address(self) -> Tuple[str, int] | str:
+        if self.path is not None:
+            return self.path
+        assert self._server is not None, "server is not started"
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def start(self) -> None:
+        if self.path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, self.path, limit=MAX_LINE)
+        else:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port, limit=MAX_LINE)
+        self._sweeper = asyncio.create_task(self._sweep())
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            if self.path is not None and os.path.exists(self.path):
+                os.unlink(self.path)
+        if self.sessions.store is not None:
+            self.sessions.store.flush()
+
+    async def __aenter__(self) -> "GameServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def _sweep(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            self.sessions.evict_idle()
+            if self.sessions.store is not None:
+                self.sessions.store.flush()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        writer.transport.set_write_buffer_limits(high=self.write_high_water)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:  # line longer than MAX_LINE; the stream cannot resync
+                    writer.write(_encode({"ok": False, "error": "Request line too long."}))
+                    break
+                if not line:
+                    break
+                if line.strip():
+                    writer.write(_encode(self.dispatch(line)))
+                    # Returns at once unless the client has stopped reading responses.
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def dispatch(self, line: bytes | str) -> Response:
+        """Handle one request line and return the response object."""
+
+        self.requests += 1
+        request_id = None
+        try:
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise RequestError(f"Invalid JSON: {exc.msg}") from None
+            if not isinstance(request, dict):
+                raise RequestError("A request must be a JSON object.")
+            request_id = request.get("id")
+            handler = self._ops.get(request.get("op"))
+            if handler is None:
+                raise RequestError(f"Unknown op: {request.get('op')!r}")
+            response = {"ok": True, **handler(request)}
+        except ValueError as exc:  # RequestError and SimpleGame's own rule errors
+            response = {"ok": False, "error": str(exc)}
+        except Exception as exc:  # a bug must not drop the connection or the other sessions
+            response = {"ok": False, "error": f"Internal error: {type(exc).__name__}"}
+        if request_id is not None:
+            response["id"] = request_id
+        return response
+
+    def _start(self, request: Response) -> Response:
+        return self.sessions.start(request.get("session"), request.get("seed")).state()
+
+    def _state(self, request: Response) -> Response:
+        return self.sessions.get(request.get("session")).state()
+
+    def _play(self, request: Response) -> Response:
+        session = self.sessions.get(request.get("session"))
+        result = session.game.play_cards(_indices(request, len(session.game.hand)))
+        session.score += result.total
+        self.sessions.save(session)
+        return {
+            "result": {"name": result.name, "chips": result.chips, "multiplier": result.multiplier, "total": result.total},
+            **session.state(),
+        }
+
+    def _discard(self, request: Response) -> Response:
+        session = self.sessions.get(request.get("session"))
+        session.game.discard_cards(_indices(request, len(session.game.hand)))
+        self.sessions.save(session)
+        return session.state()
+
+    def _hint(self, request: Response) -> Response:
+        play = self.sessions.get(request.get("session")).game.best_play()
+        return {"indices": list(play.indices), "name": play.result.name, "total": play.result.total}
+
+    def _close(self, request: Response) -> Response:
+        self.sessions.close(request.get("session"))
+        return {}
+
+
+def _encode(response: Response) -> bytes:
+    return json.dumps(response, ensure_ascii=False, separators=(",", ":")).encode() + b"\n"
+
+
+class GameClient:
+    """Pipelining client: :meth:`send` writes immediately and returns a future for the response."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader, self._writer = reader, writer
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._receiver = asyncio.create_task(self._receive())
+
+    @classmethod
+    async def connect(cls, address: Tuple[str, int] | str) -> "GameClient":
+        if isinstance(address, str):
+            reader, writer = await asyncio.open_unix_connection(address, limit=MAX_LINE)
+        else:
+            reader, writer = await asyncio.open_connection(*address, limit=MAX_LINE)
+        return cls(reader, writer)
+
+    def send(self, op: str, **fields: Any) -> asyncio.Future:
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._writer.write(_encode({"id": request_id, "op": op, **fields}))
+        return future
+
+    async def drain(self) -> None:
+        await self._writer.drain()
+
+    async def request(self, op: str, **fields: Any) -> Response:
+        future = self.send(op, **fields)
+        await self._writer.drain()
+        return await future
+
+    async def close(self) -> None:
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        self._receiver.cancel()
+
+    async def _receive(self) -> None:
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                response = json.loads(line)
+                future = self._pending.pop(response.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("connection closed"))
+            self._pending.clear()
+
+
+# -- load testing -------------------------------------------------------------------
+
+# One full round needs no responses to plan: five plays and two discards always fit
+# an 8-card hand dealt from a fresh deck.
+ROUND = (
+    ("discard", [0, 1]),
+    ("play", [0, 1, 2, 3, 4]),
+    ("state", None),
+    ("play", [0, 1, 2, 3, 4]),
+    ("discard", [5]),
+    ("hint", None),
+    ("play", [0, 1, 2, 3, 4]),
+    ("play", [0, 1, 2, 3, 4]),
+    ("play", [0, 1, 2, 3, 4]),
+)
+
+
+@dataclass(frozen=True)
+class LoadReport:
+    requests: int
+    errors: int
+    elapsed: float
+    latencies: Tuple[float, ...]  # seconds, sorted
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Nearest-rank latency percentile, ``q`` in ``0..100``."""
+
+        if not self.latencies:
+            return 0.0
+        rank = max(1, -(-len(self.latencies) * q // 100))
+        return self.latencies[int(rank) - 1]
+
+
+async def _drive(address: Tuple[str, int] | str, rounds: int, pipeline: int, seed: int, latencies: List[float]) -> int:
+    client = await GameClient.connect(address)
+    window = asyncio.Semaphore(pipeline)
+    errors = 0
+
+    def done(sent: float, future: asyncio.Future) -> None:
+        nonlocal errors
+        latencies.append(time.perf_counter() - sent)
+        window.release()
+        if future.exception() is not None or not future.result().get("ok"):
+            errors += 1
+
+    try:
+        session = (await client.request("start", seed=seed))["session"]
+        latest: asyncio.Future | None = None
+        for round_index in range(rounds):
+            steps: Sequence[Tuple[str, Any]] = ROUND if round_index == 0 else (("start", None),) + ROUND
+            for op, indices in steps:
+                await window.acquire()
+                fields: Dict[str, Any] = {"session": session}
+                if indices is not None:
+                    fields["indices"] = indices
+                if op == "start":
+                    fields["seed"] = seed + round_index
+                latest = client.send(op, **fields)
+                sent = time.perf_counter()
+                latest.add_done_callback(lambda future, sent=sent: done(sent, future))
+                await client.drain()
+        if latest is not None:
+            await asyncio.wait([latest])
+        await client.request("close", session=session)
+    finally:
+        await client.close()
+    return errors
+
+
+async def load_test(
+    address: Tuple[str, int] | str, connections: int = 50, rounds: int = 20, pipeline: int = 8, seed: int = 0
+) -> LoadReport:
+    """Play ``rounds`` scripted rounds on each of ``connections`` connections, ``pipeline`` requests in flight."""
+
+    if connections < 1 or rounds < 1 or pipeline < 1:
+        raise ValueError("connections, rounds and pipeline must be positive")
+    latencies: List[float] = []
+    started = time.perf_counter()
+    errors = await asyncio.gather(
+        *(_drive(address, rounds, pipeline, seed + 1000 * i, latencies) for i in range(connections))
+    )
+    elapsed = time.perf_counter() - started
+    return LoadReport(len(latencies), sum(errors), elapsed, tuple(sorted(latencies)))
+
+
+def format_load_report(report: LoadReport) -> str:
+    percentiles = "  ".join(f"p{q:g} {report.percentile(q) * 1e3:.2f} ms" for q in (50, 90, 99, 99.9))
+    return (
+        f"requests: {report.requests}  errors: {report.errors}  elapsed: {report.elapsed:.2f}s  "
+        f"({report.requests_per_second:,.0f} req/s)\n"
+        f"latency: {percentiles}  max {report.latencies[-1] * 1e3 if report.latencies else 0:.2f} ms"
+    )
+
+
+def _address_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--unix", metavar="PATH", help="use a Unix socket instead of TCP")
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="balatro serve", description="Serve SimpleGame sessions as NDJSON.")
+    _address_options(parser)
+    parser.add_argument("--max-sessions", type=int, default=10_000)
+    parser.add_argument("--idle-timeout", type=float, default=600.0, help="seconds before an idle session is dropped")
+    parser.add_argument("--db", help="persist sessions to this SQLite file so they survive restarts")
+    args = parser.parse_args(argv)
+
+    store = None
+    if args.db:
+        from .store import GameStore
+
+        store = GameStore(args.db, batch_size=1000)
+    sessions = SessionManager(args.max_sessions, args.idle_timeout, store=store)
+    server = GameServer(args.host, args.port, args.unix, sessions)
+
+    async def run() -> None:
+        await server.start()
+        print(f"正在监听 {server.address}（按 Ctrl+C 退出）")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:  # pragma: no cover - interactive
+        pass
+    finally:
+        if store is not None:
+            store.close()
+
+
+def loadtest_main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="balatro loadtest", description="Load-test a balatro game server.")
+    _address_options(parser)
+    parser.add_argument("--local", action="store_true", help="start an in-process server on a free port first")
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=20, help="scripted rounds per connection")
+    parser.add_argument("--pipeline", type=int, default=8, help="requests in flight per connection")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    async def run() -> LoadReport:
+        if not args.local:
+            address = args.unix or (args.host, args.port)
+            return await load_test(address, args.connections, args.rounds, args.pipeline, args.seed)
+        async with GameServer(args.host, 0, args.unix) as server:
+            return await load_test(server.address, args.connections, args.rounds, args.pipeline, args.seed)
+
+    print(format_load_report(asyncio.run(run())))
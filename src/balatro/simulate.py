@@ -0,0 +1,286 @@
+"""Headless simulation of complete :class:`SimpleGame` rounds.
+
+A policy is any callable ``policy(game, rng) -> (kind, indices)`` where
+``kind`` is ``"play"`` or ``"discard"``. Each game ``i`` of a run is dealt
+from ``game_seed(seed, i)``, so a run can be reproduced (or split up) game
+by game. Results are yielded one game at a time and can be streamed to a
+JSON-lines file; only running totals are kept in memory.
+
+Command line: ``balatro sim --games 100000 --policy greedy --out games.jsonl``
+(add ``--workers N`` to spread the games over processes, see
+:mod:`balatro.parallel`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Sequence, TextIO, Tuple
+
+from .cards import Deck
+from .game import SimpleGame
+from .scoring import CATEGORY_IDS, HAND_SCORES
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .replay import ReplayWriter
+    from .store import GameStore
+
+Action = Tuple[str, Sequence[int]]
+Policy = Callable[[SimpleGame, random.Random], Action]
+
+_MASK64 = (1 << 64) - 1
+
+
+def game_seed(seed: int, index: int) -> int:
+    """Derive the seed of game ``index`` from a run seed (SplitMix64 finalizer)."""
+
+    z = (seed * 0x9E3779B97F4A7C15 + (index + 1) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+def random_policy(game: SimpleGame, rng: random.Random) -> Action:
+    """Discard a random 1-5 cards half the time (while allowed), otherwise play 5 at random."""
+
+    if game.discards_remaining > 0 and rng.random() < 0.5:
+        count = rng.randint(1, min(5, len(game.hand)))
+        return "discard", rng.sample(range(len(game.hand)), count)
+    return "play", rng.sample(range(len(game.hand)), 5)
+
+
+def greedy_policy(game: SimpleGame, rng: random.Random) -> Action:
+    """Always play the best five cards in hand."""
+
+    return "play", game.best_play().indices
+
+
+def advisor_policy(game: SimpleGame, rng: random.Random, samples: int = 64) -> Action:
+    """Discard when the Monte Carlo advisor expects it to beat playing now."""
+
+    play = game.best_play()
+    if game.discards_remaining > 0 and game.deck.remaining():
+        from .advisor import advise
+
+        best = advise(game, samples=samples, seed=rng.getrandbits(64))[0]
+        if best.discard and best.mean > play.result.total:
+            return "discard", best.discard
+    return "play", play.indices
+
+
+POLICIES: Dict[str, Policy] = {
+    "random": random_policy,
+    "greedy": greedy_policy,
+    "advisor": advisor_policy,
+}
+
+
+@dataclass(frozen=True)
+class GameRecord:
+    index: int
+    seed: int
+    score: int
+    plays: int
+    discards: int
+    categories: Tuple[int, ...]  # hands played per category id
+
+    def to_json(self) -> str:
+        histogram = {HAND_SCORES[i][0]: count for i, count in enumerate(self.categories) if count}
+        return json.dumps(
+            {
+                "index": self.index,
+                "seed": self.seed,
+                "score": self.score,
+                "plays": self.plays,
+                "discards": self.discards,
+                "categories": histogram,
+            },
+            ensure_ascii=False,
+        )
+
+
+@dataclass
+class SimulationSummary:
+    games: int = 0
+    total_score: int = 0
+    best_score: int = 0
+    categories: List[int] = field(default_factory=lambda: [0] * len(HAND_SCORES))
+    scores: Counter = field(default_factory=Counter)  # final score -> games
+    elapsed: float = 0.0
+
+    def add(self, record: GameRecord) -> None:
+        self.games += 1
+        self.total_score += record.score
+        self.best_score = max(self.best_score, record.score)
+        self.scores[record.score] += 1
+        for i, count in enumerate(record.categories):
+            self.categories[i] += count
+
+    def merge(self, other: "SimulationSummary") -> None:
+        """Fold another partial summary into this one (elapsed time is not summed)."""
+
+        self.games += other.games
+        self.total_score += other.total_score
+        self.best_score = max(self.best_score, other.best_score)
+        self.scores.update(other.scores)
+        for i, count in enumerate(other.categories):
+            self.categories[i] += count
+
+    @property
+    def mean_score(self) -> float:
+        return self.total_score / self.games if self.games else 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+
+def play_game(
+    policy: Policy,
+    seed: int,
+    index: int = 0,
+    game: SimpleGame | None = None,
+    rng: random.Random | None = None,
+    log: "ReplayWriter | GameStore | None" = None,
+) -> GameRecord:
+    """Play one full round: start, then act until no plays are left or the hand is short.
+
+    Passing the ``game`` and ``rng`` of a previous call reuses them (the deck is
+    reset and re-seeded) instead of allocating new ones; the deal is the same.
+    With ``log`` every action is appended to a replay log.
+    """
+
+    if game is None:
+        game = SimpleGame(deck=Deck(random.Random(seed)))
+    else:
+        game.deck.reset(seed)
+    if rng is None:
+        rng = random.Random(seed ^ _MASK64)
+    else:
+        rng.seed(seed ^ _MASK64)
+    game.start()
+    if log is not None:
+        log.start(seed)
+
+    categories = [0] * len(HAND_SCORES)
+    score = plays = discards = 0
+    while game.plays_remaining > 0 and len(game.hand) >= 5:
+        kind, indices = policy(game, rng)
+        if kind == "play":
+            result = game.play_cards(list(indices))
+            categories[CATEGORY_IDS[result.name]] += 1
+            score += result.total
+            plays += 1
+            if log is not None:
+                log.play(indices, result)
+        elif kind == "discard":
+            game.discard_cards(list(indices))
+            discards += 1
+            if log is not None:
+                log.discard(indices)
+        else:
+            raise ValueError(f"Unknown action: {kind!r}")
+
+    if log is not None:
+        log.end(score)
+    return GameRecord(index, seed, score, plays, discards, tuple(categories))
+
+
+def iter_games(
+    games: int, policy: Policy, seed: int = 0, start: int = 0, log: "ReplayWriter | GameStore | None" = None
+) -> Iterator[GameRecord]:
+    """Yield records for games ``start .. start + games - 1`` of the run seeded by ``seed``."""
+
+    game = SimpleGame(deck=Deck(random.Random()))
+    rng = random.Random()
+    for index in range(start, start + games):
+        yield play_game(policy, game_seed(seed, index), index, game, rng, log)
+
+
+def run(
+    games: int,
+    policy: Policy,
+    seed: int = 0,
+    out: TextIO | None = None,
+    log: "ReplayWriter | GameStore | None" = None,
+) -> SimulationSummary:
+    """Play ``games`` games, streaming one JSON line per game to ``out`` if given."""
+
+    summary = SimulationSummary()
+    started = time.perf_counter()
+    for record in iter_games(games, policy, seed, log=log):
+        summary.add(record)
+        if out is not None:
+            out.write(record.to_json() + "\n")
+    summary.elapsed = time.perf_counter() - started
+    return summary
+
+
+def format_summary(summary: SimulationSummary) -> str:
+    lines = [
+        f"games: {summary.games}  mean score: {summary.mean_score:.1f}  best: {summary.best_score}",
+        f"elapsed: {summary.elapsed:.2f}s  ({summary.games_per_second:,.0f} games/s)",
+    ]
+    for (name, _, _), count in zip(HAND_SCORES, summary.categories):
+        lines.append(f"  {name:<16} {count}")
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="balatro sim", description="Run headless SimpleGame simulations.")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="greedy")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="write one JSON line per game to this file ('-' for stdout)")
+    parser.add_argument("--record", help="append a binary replay log of every game to this file")
+    parser.add_argument("--db", help="store every game and hand in this SQLite database")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (0 = one per CPU)")
+    parser.add_argument("--chunk-size", type=int, help="games per worker task (default: auto-tuned)")
+    parser.add_argument("--scaling", action="store_true", help="report games/s for 1..--workers processes")
+    args = parser.parse_args(argv)
+
+    if args.workers != 1 or args.scaling:
+        if args.out or args.record or args.db:
+            parser.error("--out, --record and --db stream per-game records and need --workers 1")
+        from .parallel import format_scaling, run_parallel, scaling_report
+
+        workers = args.workers or None
+        if args.scaling:
+            print(format_scaling(scaling_report(args.games, args.policy, args.seed, workers)))
+        else:
+            print(format_summary(run_parallel(args.games, args.policy, args.seed, workers, args.chunk_size)))
+        return
+
+    if args.record and args.db:
+        parser.error("--record and --db cannot be combined")
+    policy = POLICIES[args.policy]
+    log = None
+    if args.record:
+        from .replay import ReplayWriter
+
+        log = ReplayWriter(args.record)
+    elif args.db:
+        from .store import GameStore
+
+        log = GameStore(args.db, policy=args.policy)
+    try:
+        if args.out == "-":
+            summary = run(args.games, policy, args.seed, sys.stdout, log)
+        elif args.out:
+            with open(args.out, "w", encoding="utf-8") as out:
+                summary = run(args.games, policy, args.seed, out, log)
+        else:
+            summary = run(args.games, policy, args.seed, log=log)
+    finally:
+        if log is not None:
+            log.close()
+    print(format_summary(summary), file=sys.stderr if args.out == "-" else sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
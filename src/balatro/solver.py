@@ -0,0 +1,298 @@
+"""Find the highest-scoring five cards in a hand.
+
+Scores depend only on the hand category, so instead of evaluating every
+five-card subset the solver walks the categories from the highest total
+down and asks whether the hand's rank/suit counts can form each one. The
+first category that can be formed gives the answer; the chosen cards are
+checked with the table evaluator before being returned.
+
+That search relies on stronger categories never scoring less than weaker
+ones: a builder may pick cards that happen to form a stronger category
+(the top five "high cards" may be a straight), which only helps when the
+stronger category scores at least as much. Custom rules that break this
+order (:attr:`balatro.rules.CompiledRules.monotone`) are solved by trying
+every five-card subset instead.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import combinations
+from typing import TYPE_CHECKING, Callable, Dict, List, Sequence, Tuple
+
+from .cards import RANK_SHIFT, RANKS, SUIT_MASK, Card
+from .scoring import HAND_RESULTS, HandResult
+from .tables import STRAIGHT_MASKS, classify_codes
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .rules import Rules
+
+# Straight masks from the highest (A-high) to the wheel, paired with their ranks.
+_STRAIGHTS: Tuple[Tuple[int, Tuple[int, ...]], ...] = tuple(
+    sorted(
+        ((mask, tuple(r for r in range(len(RANKS)) if mask >> r & 1)) for mask in STRAIGHT_MASKS),
+        key=lambda item: item[0] if item[0] != 0b1000000001111 else 0,
+        reverse=True,
+    )
+)
+
+
+@dataclass(frozen=True)
+class Play:
+    """Indices into the hand (ascending) and the resulting score."""
+
+    indices: Tuple[int, ...]
+    result: HandResult
+
+
+class _HandIndex:
+    """Positions of the hand's cards grouped by rank and by suit, high ranks first."""
+
+    __slots__ = ("codes", "by_rank", "by_suit", "order", "max_rank", "max_suit", "pairs")
+
+    def __init__(self, codes: Sequence[int]) -> None:
+        self.codes = codes
+        self.order = order = sorted(range(len(codes)), key=codes.__getitem__, reverse=True)
+        by_rank: Dict[int, List[int]] = {}
+        by_suit: Dict[int, List[int]] = {}
+        for i in order:
+            code = codes[i]
+            rank = code >> RANK_SHIFT
+            if rank in by_rank:
+                by_rank[rank].append(i)
+            else:
+                by_rank[rank] = [i]
+            suit = code & SUIT_MASK
+            if suit in by_suit:
+                by_suit[suit].append(i)
+            else:
+                by_suit[suit] = [i]
+        self.by_rank = by_rank
+        self.by_suit = by_suit
+        # Cheap gates so builders for unreachable categories return immediately.
+        rank_sizes = list(map(len, by_rank.values()))
+        self.max_rank = max(rank_sizes)
+        self.pairs = len(rank_sizes) - rank_sizes.count(1)
+        self.max_suit = max(map(len, by_suit.values()))
+
+    def fill(self, chosen: List[int], exclude_ranks: Sequence[int] = ()) -> List[int] | None:
+        """Top ``chosen`` up to five with one card from each other rank, high first."""
+
+        picked = list(chosen)
+        for rank, positions in self.by_rank.items():
+            if len(picked) == 5:
+                break
+            if rank not in exclude_ranks:
+                picked.append(positions[0])
+        return picked if len(picked) == 5 else None
+
+
+def _straight_from(index: _HandIndex, positions: Sequence[int]) -> List[int] | None:
+    by_rank: Dict[int, int] = {}
+    mask = 0
+    codes = index.codes
+    for i in positions:
+        rank = codes[i] >> RANK_SHIFT
+        by_rank.setdefault(rank, i)
+        mask |= 1 << rank
+    for straight_mask, ranks in _STRAIGHTS:
+        if mask & straight_mask == straight_mask:
+            return [by_rank[rank] for rank in ranks]
+    return None
+
+
+def _straight_flush(index: _HandIndex) -> List[int] | None:
+    if index.max_suit < 5:
+        return None
+    for positions in index.by_suit.values():
+        if len(positions) >= 5:
+            found = _straight_from(index, positions)
+            if found:
+                return found
+    return None
+
+
+def _four_of_a_kind(index: _HandIndex) -> List[int] | None:
+    if index.max_rank < 4:
+        return None
+    for rank, positions in index.by_rank.items():
+        if len(positions) == 4:
+            return index.fill(positions, exclude_ranks=(rank,))
+    return None
+
+
+def _full_house(index: _HandIndex) -> List[int] | None:
+    if index.max_rank < 3 or index.pairs < 2:
+        return None
+    trips = [rank for rank, positions in index.by_rank.items() if len(positions) >= 3]
+    for trip in trips:
+        for rank, positions in index.by_rank.items():
+            if rank != trip and len(positions) >= 2:
+                return index.by_rank[trip][:3] + positions[:2]
+    return None
+
+
+def _flush(index: _HandIndex) -> List[int] | None:
+    if index.max_suit < 5:
+        return None
+    for positions in index.by_suit.values():
+        if len(positions) >= 5:
+            return positions[:5]
+    return None
+
+
+def _straight(index: _HandIndex) -> List[int] | None:
+    if len(index.by_rank) < 5:
+        return None
+    return _straight_from(index, index.order)
+
+
+def _three_of_a_kind(index: _HandIndex) -> List[int] | None:
+    if index.max_rank < 3:
+        return None
+    for rank, positions in index.by_rank.items():
+        if len(positions) >= 3:
+            return index.fill(positions[:3], exclude_ranks=(rank,))
+    return None
+
+
+def _two_pair(index: _HandIndex) -> List[int] | None:
+    if index.pairs < 2:
+        return None
+    pairs = [rank for rank, positions in index.by_rank.items() if len(positions) >= 2][:2]
+    chosen = index.by_rank[pairs[0]][:2] + index.by_rank[pairs[1]][:2]
+    return index.fill(chosen, exclude_ranks=pairs) or chosen + [
+        next(i for i in index.order if i not in chosen)
+    ]
+
+
+def _one_pair(index: _HandIndex) -> List[int] | None:
+    if index.max_rank < 2:
+        return None
+    for rank, positions in index.by_rank.items():
+        if len(positions) >= 2:
+            return index.fill(positions[:2], exclude_ranks=(rank,))
+    return None
+
+
+def _high_card(index: _HandIndex) -> List[int] | None:
+    return index.fill([])
+
+
+_BUILDERS = {
+    "Straight Flush": _straight_flush,
+    "Four of a Kind": _four_of_a_kind,
+    "Full House": _full_house,
+    "Flush": _flush,
+    "Straight": _straight,
+    "Three of a Kind": _three_of_a_kind,
+    "Two Pair": _two_pair,
+    "One Pair": _one_pair,
+    "High Card": _high_card,
+}
+
+# Categories by descending score; ties keep HAND_SCORES order (stronger first).
+_SEARCH_ORDER = tuple(
+    sorted(range(len(HAND_RESULTS)), key=lambda i: (HAND_RESULTS[i].total, i), reverse=True)
+)
+
+
+def _monotone(results: Sequence[HandResult]) -> bool:
+    return all(results[i].total <= results[i + 1].total for i in range(len(HAND_RESULTS) - 1))
+
+
+def _exhaustive(
+    codes: Sequence[int],
+    results: Sequence[HandResult] = HAND_RESULTS,
+    classify: Callable[[Sequence[int]], int] = classify_codes,
+) -> Play:
+    best: Play | None = None
+    for indices in combinations(range(len(codes)), 5):
+        result = results[classify([codes[i] for i in indices])]
+        if best is None or result.total > best.result.total:
+            best = Play(indices, result)
+    assert best is not None
+    return best
+
+
+def best_play_codes(codes: Sequence[int], rules: "Rules | None" = None) -> Play:
+    """Return the best five of ``codes`` (compact card codes, at least five).
+
+    With ``rules`` the hand is scored by their compiled tables; rules dealing
+    from several decks may hold duplicate cards and fall back to trying
+    every five-card subset.
+    """
+
+    if len(codes) < 5:
+        raise ValueError("At least 5 cards are needed to play a hand.")
+
+    results, order = HAND_RESULTS, _SEARCH_ORDER
+    if rules is not None:
+        compiled = rules.compile()
+        if rules.decks != 1:
+            from .rules import classify_extended
+
+            return _exhaustive(codes, compiled.results, classify_extended)
+        if not compiled.monotone:
+            return _exhaustive(codes, compiled.results)
+        results, order = compiled.results, compiled.search_order
+
+    index = _HandIndex(codes)
+    for category in order:
+        chosen = _BUILDERS[HAND_RESULTS[category].name](index)
+        if chosen is None:
+            continue
+        found = classify_codes([codes[i] for i in chosen])
+        if results[found].total >= results[category].total:
+            return Play(tuple(sorted(chosen)), results[found])
+    # Only reachable if a builder picked cards that upgrade into a lower-scoring category.
+    return _exhaustive(codes, results)
+
+
+def play_options(codes: Sequence[int]) -> Tuple[Tuple[int, int, Tuple[int, ...]], ...]:
+    """Every category builder's pick for ``codes`` as ``(category, found, indices)``.
+
+    The picks do not depend on scoring, so they can be computed once per hand
+    and handed to :func:`choose_play` under any single-deck rules.
+    """
+
+    if len(codes) < 5:
+        raise ValueError("At least 5 cards are needed to play a hand.")
+
+    index = _HandIndex(codes)
+    options = []
+    for category, result in enumerate(HAND_RESULTS):
+        chosen = _BUILDERS[result.name](index)
+        if chosen is not None:
+            found = classify_codes([codes[i] for i in chosen])
+            options.append((category, found, tuple(sorted(chosen))))
+    return tuple(options)
+
+
+def choose_play(
+    codes: Sequence[int],
+    options: Sequence[Tuple[int, int, Tuple[int, ...]]],
+    results: Sequence[HandResult] = HAND_RESULTS,
+    order: Sequence[int] = _SEARCH_ORDER,
+) -> Play:
+    """The play :func:`best_play_codes` makes, given the hand's :func:`play_options`.
+
+    The picks only settle the answer when ``results`` are monotone in category
+    strength; otherwise every five-card subset is tried.
+    """
+
+    if not _monotone(results):
+        return _exhaustive(codes, results)
+    picks = {category: (found, indices) for category, found, indices in options}
+    for category in order:
+        if category in picks:
+            found, indices = picks[category]
+            if results[found].total >= results[category].total:
+                return Play(indices, results[found])
+    return _exhaustive(codes, results)
+
+
+def best_play(hand: Sequence[Card], rules: "Rules | None" = None) -> Play:
+    """Return the best five cards of ``hand`` as indices plus their score."""
+
+    return best_play_codes([card.code for card in hand], rules)
@@ -0,0 +1,303 @@
+"""SQLite storage for game sessions and played-hand history.
+
+:class:`GameStore` keeps three tables:
+
+* ``sessions`` - the full state of live :class:`SimpleGame` sessions (hand,
+  deck order and cursor, random generator state, counters, score), so a
+  restarted server can resume them (:meth:`GameStore.save_session` /
+  :meth:`GameStore.load_session`);
+* ``games`` - one row per finished game with its seed, policy and score;
+* ``hands`` - one row per play or discard, with the scored ``HandResult``.
+
+The database runs in WAL mode with ``synchronous=NORMAL``. Writes are
+buffered in memory and inserted with ``executemany`` on fixed SQL text
+(which sqlite3 prepares once and reuses), one transaction per
+``batch_size`` hands, so recording costs microseconds per hand. A store
+has the same ``start``/``play``/``discard``/``end`` methods as
+:class:`balatro.replay.ReplayWriter` and can be passed as the ``log`` of
+:func:`balatro.simulate.run`.
+
+Leaderboards read the ``games (policy, score)`` index and category
+histograms the covering ``hands (kind, category)`` index.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .cards import Deck
+from .game import GameSnapshot, SimpleGame
+from .replay import DISCARD, PLAY, indices_to_mask
+from .rules import ALL_CATEGORY_IDS, CATEGORY_NAMES
+from .scoring import HandResult
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    seed INTEGER NOT NULL,
+    policy TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    plays INTEGER NOT NULL,
+    discards INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS hands (
+    game_id INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    kind INTEGER NOT NULL,
+    mask INTEGER NOT NULL,
+    category INTEGER,
+    chips INTEGER NOT NULL,
+    multiplier INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    PRIMARY KEY (game_id, seq)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    seed INTEGER,
+    hand BLOB NOT NULL,
+    deck BLOB NOT NULL,
+    cursor INTEGER NOT NULL,
+    shuffled INTEGER NOT NULL,
+    rng TEXT,
+    plays_remaining INTEGER NOT NULL,
+    discards_remaining INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_score ON games (score DESC);
+CREATE INDEX IF NOT EXISTS games_policy_score ON games (policy, score DESC);
+CREATE INDEX IF NOT EXISTS hands_kind_category ON hands (kind, category);
+CREATE INDEX IF NOT EXISTS sessions_updated ON sessions (updated);
+"""
+
+_INSERT_GAME = "INSERT INTO games (id, seed, policy, score, plays, discards) VALUES (?, ?, ?, ?, ?, ?)"
+_INSERT_HAND = (
+    "INSERT INTO hands (game_id, seq, kind, mask, category, chips, multiplier, total) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_UPSERT_SESSION = (
+    "INSERT OR REPLACE INTO sessions (id, seed, hand, deck, cursor, shuffled, rng, plays_remaining,"
+    " discards_remaining, score, updated) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+@dataclass(frozen=True)
+class LeaderboardEntry:
+    game_id: int
+    seed: int
+    policy: str
+    score: int
+
+
+@dataclass(frozen=True)
+class StoredSession:
+    game: SimpleGame
+    seed: int | None
+    score: int
+
+
+class GameStore:
+    """Batched SQLite writer and query helper; also usable as a simulator ``log``."""
+
+    def __init__(self, path: str | os.PathLike[str] = ":memory:", batch_size: int = 10_000, policy: str = "") -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        self.path = path
+        self.batch_size = batch_size
+        self.policy = policy
+        # Autocommit mode: transactions are opened explicitly around each batch.
+        self._db = sqlite3.connect(path, isolation_level=None, cached_statements=32)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if version == 0:
+            self._db.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        elif version != SCHEMA_VERSION:
+            self._db.close()
+            raise ValueError(f"Unsupported store schema version {version}")
+        self._next_game = self._db.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM games").fetchone()[0]
+        self._games: List[Tuple[Any, ...]] = []
+        self._hands: List[Tuple[Any, ...]] = []
+        self._sessions: Dict[str, Tuple[Any, ...]] = {}
+        self._game: List[Any] | None = None  # [id, seed, seq, plays, discards] of the game being logged
+
+    # -- simulator log interface ---------------------------------------------------
+
+    def start(self, seed: int) -> None:
+        self._game = [self._next_game, _signed(seed), 0, 0, 0]
+        self._next_game += 1
+
+    def play(self, indices: Sequence[int], result: HandResult) -> None:
+        game = self._game
+        assert game is not None, "start() must be called first"
+        self._hands.append(
+            (game[0], game[2], PLAY, indices_to_mask(indices), ALL_CATEGORY_IDS[result.name],
+             result.chips, result.multiplier, result.total)
+        )
+        game[2] += 1
+        game[3] += 1
+
+    def discard(self, indices: Sequence[int]) -> None:
+        game = self._game
+        assert game is not None, "start() must be called first"
+        self._hands.append((game[0], game[2], DISCARD, indices_to_mask(indices), None, 0, 0, 0))
+        game[2] += 1
+        game[4] += 1
+
+    def end(self, score: int) -> None:
+        game = self._game
+        assert game is not None, "start() must be called first"
+        self._games.append((game[0], game[1], self.policy, score, game[3], game[4]))
+        self._game = None
+        # Only flush at game boundaries so a game and its hands commit together.
+        if len(self._hands) >= self.batch_size or len(self._games) >= self.batch_size:
+            self.flush()
+
+    # -- sessions ------------------------------------------------------------------
+
+    def save_session(self, session_id: str, game: SimpleGame, score: int = 0, seed: int | None = None) -> None:
+        """Buffer the state of ``game``; repeated saves before a flush keep only the last."""
+
+        snapshot = game.snapshot()
+        codes, cursor, shuffled, rng_state = snapshot.deck
+        self._sessions[session_id] = (
+            session_id, _signed(seed) if seed is not None else None, snapshot.hand, codes, cursor, int(shuffled),
+            json.dumps(rng_state) if rng_state is not None else None,
+            snapshot.plays_remaining, snapshot.discards_remaining, score, time.time(),
+        )
+        if len(self._sessions) >= self.batch_size:
+            self.flush()
+
+    def load_session(self, session_id: str) -> StoredSession | None:
+        """Rebuild a saved session, or ``None`` if there is none."""
+
+        pending = self._sessions.get(session_id)
+        row = pending[1:10] if pending is not None else self._db.execute(
+            "SELECT seed, hand, deck, cursor, shuffled, rng, plays_remaining, discards_remaining, score"
+            " FROM sessions WHERE id = ?",
+            (session_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        seed, hand, deck, cursor, shuffled, rng, plays, discards, score = row
+        rng_state = _rng_state(json.loads(rng)) if rng is not None else None
+        game = SimpleGame(deck=Deck(random.Random()))
+        game.restore(GameSnapshot(bytes(hand), (bytes(deck), cursor, bool(shuffled), rng_state), plays, discards))
+        return StoredSession(game, _unsigned(seed) if seed is not None else None, score)
+
+    def delete_session(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+        self._db.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+
+    # -- writing -------------------------------------------------------------------
+
+    def flush(self) -> None:
+        """Write all buffered rows in one transaction."""
+
+        if not (self._games or self._hands or self._sessions):
+            return
+        db = self._db
+        db.execute("BEGIN")
+        try:
+            db.executemany(_INSERT_GAME, self._games)
+            db.executemany(_INSERT_HAND, self._hands)
+            db.executemany(_UPSERT_SESSION, self._sessions.values())
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+        self._games.clear()
+        self._hands.clear()
+        self._sessions.clear()
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._db.close()
+
+    def __enter__(self) -> "GameStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # -- queries -------------------------------------------------------------------
+
+    def game_count(self) -> int:
+        self.flush()
+        return self._db.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+    def leaderboard(self, limit: int = 10, policy: str | None = None) -> List[LeaderboardEntry]:
+        """Highest-scoring games, optionally for one policy."""
+
+        self.flush()
+        if policy is None:
+            rows = self._db.execute(
+                "SELECT id, seed, policy, score FROM games ORDER BY score DESC, id LIMIT ?", (limit,)
+            )
+        else:
+            rows = self._db.execute(
+                "SELECT id, seed, policy, score FROM games WHERE policy = ? ORDER BY score DESC, id LIMIT ?",
+                (policy, limit),
+            )
+        return [LeaderboardEntry(game_id, _unsigned(seed), name, score) for game_id, seed, name, score in rows]
+
+    def category_histogram(self, policy: str | None = None) -> Dict[str, int]:
+        """Number of played hands per category, by name (categories never played are omitted)."""
+
+        self.flush()
+        if policy is None:
+            rows = self._db.execute(
+                "SELECT category, COUNT(*) FROM hands WHERE kind = ? GROUP BY category", (PLAY,)
+            )
+        else:
+            rows = self._db.execute(
+                "SELECT h.category, COUNT(*) FROM hands h JOIN games g ON g.id = h.game_id"
+                " WHERE h.kind = ? AND g.policy = ? GROUP BY h.category",
+                (PLAY, policy),
+            )
+        return {CATEGORY_NAMES[category]: count for category, count in sorted(rows)}
+
+    def hands(self, game_id: int) -> List[Tuple[int, int, int | None, int]]:
+        """``(kind, mask, category, total)`` of every action of a game, in order."""
+
+        self.flush()
+        return list(
+            self._db.execute(
+                "SELECT kind, mask, category, total FROM hands WHERE game_id = ? ORDER BY seq", (game_id,)
+            )
+        )
+
+
+def _signed(value: int) -> int:
+    # Seeds are unsigned 64-bit; SQLite integers are signed.
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+def _rng_state(value: Any) -> Any:
+    # random.Random.setstate needs tuples where JSON produced lists.
+    return tuple(_rng_state(item) for item in value) if isinstance(value, list) else value
+
+
+def format_stats(store: GameStore, limit: int = 10, policy: str | None = None) -> str:
+    lines = [f"games: {store.game_count()}"]
+    for rank, entry in enumerate(store.leaderboard(limit, policy), 1):
+        lines.append(f"{rank:>3}. {entry.score:>7}  game {entry.game_id}  seed {entry.seed}  {entry.policy}")
+    histogram = store.category_histogram(policy)
+    played = sum(histogram.values())
+    for name, count in histogram.items():
+        lines.append(f"  {name:<16} {count:>10}  {count / played:7.2%}")
+    return "\n".join(lines)
@@ -0,0 +1,405 @@
+"""Parameter sweeps over scoring rules and game limits.
+
+A sweep plays every configuration headlessly against the same seeded
+deals: game ``i`` of every configuration is dealt from
+``game_seed(seed, i)``, so configurations are compared on identical card
+sequences. Configurations come from a full :func:`grid` or a
+:func:`random_configs` sample of a parameter space such as::
+
+    {"Flush.chips": [50, 65, 80], "Flush.mult": [3, 4, 5], "max_discards": [3, 5]}
+
+Parameters are ``max_plays``, ``max_discards``, ``hand_size``, ``decks``
+and ``<category>.chips`` / ``<category>.mult`` for any category of
+:data:`balatro.rules.CATEGORY_NAMES`.
+
+Only chips and multipliers differ between most configurations, so the
+expensive step - working out which five cards make each category in a
+hand (:func:`balatro.solver.play_options`, or the category of every
+five-card subset when cards repeat or scores are out of category order) -
+is computed once per distinct hand and shared by every configuration that
+reaches it; each configuration then only ranks the candidates by its own
+scores.
+
+Games are played in batches. After each batch a configuration whose
+confidence interval lies entirely below the leader's is stopped, and the
+sweep ends once the intervals of all remaining configurations are
+disjoint, or only the leader is left (or ``games`` is reached). A sweep
+of a single configuration always plays all ``games``. One CSV row per configuration is
+streamed to ``out`` as soon as it finishes.
+
+Command line: ``balatro sweep -p Flush.chips=50,65,80 -p max_discards=3,5 --games 2000 --out sweep.csv``
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import math
+import random
+import sys
+from dataclasses import dataclass, field, replace
+from itertools import combinations, product
+from statistics import NormalDist
+from typing import Callable, Dict, Iterable, List, Mapping, Sequence, TextIO, Tuple
+
+from .cards import Deck
+from .game import SimpleGame
+from .rules import (
+    ALL_CATEGORY_IDS,
+    CATEGORY_NAMES,
+    DEFAULT_RULES,
+    EXTRA_HAND_SCORES,
+    CompiledRules,
+    Rules,
+    classify_extended,
+)
+from .simulate import Action, game_seed
+from .solver import Play, choose_play, play_options
+
+OPTIONS = ("max_plays", "max_discards", "hand_size", "decks")
+_SCORE_FIELDS = {"chips": 1, "mult": 2}
+_TWO_PAIR = ALL_CATEGORY_IDS["Two Pair"]
+_EXTRA_DEFAULTS = {name: (chips, mult) for name, chips, mult in EXTRA_HAND_SCORES}
+
+Params = Tuple[Tuple[str, int], ...]
+SweepPolicy = Callable[[SimpleGame, Play], Action]
+
+
+@dataclass(frozen=True)
+class Config:
+    """One point of the parameter space and the rules it produces."""
+
+    index: int
+    params: Params
+    rules: Rules
+
+
+def apply_params(base: Rules, params: Iterable[Tuple[str, int]]) -> Rules:
+    """Return ``base`` with each ``(name, value)`` parameter applied."""
+
+    options: Dict[str, int] = {}
+    scores = {name: [chips, mult] for name, chips, mult in base.scores}
+    for name, value in params:
+        if name in OPTIONS:
+            options[name] = int(value)
+            continue
+        category, _, part = name.rpartition(".")
+        if category not in ALL_CATEGORY_IDS or part not in _SCORE_FIELDS:
+            raise ValueError(f"Unknown sweep parameter: {name!r}")
+        if category not in scores:
+            # Scoring an extra category enables it, starting from its suggested score.
+            scores[category] = list(_EXTRA_DEFAULTS[category])
+        scores[category][_SCORE_FIELDS[part] - 1] = int(value)
+    return replace(base, scores=tuple((name, chips, mult) for name, (chips, mult) in scores.items()), **options)
+
+
+def grid(space: Mapping[str, Sequence[int]], base: Rules = DEFAULT_RULES) -> List[Config]:
+    """Every combination of the values in ``space``, in row-major order."""
+
+    names = list(space)
+    return [
+        Config(index, tuple(zip(names, values)), apply_params(base, zip(names, values)))
+        for index, values in enumerate(product(*(space[name] for name in names)))
+    ]
+
+
+def random_configs(
+    space: Mapping[str, Sequence[int]], count: int, seed: int | None = None, base: Rules = DEFAULT_RULES
+) -> List[Config]:
+    """``count`` distinct configurations drawn uniformly from ``space`` (at most the grid size)."""
+
+    names = list(space)
+    size = math.prod(len(space[name]) for name in names)
+    rng = random.Random(seed)
+    chosen: Dict[Tuple[int, ...], None] = {}
+    while len(chosen) < min(count, size):
+        chosen.setdefault(tuple(rng.choice(space[name]) for name in names))
+    return [
+        Config(index, tuple(zip(names, values)), apply_params(base, zip(names, values)))
+        for index, values in enumerate(chosen)
+    ]
+
+
+def greedy(game: SimpleGame, play: Play) -> Action:
+    """Always play the best five cards."""
+
+    return "play", play.indices
+
+
+def discard_weak(game: SimpleGame, play: Play) -> Action:
+    """Discard the cards outside the best five while it is weaker than Two Pair."""
+
+    if game.discards_remaining > 0 and game.deck.remaining() and ALL_CATEGORY_IDS[play.result.name] < _TWO_PAIR:
+        rest = [i for i in range(len(game.hand)) if i not in play.indices][:5]
+        if rest:
+            return "discard", rest
+    return "play", play.indices
+
+
+POLICIES: Dict[str, SweepPolicy] = {"greedy": greedy, "discard": discard_weak}
+
+
+@dataclass
+class ConfigStats:
+    """Running score statistics of one configuration."""
+
+    config: Config
+    games: int = 0
+    total: int = 0
+    best: int = 0
+    status: str = "running"
+    categories: List[int] = field(default_factory=lambda: [0] * len(CATEGORY_NAMES))
+    _mean: float = field(default=0.0, repr=False)
+    _m2: float = field(default=0.0, repr=False)
+
+    def add(self, score: int) -> None:
+        # Welford's update keeps the variance stable over long runs.
+        self.games += 1
+        self.total += score
+        self.best = max(self.best, score)
+        delta = score - self._mean
+        self._mean += delta / self.games
+        self._m2 += delta * (score - self._mean)
+
+    @property
+    def mean(self) -> float:
+        return self._mean
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self._m2 / (self.games - 1)) if self.games > 1 else 0.0
+
+    def interval(self, z: float) -> Tuple[float, float]:
+        half = z * self.stdev / math.sqrt(self.games) if self.games else math.inf
+        return self.mean - half, self.mean + half
+
+
+def csv_header(space_names: Sequence[str]) -> List[str]:
+    return (
+        ["config", *space_names, "games", "mean", "stdev", "ci_low", "ci_high", "best", "status"]
+        + list(CATEGORY_NAMES)
+    )
+
+
+def csv_row(stats: ConfigStats, z: float) -> List[object]:
+    low, high = stats.interval(z)
+    return [
+        stats.config.index,
+        *(value for _, value in stats.config.params),
+        stats.games,
+        f"{stats.mean:.3f}",
+        f"{stats.stdev:.3f}",
+        f"{low:.3f}",
+        f"{high:.3f}",
+        stats.best,
+        stats.status,
+        *stats.categories,
+    ]
+
+
+class _Runner:
+    """Plays configurations on shared deals, sharing per-hand play options."""
+
+    def __init__(self, policy: SweepPolicy) -> None:
+        self.policy = policy
+        self.options: Dict[Tuple[bool, Tuple[int, ...]], object] = {}
+        self.games: Dict[Config, SimpleGame] = {}
+        self.hits = self.misses = 0
+
+    def best_play(self, codes: Tuple[int, ...], compiled: CompiledRules) -> Play:
+        # Duplicate cards, or scores out of category order, need every subset's category.
+        exhaustive = compiled.rules.decks != 1 or not compiled.monotone
+        key = (exhaustive, codes)
+        options = self.options.get(key)
+        if options is None:
+            self.misses += 1
+            options = self.options[key] = _extended_options(codes) if exhaustive else play_options(codes)
+        else:
+            self.hits += 1
+        if exhaustive:
+            return _choose_extended(options, compiled)
+        return choose_play(codes, options, compiled.results, compiled.search_order)
+
+    def play(self, stats: ConfigStats, seed: int) -> None:
+        config = stats.config
+        game = self.games.get(config)
+        if game is None:
+            game = self.games[config] = SimpleGame(deck=Deck(random.Random()), rules=config.rules)
+        compiled = config.rules.compile()
+        game.deck.reset(seed)
+        game.start()
+        score = 0
+        while game.plays_remaining > 0 and len(game.hand) >= 5:
+            play = self.best_play(tuple(card.code for card in game.hand), compiled)
+            kind, indices = self.policy(game, play)
+            if kind == "discard":
+                game.discard_cards(list(indices))
+                continue
+            result = game.play_cards(list(indices))
+            stats.categories[ALL_CATEGORY_IDS[result.name]] += 1
+            score += result.total
+        stats.add(score)
+
+
+def _extended_options(codes: Sequence[int]) -> Tuple[Tuple[int, Tuple[int, ...]], ...]:
+    """First five-card subset of each category, in combination order (duplicates allowed)."""
+
+    first: Dict[int, Tuple[int, ...]] = {}
+    for indices in combinations(range(len(codes)), 5):
+        category = classify_extended([codes[i] for i in indices])
+        first.setdefault(category, indices)
+    return tuple(first.items())
+
+
+def _choose_extended(options: Sequence[Tuple[int, Tuple[int, ...]]], compiled: CompiledRules) -> Play:
+    # Mirrors the exhaustive solver: the earliest subset with the strictly highest total.
+    best: Play | None = None
+    for category, indices in sorted(options, key=lambda option: option[1]):
+        result = compiled.results[category]
+        if best is None or result.total > best.result.total:
+            best = Play(indices, result)
+    assert best is not None
+    return best
+
+
+def sweep(
+    configs: Sequence[Config],
+    games: int,
+    seed: int = 0,
+    policy: str | SweepPolicy = "greedy",
+    batch: int = 200,
+    confidence: float = 0.95,
+    early_stop: bool = True,
+    out: TextIO | None = None,
+) -> List[ConfigStats]:
+    """Play up to ``games`` shared deals per configuration and return their statistics.
+
+    With ``early_stop`` a configuration stops (status ``"stopped"``) once its
+    confidence interval lies below the leader's, and the sweep ends when all
+    remaining intervals are disjoint or only the leader is left; a single
+    configuration plays all ``games``. ``out`` receives a CSV header and then
+    one row per configuration as it finishes.
+    """
+
+    if not configs:
+        raise ValueError("A sweep needs at least one configuration.")
+    if games < 1 or batch < 1:
+        raise ValueError("games and batch must be positive")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    runner = _Runner(POLICIES[policy] if isinstance(policy, str) else policy)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    writer = csv.writer(out) if out is not None else None
+    if writer is not None:
+        writer.writerow(csv_header([name for name, _ in configs[0].params]))
+
+    def finish(stats: ConfigStats, status: str) -> None:
+        stats.status = status
+        if writer is not None:
+            writer.writerow(csv_row(stats, z))
+            out.flush()
+
+    results = [ConfigStats(config) for config in configs]
+    active = list(results)
+    played = 0
+    while active and played < games:
+        seeds = [game_seed(seed, index) for index in range(played, min(played + batch, games))]
+        # Configurations play the same deal back to back, so the options cache only
+        # needs to hold one batch of deals.
+        for deal in seeds:
+            for stats in active:
+                runner.play(stats, deal)
+        runner.options.clear()
+        played += len(seeds)
+        if early_stop and played < games and played >= 2 * batch:
+            leader_low = max(stats.interval(z)[0] for stats in active)
+            for stats in active:
+                if stats.interval(z)[1] < leader_low:
+                    finish(stats, "stopped")
+            active = [stats for stats in active if stats.status == "running"]
+            # A lone interval is trivially disjoint: only stop once it has outlasted
+            # rivals, so a single-configuration sweep plays all of its games.
+            if len(active) > 1 and _separated(active, z) or len(active) == 1 < len(results):
+                break
+    for stats in active:
+        finish(stats, "complete" if played >= games else "separated")
+    return results
+
+
+def _separated(active: Sequence[ConfigStats], z: float) -> bool:
+    """True when no two confidence intervals overlap."""
+
+    ordered = sorted(stats.interval(z) for stats in active)
+    return all(high < low for (_, high), (low, _) in zip(ordered, ordered[1:]))
+
+
+def format_results(results: Sequence[ConfigStats], top: int = 10) -> str:
+    ranked = sorted(results, key=lambda stats: stats.mean, reverse=True)[:top]
+    lines = []
+    for stats in ranked:
+        params = " ".join(f"{name}={value}" for name, value in stats.config.params)
+        lines.append(
+            f"#{stats.config.index:<4} mean {stats.mean:9.1f} ± {stats.stdev:7.1f}  games {stats.games:<6} "
+            f"{stats.status:<9} {params}"
+        )
+    return "\n".join(lines)
+
+
+def parse_space(items: Sequence[str]) -> Dict[str, List[int]]:
+    """Parse ``NAME=V1,V2,...`` or ``NAME=LO:HI[:STEP]`` items into a parameter space."""
+
+    space: Dict[str, List[int]] = {}
+    for item in items:
+        name, sep, values = item.partition("=")
+        if not sep or not values:
+            raise ValueError(f"Expected NAME=VALUES, got {item!r}")
+        if ":" in values:
+            bounds = [int(part) for part in values.split(":")]
+            if len(bounds) not in (2, 3):
+                raise ValueError(f"Expected LO:HI[:STEP], got {values!r}")
+            space[name.strip()] = list(range(bounds[0], bounds[1] + 1, bounds[2] if len(bounds) == 3 else 1))
+        else:
+            space[name.strip()] = [int(part) for part in values.split(",")]
+    return space
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="balatro sweep", description="Sweep scoring rules over shared deals.")
+    parser.add_argument(
+        "-p", "--param", action="append", default=[], metavar="NAME=VALUES",
+        help="parameter values, e.g. Flush.chips=50,65,80 or max_discards=2:5 (repeatable)",
+    )
+    parser.add_argument("--random", type=int, metavar="N", help="sample N configurations instead of the full grid")
+    parser.add_argument("--games", type=int, default=2000, help="maximum deals per configuration")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="greedy")
+    parser.add_argument("--batch", type=int, default=200, help="deals between early-stopping checks")
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--no-early-stop", action="store_true")
+    parser.add_argument("--out", help="stream one CSV row per configuration to this file ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    try:
+        space = parse_space(args.param)
+        if not space:
+            parser.error("至少需要一个 --param")
+        configs = grid(space) if args.random is None else random_configs(space, args.random, args.seed)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    options = dict(
+        seed=args.seed, policy=args.policy, batch=args.batch,
+        confidence=args.confidence, early_stop=not args.no_early_stop,
+    )
+    if args.out == "-":
+        results = sweep(configs, args.games, out=sys.stdout, **options)
+    elif args.out:
+        with open(args.out, "w", encoding="utf-8", newline="") as out:
+            results = sweep(configs, args.games, out=out, **options)
+    else:
+        results = sweep(configs, args.games, **options)
+    print(format_results(results), file=sys.stderr if args.out == "-" else sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""Precomputed lookup tables for classifying five-card hands.
+
+Cards are packed into 32-bit integers in the classic "Cactus Kev" layout::
+
+    xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp
+
+``b`` is a one-hot rank bit, ``cdhs`` a one-hot suit bit, ``r`` the rank
+index and ``p`` the rank prime. A hand is then resolved with at most three
+lookups: the AND of the suit bits detects flushes, the OR of the rank bits
+indexes the flush / distinct-rank tables, and the product of the primes
+uniquely identifies every other rank multiset. Together the tables cover all
+2,598,960 five-card combinations.
+
+The tables store category ids (indices into :data:`balatro.scoring.HAND_SCORES`).
+They are precomputed into :mod:`balatro._table_data` - regenerate it with
+``python -m balatro.tables`` after changing the hand rules - and expanded on
+first use, so importing this module costs nothing.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from itertools import combinations_with_replacement
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple
+
+from .cards import DECK_SIZE, RANKS, Card, rank_index, suit_index
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .scoring import HandResult
+
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# Packed integer for each compact card code.
+CARD_BITS: Tuple[int, ...] = tuple(
+    (1 << (16 + rank_index(code))) | (1 << (12 + suit_index(code))) | (rank_index(code) << 8) | PRIMES[rank_index(code)]
+    for code in range(DECK_SIZE)
+)
+
+# 13-bit rank masks (bit i = RANKS[i]) of every straight, including the A-2-3-4-5 wheel.
+STRAIGHT_MASKS = frozenset(
+    [0b1000000001111] + [0b11111 << low for low in range(len(RANKS) - 4)]
+)
+
+_tables: "_Tables | None" = None
+
+
+class _Tables:
+    __slots__ = ("flushes", "unique5", "products", "results")
+
+    def __init__(self, flushes: List[int], unique5: List[int], products: Dict[int, int]) -> None:
+        from .scoring import HAND_RESULTS  # scoring imports this module
+
+        self.flushes = flushes
+        self.unique5 = unique5
+        self.products = products
+        self.results: Tuple[HandResult, ...] = HAND_RESULTS
+
+    @classmethod
+    def load(cls) -> "_Tables":
+        """Expand the precomputed tables in :mod:`balatro._table_data`."""
+
+        from . import _table_data as data
+
+        size = 1 << len(RANKS)
+        flushes = [-1] * size
+        unique5 = [-1] * size
+        for mask, flush, distinct in zip(data.DISTINCT_MASKS, data.FLUSH_CATEGORIES, data.DISTINCT_CATEGORIES):
+            flushes[mask] = flush
+            unique5[mask] = distinct
+        return cls(flushes, unique5, dict(zip(data.PRODUCTS, data.PRODUCT_CATEGORIES)))
+
+    @classmethod
+    def compute(cls) -> "_Tables":
+        """Derive the tables from the hand rules (the source of :mod:`balatro._table_data`)."""
+
+        from .scoring import CATEGORY_IDS
+
+        size = 1 << len(RANKS)
+        flushes = [-1] * size
+        unique5 = [-1] * size
+        products: Dict[int, int] = {}
+        for ranks in combinations_with_replacement(range(len(RANKS)), 5):
+            counts = sorted(Counter(ranks).values(), reverse=True)
+            if counts[0] > 4:
+                continue
+            if counts[0] == 1:
+                mask = 0
+                for rank in ranks:
+                    mask |= 1 << rank
+                straight = mask in STRAIGHT_MASKS
+                flushes[mask] = CATEGORY_IDS["Straight Flush" if straight else "Flush"]
+                unique5[mask] = CATEGORY_IDS["Straight" if straight else "High Card"]
+                continue
+            product = 1
+            for rank in ranks:
+                product *= PRIMES[rank]
+            products[product] = CATEGORY_IDS[_paired_category(counts)]
+        return cls(flushes, unique5, products)
+
+
+def _paired_category(counts: Sequence[int]) -> str:
+    if counts[0] == 4:
+        return "Four of a Kind"
+    if counts[0] == 3:
+        return "Full House" if counts[1] == 2 else "Three of a Kind"
+    if counts[1] == 2:
+        return "Two Pair"
+    return "One Pair"
+
+
+def _get_tables() -> _Tables:
+    global _tables
+    if _tables is None:
+        _tables = _Tables.load()
+    return _tables
+
+
+def render_table_data() -> str:
+    """Source of :mod:`balatro._table_data`, regenerated with ``python -m balatro.tables``."""
+
+    computed = _Tables.compute()
+    masks = [mask for mask, category in enumerate(computed.unique5) if category >= 0]
+    products = sorted(computed.products)
+
+    def wrapped(items: Sequence[object], indent: str = "    ") -> str:
+        lines, line = [], indent
+        for item in items:
+            text = f"{item}, "
+            if len(line) + len(text) > 100:
+                lines.append(line.rstrip())
+                line = indent
+            line += text
+        lines.append(line.rstrip())
+        return "\n".join(lines)
+
+    def hex_bytes(values: Sequence[int]) -> str:
+        digits = bytes(values).hex()
+        return "\n".join(f'    "{digits[i : i + 96]}"' for i in range(0, len(digits), 96))
+
+    return (
+        '"""Precomputed hand-classification tables; see :mod:`balatro.tables`.\n\n'
+        "Generated by ``python -m balatro.tables``; do not edit.\n"
+        '"""\n\n'
+        "# Rank masks of the five-distinct-rank hands, with their flush and non-flush category ids.\n"
+        f"DISTINCT_MASKS = (\n{wrapped(masks)}\n)\n"
+        f"FLUSH_CATEGORIES = bytes.fromhex(\n{hex_bytes([computed.flushes[m] for m in masks])}\n)\n"
+        f"DISTINCT_CATEGORIES = bytes.fromhex(\n{hex_bytes([computed.unique5[m] for m in masks])}\n)\n\n"
+        "# Prime products of every other rank multiset, with their category ids.\n"
+        f"PRODUCTS = (\n{wrapped(products)}\n)\n"
+        f"PRODUCT_CATEGORIES = bytes.fromhex(\n{hex_bytes([computed.products[p] for p in products])}\n)\n"
+    )
+
+
+def encode(card: Card) -> int:
+    """Return the packed 32-bit integer for ``card``."""
+
+    return CARD_BITS[card.code]
+
+
+def classify(c1: int, c2: int, c3: int, c4: int, c5: int) -> int:
+    """Return the category id for five packed cards."""
+
+    tables = _tables or _get_tables()
+    bits = (c1 | c2 | c3 | c4 | c5) >> 16
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        return tables.flushes[bits]
+    category = tables.unique5[bits]
+    if category >= 0:
+        return category
+    return tables.products[(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)]
+
+
+def classify_codes(codes: Sequence[int]) -> int:
+    """Return the category id for five compact card codes."""
+
+    bits = CARD_BITS
+    c1, c2, c3, c4, c5 = codes
+    return classify(bits[c1], bits[c2], bits[c3], bits[c4], bits[c5])
+
+
+def evaluate_codes(codes: Sequence[int]) -> "HandResult":
+    return (_tables or _get_tables()).results[classify_codes(codes)]
+
+
+def evaluate_cards(cards: Sequence[Card]) -> "HandResult":
+    """Table-driven equivalent of :func:`balatro.scoring.evaluate_hand`."""
+
+    bits = CARD_BITS
+    c1, c2, c3, c4, c5 = cards
+    return (_tables or _get_tables()).results[
+        classify(bits[c1.code], bits[c2.code], bits[c3.code], bits[c4.code], bits[c5.code])
+    ]
+
+
+if __name__ == "__main__":  # pragma: no cover - maintenance entry point
+    from pathlib import Path
+
+    Path(__file__).with_name("_table_data.py").write_text(render_table_data(), encoding="utf-8")
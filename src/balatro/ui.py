@@ -1,50 +1,233 @@
 from __future__ import annotations
 
-import tkinter as tk
-from tkinter import messagebox
-from typing import Dict, Set
-
-from PIL import Image, ImageDraw, ImageFilter, ImageFont, ImageTk
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Sequence, Set, Tuple
 
+from .assets import AssetCache
+from .atlas import CardAtlas
 from .cards import Card
 from .game import SimpleGame
-CARD_SIZE = (150, 230)
-BACKGROUND_SIZE = (1920, 1080)
+from .odds import CategoryOdds, game_odds
 
+# Pillow and Tkinter are imported where they are used, so importing this
+# module (for its constants, or from tests) stays cheap.
+if TYPE_CHECKING:  # pragma: no cover
+    import tkinter as tk
 
+    from PIL import Image, ImageFont, ImageTk
+
+CARD_SIZE = (150, 230)
+BACKGROUND_SIZE = (1920, 1080)
+FONT_NAME = "DejaVuSans-Bold.ttf"
+TABLE_TOP_COLOR = (10, 58, 30)
+TABLE_BOTTOM_COLOR = (4, 25, 13)
+TABLE_LINE_COLOR = (18, 94, 50, 90)
+ATLAS_POLL_MS = 30
+ODDS_POLL_MS = 20
+RESIZE_DEBOUNCE_MS = 120
+PHOTO_BUDGET_BYTES = 64 * 1024 * 1024
+SCALE_STEP = 0.05
+MIN_SCALE, MAX_SCALE = 0.3, 2.0
+
+
+@lru_cache(maxsize=None)
 def _load_font(size: int) -> ImageFont.FreeTypeFont:
+    from PIL import ImageFont
+
     try:
-        return ImageFont.truetype("DejaVuSans-Bold.ttf", size)
+        return ImageFont.truetype(FONT_NAME, size)
     except OSError:  # pragma: no cover - fallback if font missing
         return ImageFont.load_default()
 
 
+@lru_cache(maxsize=None)
+def _font_id() -> str:
+    """Identify the font faces will actually be drawn with (part of the cache key)."""
+    font = _load_font(12)
+    return getattr(font, "path", None) or "pil-default"
+
+
+def scale_for(window_size: Tuple[int, int]) -> float:
+    """Art scale that fits the full-HD layout into ``window_size``.
+
+    Snapped to :data:`SCALE_STEP` so dragging a window edge reuses a handful
+    of texture sizes instead of resampling on every pixel.
+    """
+    fit = min(window_size[0] / BACKGROUND_SIZE[0], window_size[1] / BACKGROUND_SIZE[1])
+    snapped = round(round(fit / SCALE_STEP) * SCALE_STEP, 2)
+    return min(MAX_SCALE, max(MIN_SCALE, snapped))
+
+
+def _scaled(size: Tuple[int, int], scale: float) -> Tuple[int, int]:
+    return (max(1, round(size[0] * scale)), max(1, round(size[1] * scale)))
+
+
+class PhotoCache:
+    """LRU of Tk images bounded by the bytes of their pixels.
+
+    Evicting an entry only drops the cache's reference: widgets that still
+    show the image must hold their own, as Tk deletes an image once its last
+    Python reference goes.
+    """
+
+    def __init__(self, budget: int = PHOTO_BUDGET_BYTES, factory: Callable[[Image.Image], Any] | None = None) -> None:
+        if budget < 0:
+            raise ValueError("budget must not be negative")
+        self.budget = budget
+        if factory is None:
+            from PIL import ImageTk
+
+            factory = ImageTk.PhotoImage
+        self.factory = factory
+        self.size = 0
+        self.hits = self.misses = self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, make: Callable[[], Image.Image]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        image = make()
+        photo = self.factory(image)
+        cost = image.width * image.height * 4
+        self._entries[key] = (photo, cost)
+        self.size += cost
+        while self.size > self.budget and len(self._entries) > 1:
+            _, (_, freed) = self._entries.popitem(last=False)
+            self.size -= freed
+            self.evictions += 1
+        return photo
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+
+SlotKey = Tuple[int, bool, bool]  # card code, selected, face drawn
+STALE_SLOT: SlotKey = (-1, False, False)  # a shown slot that must be redrawn
+
+
+def changed_slots(shown: Sequence[SlotKey | None], wanted: Sequence[SlotKey | None]) -> List[int]:
+    """Indices of card slots whose card, selection or face state differ."""
+    return [idx for idx, (old, new) in enumerate(zip(shown, wanted)) if old != new]
+
+
+def _vertical_gradient(size: Tuple[int, int], top: Tuple[int, ...], bottom: Tuple[int, ...]) -> Image.Image:
+    """Blend ``top`` into ``bottom`` down the image using whole-image operations."""
+    from PIL import Image
+
+    width, height = size
+    ramp = Image.linear_gradient("L").resize((1, height), Image.Resampling.BILINEAR)
+    channels = [ramp.point([int(t + (b - t) * v / 255) for v in range(256)]) for t, b in zip(top, bottom)]
+    return Image.merge("RGB", channels).resize((width, height), Image.Resampling.NEAREST)
+
+
 class ArtLibrary:
-    """Lazily loads card and table textures used by the UI."""
+    """Lazily loads card and table textures used by the UI.
+
+    Rendered images go through an :class:`~balatro.assets.AssetCache`, so
+    later launches load them from disk instead of drawing them again. Card
+    faces come from a :class:`~balatro.atlas.CardAtlas` once it has drawn
+    them; until then they are rendered one at a time.
+
+    Textures are drawn at the full-HD base size and resampled for the
+    current :attr:`scale`; the resulting Tk images live in a
+    :class:`PhotoCache` bounded by ``photo_budget`` bytes.
+    """
+
+    def __init__(self, cache: AssetCache | None = None, photo_budget: int = PHOTO_BUDGET_BYTES) -> None:
+        self.cache = cache if cache is not None else AssetCache.default()
+        self.photos = PhotoCache(photo_budget)
+        self.scale = 1.0
+        self._bg_image: Image.Image | None = None
+        self._back_image: Image.Image | None = None
+        self._atlas: CardAtlas | None = None
+
+    @property
+    def card_size(self) -> Tuple[int, int]:
+        return _scaled(CARD_SIZE, self.scale)
+
+    def set_scale(self, scale: float) -> bool:
+        """Switch card textures to ``scale``; return whether it changed."""
+        if scale == self.scale:
+            return False
+        self.scale = scale
+        return True
+
+    @property
+    def atlas(self) -> CardAtlas:
+        if self._atlas is None:
+            self._atlas = CardAtlas(
+                lambda card, selected: self._render_card_face(card, highlight=selected),
+                CARD_SIZE,
+                self.cache,
+                {"font": _font_id()},
+            )
+        return self._atlas
 
-    def __init__(self) -> None:
-        self._bg_photo: ImageTk.PhotoImage | None = None
-        self._back_photo: ImageTk.PhotoImage | None = None
-        self._card_cache: Dict[Card, ImageTk.PhotoImage] = {}
-        self._selected_cache: Dict[Card, ImageTk.PhotoImage] = {}
+    def face_ready(self, card: Card, selected: bool = False) -> bool:
+        return self.atlas.is_ready(card, selected)
 
-    def background(self) -> ImageTk.PhotoImage:
-        if self._bg_photo is None:
-            self._bg_photo = ImageTk.PhotoImage(self._render_background())
-        return self._bg_photo
+    def background(self, size: Tuple[int, int] = BACKGROUND_SIZE) -> ImageTk.PhotoImage:
+        return self.photos.get(("background", size), lambda: self.scaled_background_image(size))
 
     def card_back(self) -> ImageTk.PhotoImage:
-        if self._back_photo is None:
-            self._back_photo = ImageTk.PhotoImage(self._render_card_back())
-        return self._back_photo
+        size = self.card_size
+        return self.photos.get(("back", size), lambda: _resample(self._card_back_base(), size))
 
     def card_face(self, card: Card, selected: bool = False) -> ImageTk.PhotoImage:
-        cache = self._selected_cache if selected else self._card_cache
-        if card not in cache:
-            cache[card] = ImageTk.PhotoImage(self._render_card_face(card, highlight=selected))
-        return cache[card]
+        size = self.card_size
+        return self.photos.get(("face", card.code, selected, size), lambda: self.scaled_face_image(card, selected))
+
+    def scaled_background_image(self, size: Tuple[int, int]) -> Image.Image:
+        if self._bg_image is None:
+            self._bg_image = self.background_image().convert("RGB")  # opaque: a channel less to resample
+        return _resample(self._bg_image, size)
+
+    def scaled_face_image(self, card: Card, selected: bool = False) -> Image.Image:
+        return _resample(self.card_face_image(card, selected), self.card_size)
+
+    def _card_back_base(self) -> Image.Image:
+        if self._back_image is None:
+            self._back_image = self.card_back_image()
+        return self._back_image
+
+    def background_image(self) -> Image.Image:
+        params: Dict[str, Any] = {
+            "size": BACKGROUND_SIZE,
+            "top": TABLE_TOP_COLOR,
+            "bottom": TABLE_BOTTOM_COLOR,
+            "line": TABLE_LINE_COLOR,
+        }
+        return self.cache.get_or_render("background", params, self._render_background)
+
+    def card_back_image(self) -> Image.Image:
+        params = {"size": CARD_SIZE, "font": _font_id()}
+        return self.cache.get_or_render("back", params, self._render_card_back)
+
+    def card_face_image(self, card: Card, selected: bool = False) -> Image.Image:
+        face = self._atlas.face(card, selected) if self._atlas is not None else None
+        if face is not None:
+            return face
+        params = {"size": CARD_SIZE, "font": _font_id(), "card": f"{card.rank}{card.suit}", "selected": selected}
+        return self.cache.get_or_render(
+            f"face{card.code}{'s' if selected else ''}", params, lambda: self._render_card_face(card, highlight=selected)
+        )
 
     def _render_card_face(self, card: Card, highlight: bool = False) -> Image.Image:
+        from PIL import Image, ImageDraw
+
         bg_color = "#fdfcf7" if not highlight else "#f4efd9"
         border_color = "#c6c6c6" if not highlight else "#1d7fc4"
         img = Image.new("RGBA", CARD_SIZE, bg_color)
@@ -80,20 +263,12 @@ class ArtLibrary:
     def _render_background(self) -> Image.Image:
         """Create a textured tabletop without external assets."""
 
+        from PIL import Image, ImageDraw, ImageFilter
+
         width, height = BACKGROUND_SIZE
-        base = Image.new("RGB", BACKGROUND_SIZE)
-        draw = ImageDraw.Draw(base)
-
-        top_color = (10, 58, 30)
-        bottom_color = (4, 25, 13)
-        for y in range(height):
-            ratio = y / max(height - 1, 1)
-            r = int(top_color[0] * (1 - ratio) + bottom_color[0] * ratio)
-            g = int(top_color[1] * (1 - ratio) + bottom_color[1] * ratio)
-            b = int(top_color[2] * (1 - ratio) + bottom_color[2] * ratio)
-            draw.line([(0, y), (width, y)], fill=(r, g, b))
-
-        line_color = (18, 94, 50, 90)
+        base = _vertical_gradient(BACKGROUND_SIZE, TABLE_TOP_COLOR, TABLE_BOTTOM_COLOR)
+
+        line_color = TABLE_LINE_COLOR
         overlay = Image.new("RGBA", BACKGROUND_SIZE, (0, 0, 0, 0))
         overlay_draw = ImageDraw.Draw(overlay)
         for offset in range(-width, width * 2, 180):
@@ -112,6 +287,8 @@ class ArtLibrary:
     def _render_card_back(self) -> Image.Image:
         """Render a simple card back pattern procedurally."""
 
+        from PIL import Image, ImageDraw
+
         img = Image.new("RGBA", CARD_SIZE, "#0c2238")
         draw = ImageDraw.Draw(img)
 
@@ -134,10 +311,75 @@ class ArtLibrary:
         return img
 
 
+def _resample(image: Image.Image, size: Tuple[int, int]) -> Image.Image:
+    from PIL import Image
+
+    if image.size == size:
+        return image
+    # Box filtering is about twice as fast as bilinear and as good when shrinking.
+    shrinking = size[0] <= image.width and size[1] <= image.height
+    return image.resize(size, Image.Resampling.BOX if shrinking else Image.Resampling.BILINEAR)
+
+
+class OddsWorker:
+    """Compute :func:`~balatro.odds.game_odds` on a daemon thread, newest request only.
+
+    :meth:`submit` snapshots the game with :meth:`SimpleGame.clone` and
+    returns at once; :meth:`poll` hands back ``(tag, odds)`` once the newest
+    request is done (``odds`` is ``None`` if the discard was invalid), or
+    ``None`` until then. Requests superseded before they finish are dropped.
+    """
+
+    def __init__(self, compute: Callable[..., CategoryOdds] = game_odds) -> None:
+        self.compute = compute
+        self._cond = threading.Condition()
+        self._generation = 0
+        self._request: Tuple[int, SimpleGame, List[int] | None, Any] | None = None
+        self._result: Tuple[Any, CategoryOdds | None] | None = None
+        self._thread: threading.Thread | None = None
+
+    def submit(self, game: SimpleGame, discard: Sequence[int] | None = None, tag: Any = None) -> None:
+        with self._cond:
+            self._generation += 1
+            self._request = (self._generation, game.clone(), None if discard is None else list(discard), tag)
+            self._result = None
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="odds", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def cancel(self) -> None:
+        with self._cond:
+            self._generation += 1
+            self._request = self._result = None
+
+    def poll(self) -> Tuple[Any, CategoryOdds | None] | None:
+        with self._cond:
+            result, self._result = self._result, None
+            return result
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._request is None:
+                    self._cond.wait()
+                generation, game, discard, tag = self._request
+                self._request = None
+            try:
+                odds: CategoryOdds | None = self.compute(game, discard)
+            except ValueError:
+                odds = None
+            with self._cond:
+                if generation == self._generation:
+                    self._result = (tag, odds)
+
+
 class BalatroUI:
     """A tiny Tkinter UI to play the simplified Balatro demo."""
 
     def __init__(self, root: tk.Tk) -> None:
+        import tkinter as tk
+
         self.root = root
         self.root.title("Balatro (简化版) UI")
         self.root.geometry(f"{BACKGROUND_SIZE[0]}x{BACKGROUND_SIZE[1]}")
@@ -146,22 +388,39 @@ class BalatroUI:
         self.assets = ArtLibrary()
         self.game = SimpleGame()
         self.selected_indices: Set[int] = set()
+        # Pooled card slots: buttons are created once and only reconfigured.
         self.card_buttons: Dict[int, tk.Button] = {}
         self.card_images: Dict[int, ImageTk.PhotoImage] = {}
+        self._slot_keys: List[SlotKey | None] = []
+        self._labels_pending: str | None = None
+        self._resize_pending: str | None = None
+        self._odds_pending: str | None = None
+        self.odds_worker = OddsWorker()
+        self._window_size = BACKGROUND_SIZE
 
         self.status_var = tk.StringVar()
         self.deck_var = tk.StringVar()
         self.result_var = tk.StringVar()
         self.score_var = tk.StringVar()
         self.action_var = tk.StringVar()
+        self.odds_var = tk.StringVar()
         self.total_score = 0
 
         self._build_layout()
         self.start_new_game()
+        # Draw the remaining faces in the background; the hand shows card
+        # backs until its faces arrive.
+        hand = self.game.hand
+        self.assets.atlas.start(priority=[(card, False) for card in hand] + [(card, True) for card in hand])
+        self._poll_atlas()
 
     def _build_layout(self) -> None:
-        bg_label = tk.Label(self.root, image=self.assets.background())
-        bg_label.place(x=0, y=0, relwidth=1, relheight=1)
+        import tkinter as tk
+
+        self.bg_image = self.assets.background()
+        self.bg_label = tk.Label(self.root, image=self.bg_image, bd=0)
+        self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
+        self.root.bind("<Configure>", self._on_configure)
 
         overlay = tk.Frame(self.root, bg="#0b361b", bd=0)
         overlay.place(relwidth=1, height=96, x=0, y=0)
@@ -253,6 +512,18 @@ class BalatroUI:
         )
         new_game_btn.grid(row=0, column=2, padx=10)
 
+        hint_btn = tk.Button(
+            button_row,
+            text="提示",
+            command=self.show_hint,
+            width=8,
+            bg="#2f5d8a",
+            fg="white",
+            activebackground="#3a6fa3",
+            font=("Arial", 11, "bold"),
+        )
+        hint_btn.grid(row=0, column=3, padx=10)
+
         footer = tk.Frame(self.root, bg="", bd=0)
         footer.place(relwidth=0.9, relx=0.05, rely=0.9)
 
@@ -262,6 +533,26 @@ class BalatroUI:
         status = tk.Label(footer, textvariable=self.status_var, fg="#e0e0e0", bg="", font=("Arial", 11))
         status.pack(side="right")
 
+        odds_label = tk.Label(footer, textvariable=self.odds_var, fg="#cfe8d5", bg="", font=("Arial", 10))
+        odds_label.pack(side="left", padx=24)
+
+    def _on_configure(self, event: tk.Event) -> None:
+        """Debounce window resizes: rescale once the user stops dragging."""
+        if event.widget is not self.root or (event.width, event.height) == self._window_size:
+            return
+        self._window_size = (event.width, event.height)
+        if self._resize_pending is not None:
+            self.root.after_cancel(self._resize_pending)
+        self._resize_pending = self.root.after(RESIZE_DEBOUNCE_MS, self._apply_resize)
+
+    def _apply_resize(self) -> None:
+        self._resize_pending = None
+        self.bg_image = self.assets.background(self._window_size)
+        self.bg_label.config(image=self.bg_image)
+        if self.assets.set_scale(scale_for(self._window_size)):
+            self._slot_keys = [None if key is None else STALE_SLOT for key in self._slot_keys]
+            self._render_hand()
+
     def start_new_game(self) -> None:
         self.game.start()
         self.selected_indices.clear()
@@ -269,28 +560,64 @@ class BalatroUI:
         self.total_score = 0
         self.status_var.set("新一局开始：点击卡牌以选择。")
         self._render_hand()
-        self._update_deck_label()
-        self._update_score_label()
-        self._update_action_label()
+        self._schedule_labels()
+        self._update_odds_label()
 
     def _render_hand(self) -> None:
-        for widget in self.hand_frame.winfo_children():
-            widget.destroy()
-        self.card_buttons.clear()
-        self.card_images.clear()
-
-        for idx, card in enumerate(self.game.hand):
-            btn = tk.Button(
-                self.hand_frame,
-                image=self.assets.card_face(card),
-                bd=0,
-                relief="flat",
-                highlightthickness=2,
-                command=lambda i=idx: self.toggle_card(i),
-            )
-            btn.grid(row=0, column=idx, padx=10, pady=6)
-            self.card_buttons[idx] = btn
-            self.card_images[idx] = self.assets.card_face(card)
+        """Bring the pooled card slots in line with the hand, touching only changed slots."""
+        hand = self.game.hand
+        while len(self.card_buttons) < max(len(hand), self.game.hand_size):
+            self._add_slot()
+        wanted: List[SlotKey | None] = []
+        for idx in range(len(self._slot_keys)):
+            if idx < len(hand):
+                selected = idx in self.selected_indices
+                wanted.append((hand[idx].code, selected, self.assets.face_ready(hand[idx], selected)))
+            else:
+                wanted.append(None)
+        for idx in changed_slots(self._slot_keys, wanted):
+            btn = self.card_buttons[idx]
+            if wanted[idx] is None:
+                btn.grid_remove()
+                self.card_images.pop(idx, None)
+            else:
+                if self._slot_keys[idx] is None:
+                    btn.grid()
+                self.card_images[idx] = self._face_image(idx)
+                btn.config(image=self.card_images[idx])
+            self._slot_keys[idx] = wanted[idx]
+
+    def _add_slot(self) -> None:
+        import tkinter as tk
+
+        idx = len(self._slot_keys)
+        btn = tk.Button(
+            self.hand_frame,
+            bd=0,
+            relief="flat",
+            highlightthickness=2,
+            command=lambda i=idx: self.toggle_card(i),
+        )
+        btn.grid(row=0, column=idx, padx=10, pady=6)
+        btn.grid_remove()  # hidden until a card is dealt into it; grid() restores the options
+        self.card_buttons[idx] = btn
+        self._slot_keys.append(None)
+
+    def _face_image(self, index: int) -> ImageTk.PhotoImage:
+        card = self.game.hand[index]
+        selected = index in self.selected_indices
+        if self.assets.face_ready(card, selected):
+            return self.assets.card_face(card, selected)
+        return self.assets.card_back()
+
+    def _poll_atlas(self) -> None:
+        """Swap faces into the hand as the atlas worker finishes them."""
+        atlas = self.assets.atlas
+        finished = atlas.complete  # checked first so the last faces are never missed
+        if atlas.completed():
+            self._render_hand()
+        if not finished:
+            self.root.after(ATLAS_POLL_MS, self._poll_atlas)
 
     def toggle_card(self, index: int) -> None:
         if index in self.selected_indices:
@@ -302,12 +629,22 @@ class BalatroUI:
             self.selected_indices.add(index)
 
         self._refresh_card_styles()
+        self._update_odds_label()
         self.status_var.set(f"已选择 {len(self.selected_indices)} 张。")
 
+    def show_hint(self) -> None:
+        if len(self.game.hand) < 5:
+            self.status_var.set("手牌不足 5 张，无法提示。")
+            return
+
+        play = self.game.best_play()
+        self.selected_indices = set(play.indices)
+        self._refresh_card_styles()
+        self._update_odds_label()
+        self.status_var.set(f"提示：{play.result.name}，预计得分 {play.result.total}。")
+
     def _refresh_card_styles(self) -> None:
-        for idx, btn in self.card_buttons.items():
-            card = self.game.hand[idx]
-            btn.config(image=self.assets.card_face(card, selected=idx in self.selected_indices))
+        self._render_hand()
 
     def play_selected(self) -> None:
         if len(self.selected_indices) != 5:
@@ -317,6 +654,8 @@ class BalatroUI:
         try:
             result = self.game.play_cards(sorted(self.selected_indices))
         except Exception as exc:  # broad by design for user feedback
+            from tkinter import messagebox
+
             messagebox.showerror("无法出牌", str(exc))
             return
 
@@ -324,27 +663,75 @@ class BalatroUI:
         self.total_score += result.total
 
         self._render_hand()
-        self._refresh_card_styles()
-        self._update_deck_label()
-        self._update_score_label()
-        self._update_action_label()
+        self._schedule_labels()
+        self._update_odds_label()
 
         self.result_var.set(
             f"打出牌型：{result.name}，筹码：{result.chips}，倍率：{result.multiplier}，本次得分：{result.total}"
         )
 
         if not self.game.hand and self.game.deck.remaining() < 5:
+            from tkinter import messagebox
+
             messagebox.showinfo("游戏结束", "牌堆耗尽，本局结束。谢谢游玩！")
             self.status_var.set("本局已结束，可点击重新开始。")
         else:
             self.status_var.set("选择下一手牌或重新开始。")
 
+    def _schedule_labels(self) -> None:
+        """Refresh the deck, score and action labels once, when Tk is next idle."""
+        if self._labels_pending is None:
+            self._labels_pending = self.root.after_idle(self._flush_labels)
+
+    def _flush_labels(self) -> None:
+        self._labels_pending = None
+        self._update_deck_label()
+        self._update_score_label()
+        self._update_action_label()
+
     def _update_deck_label(self) -> None:
         self.deck_var.set(f"牌堆剩余：{self.game.deck.remaining()} 张")
 
     def _update_score_label(self) -> None:
         self.score_var.set(f"累计得分：{self.total_score}")
 
+    def _update_odds_label(self) -> None:
+        """Exact category odds for discarding the selection (or for 5 fresh cards).
+
+        The odds take a noticeable fraction of a second, so they are computed
+        by :class:`OddsWorker` and shown by :meth:`_poll_odds` when ready.
+        """
+        if self.selected_indices and self.game.discards_remaining > 0:
+            discard: List[int] | None = sorted(self.selected_indices)
+            prefix = "弃掉所选后"
+        elif self.game.deck.remaining() >= 5:
+            discard, prefix = None, "牌堆发 5 张"
+        else:
+            self.odds_worker.cancel()
+            if self._odds_pending is not None:
+                self.root.after_cancel(self._odds_pending)
+                self._odds_pending = None
+            self.odds_var.set("")
+            return
+        self.odds_worker.submit(self.game, discard, tag=prefix)
+        if self._odds_pending is None:
+            self._odds_pending = self.root.after(ODDS_POLL_MS, self._poll_odds)
+
+    def _poll_odds(self) -> None:
+        finished = self.odds_worker.poll()
+        if finished is None:
+            self._odds_pending = self.root.after(ODDS_POLL_MS, self._poll_odds)
+            return
+        self._odds_pending = None
+        prefix, odds = finished
+        if odds is None:
+            self.odds_var.set("")
+            return
+        likely = [(name, p) for name, p in odds.probabilities().items() if p >= 0.001]
+        likely.sort(key=lambda item: -item[1])
+        text = "  ".join(f"{name} {p:.1%}" for name, p in likely[:4])
+        self.odds_var.set(f"{prefix}：{text}（期望 {odds.expected_total:.0f} 分）")
+
     def _update_action_label(self) -> None:
         self.action_var.set(
             f"{self.game.plays_remaining} / {self.game.discards_remaining}"
@@ -358,18 +745,21 @@ class BalatroUI:
         try:
             self.game.discard_cards(sorted(self.selected_indices))
         except Exception as exc:  # broad by design for user feedback
+            from tkinter import messagebox
+
             messagebox.showerror("无法弃牌", str(exc))
             return
 
         self.selected_indices.clear()
         self._render_hand()
-        self._refresh_card_styles()
-        self._update_deck_label()
-        self._update_action_label()
+        self._schedule_labels()
+        self._update_odds_label()
         self.status_var.set("已弃牌，补充了新牌。继续选择或出牌。")
 
 
 def main() -> None:  # pragma: no cover - manual UI entry point
+    import tkinter as tk
+
     root = tk.Tk()
     BalatroUI(root)
     root.mainloop()
@@ -0,0 +1,54 @@
+import pytest
+
+from balatro.advisor import advise, candidate_discards, estimate_discards
+from balatro.cards import Card
+from balatro.game import SimpleGame
+from test_game import FixedDeck, make_cards
+
+
+def make_hand(descriptors):
+    return [Card(rank, suit) for rank, suit in descriptors]
+
+
+QUADS = make_hand([("A", "♠"), ("A", "♥"), ("A", "♦"), ("A", "♣"), ("2", "♠"), ("7", "♥"), ("9", "♦"), ("J", "♣")])
+
+
+def test_candidate_discards_counts():
+    candidates = candidate_discards(8)
+    assert candidates[0] == ()
+    assert len(candidates) == 1 + 8 + 28 + 56 + 70 + 56
+
+
+def test_keeping_quads_is_exact_and_best():
+    deck = [card for card in make_cards(52) if card not in QUADS]
+    estimates = estimate_discards(QUADS, deck, discards_remaining=3, plays_remaining=2, samples=20, seed=7)
+    best = estimates[0]
+    assert best.discard == ()
+    assert best.mean == 770
+    assert best.stderr == 0
+    assert best.samples == 20
+
+
+def test_seeded_runs_are_reproducible():
+    deck = [card for card in make_cards(52) if card not in QUADS]
+    first = estimate_discards(QUADS, deck, 1, 1, samples=10, seed=3, max_discard=2)
+    second = estimate_discards(QUADS, deck, 1, 1, samples=10, seed=3, max_discard=2)
+    assert first == second
+
+
+def test_no_discards_left_only_keeps():
+    game = SimpleGame(deck=FixedDeck(make_cards(20)))
+    game.start()
+    game.discards_remaining = 0
+    assert [estimate.discard for estimate in advise(game, samples=5)] == [()]
+
+
+def test_requires_plays_remaining():
+    with pytest.raises(ValueError):
+        estimate_discards(QUADS, [], discards_remaining=1, plays_remaining=0)
+
+
+def test_process_pool_merges_samples():
+    deck = [card for card in make_cards(52) if card not in QUADS]
+    estimates = estimate_discards(QUADS, deck, 1, 1, samples=9, seed=1, max_discard=1, workers=2)
+    assert all(estimate.samples == 9 for estimate in estimates)
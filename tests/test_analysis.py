@@ -0,0 +1,137 @@
+import random
+from itertools import combinations
+
+import pytest
+
+from balatro.analysis import WINDOWS, CardCounts
+from balatro.cards import Deck, decode_cards
+from balatro.game import SimpleGame
+from balatro.scoring import HAND_LOOKUP, evaluate_hand
+
+
+def _made_categories(codes):
+    """Brute force: every category some five of ``codes`` make, by rank order of HAND_SCORES."""
+    return {evaluate_hand(decode_cards(five)).name for five in combinations(codes, 5)}
+
+
+def _dominated(names):
+    """Categories implied by a made hand (a full house also contains a pair, etc.)."""
+    implied = {
+        "One Pair": {"One Pair"},
+        "Two Pair": {"One Pair", "Two Pair"},
+        "Three of a Kind": {"One Pair", "Three of a Kind"},
+        "Full House": {"One Pair", "Two Pair", "Three of a Kind", "Full House"},
+        "Four of a Kind": {"One Pair", "Two Pair", "Three of a Kind", "Four of a Kind"},
+        "Straight Flush": {"Straight", "Flush", "Straight Flush"},
+    }
+    found = {"High Card"}
+    for name in names:
+        found |= implied.get(name, {name})
+    return found
+
+
+def test_windows_cover_every_straight():
+    assert len(WINDOWS) == 10
+    assert WINDOWS[0] == 0b1000000001111  # wheel first
+    assert WINDOWS[-1] == 0b1111100000000
+
+
+def test_categories_match_brute_force():
+    rng = random.Random(0)
+    for _ in range(300):
+        codes = rng.sample(range(52), 8)
+        assert CardCounts(codes).categories() == _dominated(_made_categories(codes))
+
+
+def test_add_remove_round_trip():
+    codes = [0, 5, 10, 15, 20, 25, 30, 35]
+    counts = CardCounts(codes)
+    for code in codes[:4]:
+        counts.remove(code)
+    for code in codes[:4]:
+        counts.add(code)
+    fresh = CardCounts(codes)
+    assert (counts.ranks, counts.suits, counts.suit_ranks, counts.windows, counts.size) == (
+        fresh.ranks,
+        fresh.suits,
+        fresh.suit_ranks,
+        fresh.windows,
+        fresh.size,
+    )
+    with pytest.raises(ValueError):
+        counts.remove(51)
+
+
+def test_reachable_flush_and_straight_draws():
+    # Four hearts 5-6-7-8 plus junk; the deck still holds the 4 and 9 of hearts.
+    hand = CardCounts([3 * 4 + 1, 4 * 4 + 1, 5 * 4 + 1, 6 * 4 + 1, 12 * 4 + 0])
+    deck = CardCounts([2 * 4 + 1, 7 * 4 + 1, 0, 1])
+    reachable = hand.reachable(deck, 1)
+    assert {"Flush", "Straight", "Straight Flush"} <= reachable
+    assert "One Pair" not in reachable  # no deck card pairs a held rank
+    assert "One Pair" in hand.reachable(deck, 2)  # but the two deuces do
+    assert "Three of a Kind" not in hand.reachable(deck, 2)
+    assert hand.reachable(deck, 0) == {"High Card"}
+    assert "Straight Flush" not in hand.reachable(CardCounts([0, 1, 2]), 3)
+
+
+def test_game_counts_stay_in_sync():
+    rng = random.Random(3)
+    game = SimpleGame(deck=Deck(random.Random(3)), track_deck=True)
+    game.start()
+    game.counts  # materialize, then follow the game incrementally
+    while game.plays_remaining and len(game.hand) >= 5:
+        if game.discards_remaining and rng.random() < 0.5:
+            game.discard_cards(rng.sample(range(len(game.hand)), 3))
+        else:
+            game.play_cards(rng.sample(range(len(game.hand)), 5))
+        fresh = CardCounts(card.code for card in game.hand)
+        assert game.counts.ranks == fresh.ranks
+        assert game.counts.windows == fresh.windows
+        assert game.deck_counts.suits == CardCounts(c.code for c in game.deck.remaining_cards()).suits
+
+
+def test_game_category_queries():
+    game = SimpleGame(deck=Deck(random.Random(8)))
+    game.start()
+    made = game.available_categories()
+    assert game.best_play().result.name in made
+    assert made <= game.reachable_categories()
+    assert HAND_LOOKUP["High Card"].name in made
+
+
+def test_clone_has_independent_counts():
+    game = SimpleGame(deck=Deck(random.Random(1)))
+    game.start()
+    before = list(game.counts.ranks)
+    twin = game.clone()
+    twin.play_cards([0, 1, 2, 3, 4])
+    assert game.counts.ranks == before
+    assert twin.counts.ranks == CardCounts(card.code for card in twin.hand).ranks
+
+
+def test_two_deck_games_count_duplicate_cards():
+    from balatro.rules import Rules
+
+    ace = 12 * 4
+    counts = CardCounts([ace, ace, 0])
+    counts.remove(ace)
+    assert counts.has_code(ace) and counts.suit_ranks[0] == 1 << 12 | 1
+    counts.remove(ace)
+    assert not counts.has_code(ace) and counts.suit_ranks[0] == 1
+
+    rules = Rules(decks=2)
+    for seed in range(20):
+        rng = random.Random(seed)
+        game = SimpleGame(deck=Deck(random.Random(seed)), rules=rules, track_deck=True)
+        game.start()
+        game.counts, game.deck_counts  # materialize, then follow the game incrementally
+        while game.plays_remaining and len(game.hand) >= 5:
+            if game.discards_remaining and rng.random() < 0.5:
+                game.discard_cards(rng.sample(range(len(game.hand)), 3))
+            else:
+                game.play_cards(rng.sample(range(len(game.hand)), 5))
+            fresh = CardCounts(card.code for card in game.hand)
+            assert (game.counts.copies, game.counts.suit_ranks) == (fresh.copies, fresh.suit_ranks)
+            undrawn = CardCounts(card.code for card in game.deck.remaining_cards())
+            assert (game.deck_counts.copies, game.deck_counts.suit_ranks) == (undrawn.copies, undrawn.suit_ranks)
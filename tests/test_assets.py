@@ -0,0 +1,80 @@
+import pytest
+
+pytest.importorskip("PIL")
+
+from PIL import Image, ImageChops
+
+from balatro.assets import AssetCache, asset_key
+from balatro.cards import Card
+
+
+def _renderer(calls, color="red"):
+    def render():
+        calls.append(color)
+        return Image.new("RGBA", (6, 4), color)
+
+    return render
+
+
+def test_cache_renders_once_then_loads_from_disk(tmp_path):
+    calls = []
+    cache = AssetCache(tmp_path)
+    first = cache.get_or_render("tile", {"size": (6, 4)}, _renderer(calls))
+    again = AssetCache(tmp_path).get_or_render("tile", {"size": (6, 4)}, _renderer(calls))
+    assert calls == ["red"]
+    assert again.mode == "RGBA" and ImageChops.difference(first, again).getbbox() is None
+    assert cache.misses == 1 and len(list(tmp_path.glob("*.tex"))) == 1
+
+
+def test_changed_parameters_or_version_miss(tmp_path, monkeypatch):
+    calls = []
+    cache = AssetCache(tmp_path)
+    cache.get_or_render("tile", {"size": (6, 4)}, _renderer(calls))
+    cache.get_or_render("tile", {"size": (6, 5)}, _renderer(calls, "blue"))
+    key = asset_key("tile", {"size": (6, 4)})
+    monkeypatch.setattr("balatro.assets.ASSET_VERSION", 99)
+    assert asset_key("tile", {"size": (6, 4)}) != key
+    cache.get_or_render("tile", {"size": (6, 4)}, _renderer(calls, "green"))
+    assert calls == ["red", "blue", "green"]
+
+
+def test_corrupt_entries_are_rerendered(tmp_path):
+    calls = []
+    cache = AssetCache(tmp_path)
+    path = cache.path("tile", {})
+    for junk in (b"", b"BLTX", b"PNG" * 40):
+        path.write_bytes(junk)
+        image = cache.get_or_render("tile", {}, _renderer(calls))
+        assert image.size == (6, 4)
+    assert len(calls) == 3
+    assert cache.clear() == 1
+
+
+def test_disabled_cache_never_touches_disk(tmp_path):
+    calls = []
+    cache = AssetCache(tmp_path / "never", enabled=False)
+    cache.get_or_render("tile", {}, _renderer(calls))
+    cache.get_or_render("tile", {}, _renderer(calls))
+    assert len(calls) == 2 and not (tmp_path / "never").exists()
+
+
+def test_art_library_uses_the_cache(tmp_path):
+    ui = pytest.importorskip("balatro.ui")
+    art = ui.ArtLibrary(AssetCache(tmp_path))
+    background = art.background_image()
+    assert background.size == ui.BACKGROUND_SIZE
+    face = art.card_face_image(Card("A", "♠"), selected=True)
+    cached = ui.ArtLibrary(AssetCache(tmp_path))
+    assert ImageChops.difference(cached.card_face_image(Card("A", "♠"), selected=True), face).getbbox() is None
+    assert cached.background_image().tobytes() == background.tobytes()
+    assert cached.cache.hits == 2 and cached.cache.misses == 0
+
+
+def test_vectorized_gradient_matches_row_by_row_blend():
+    ui = pytest.importorskip("balatro.ui")
+    top, bottom = (10, 58, 30), (4, 25, 13)
+    image = ui._vertical_gradient((7, 300), top, bottom)
+    for y in (0, 150, 299):
+        ratio = y / 299
+        expected = tuple(int(t * (1 - ratio) + b * ratio) for t, b in zip(top, bottom))
+        assert all(abs(a - b) <= 1 for a, b in zip(image.getpixel((3, y)), expected))
@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+
+pytest.importorskip("PIL")
+
+from PIL import Image, ImageChops
+
+from balatro.assets import AssetCache
+from balatro.atlas import ALL_SLOTS, COLUMNS, ROWS, CardAtlas
+from balatro.cards import CARDS, Card
+
+
+def _solid(calls=None):
+    def render(card, selected):
+        if calls is not None:
+            calls.append((card, selected))
+        return Image.new("RGBA", (3, 2), (card.code, 255 if selected else 0, 7, 255))
+
+    return render
+
+
+def test_every_face_gets_its_own_cell():
+    atlas = CardAtlas(_solid(), (3, 2))
+    assert atlas.face(Card("A", "♠")) is None
+    atlas.build()
+    assert atlas.complete and atlas.sheet.size == (3 * COLUMNS, 2 * ROWS)
+    boxes = {atlas.box(card, selected) for card, selected in ALL_SLOTS}
+    assert len(boxes) == len(ALL_SLOTS) == 104
+    for card in (CARDS[0], CARDS[17], CARDS[51]):
+        for selected in (False, True):
+            assert atlas.face(card, selected).getpixel((1, 1)) == (card.code, 255 if selected else 0, 7, 255)
+
+
+def test_worker_renders_priority_first_and_reports_progress():
+    calls = []
+    gate = threading.Event()
+
+    def render(card, selected):
+        gate.wait()
+        return _solid(calls)(card, selected)
+
+    atlas = CardAtlas(render, (3, 2))
+    first = [(Card("Q", "♥"), True), (Card("2", "♣"), False)]
+    atlas.start(priority=first)
+    assert not atlas.complete
+    gate.set()
+    assert atlas.wait(10)
+    assert calls[:2] == first and len(calls) == 104
+    done = atlas.completed()
+    assert done[:2] == first and len(done) == 104 and atlas.completed() == []
+
+
+def test_complete_atlas_is_cached_as_one_texture(tmp_path):
+    calls = []
+    CardAtlas(_solid(calls), (3, 2), AssetCache(tmp_path), {"font": "x"}).build()
+    cache = AssetCache(tmp_path)
+    loaded = CardAtlas(_solid(calls), (3, 2), cache, {"font": "x"})
+    assert loaded.complete and cache.hits == 1 and len(calls) == 104
+    assert len(list(tmp_path.glob("atlas-*.tex"))) == 1
+    assert not CardAtlas(_solid(), (3, 2), AssetCache(tmp_path), {"font": "y"}).complete
+
+
+def test_art_library_faces_match_atlas(tmp_path):
+    ui = pytest.importorskip("balatro.ui")
+    art = ui.ArtLibrary(AssetCache(tmp_path, enabled=False))
+    card = Card("10", "♦")
+    direct = art.card_face_image(card, selected=True)
+    art.atlas.build(priority=[(card, True)])
+    assert art.face_ready(card, True)
+    assert ImageChops.difference(art.card_face_image(card, selected=True), direct).getbbox() is None
+    assert ui._load_font(38) is ui._load_font(38)
@@ -0,0 +1,35 @@
+from itertools import combinations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from balatro.cards import Card, encode_cards
+from balatro.scoring import CATEGORY_IDS, HAND_LOOKUP, evaluate_hand, evaluate_hands
+from balatro.tables import classify_codes
+
+
+def test_matches_scalar_on_every_hand():
+    hands = np.array(list(combinations(range(52), 5)), dtype=np.int8)
+    result = evaluate_hands(hands)
+    expected = np.fromiter((classify_codes(row) for row in hands.tolist()), dtype=np.int8, count=len(hands))
+    assert np.array_equal(result.category, expected)
+    assert np.bincount(result.category).tolist() == [1302540, 1098240, 123552, 54912, 10200, 5108, 3744, 624, 40]
+
+
+def test_wheel_and_scores():
+    wheel = [Card("A", "♠"), Card("2", "♥"), Card("3", "♣"), Card("4", "♦"), Card("5", "♠")]
+    result = evaluate_hands([encode_cards(wheel)])
+    scalar = evaluate_hand(wheel)
+    assert result.category.tolist() == [CATEGORY_IDS["Straight"]]
+    assert result.names() == [scalar.name]
+    assert result.chips.tolist() == [scalar.chips]
+    assert result.multiplier.tolist() == [scalar.multiplier]
+    assert result.total.tolist() == [HAND_LOOKUP["Straight"].total]
+
+
+def test_rejects_bad_shapes_and_codes():
+    with pytest.raises(ValueError):
+        evaluate_hands(np.zeros((3, 4), dtype=np.int8))
+    with pytest.raises(ValueError):
+        evaluate_hands(np.full((1, 5), 52))
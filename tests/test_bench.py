@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from balatro import bench
+
+
+def test_every_category_has_a_benchmark_hand():
+    from balatro.scoring import HAND_SCORES, evaluate_hand
+
+    assert set(bench.CATEGORY_HANDS) == {name for name, _, _ in HAND_SCORES}
+    for name, text in bench.CATEGORY_HANDS.items():
+        assert evaluate_hand(bench._parse_hand(text)).name == name
+
+
+def test_measure_reports_per_call_statistics():
+    calls = []
+    result = bench.measure(lambda: calls.append(None), rounds=3, min_time=0.001, name="noop", group="test")
+    assert result.rounds == 3
+    assert result.iterations >= 1
+    assert len(calls) > result.iterations * 3
+    assert 0 < result.min <= result.median
+    with pytest.raises(ValueError):
+        bench.measure(lambda: None, rounds=0)
+
+
+def test_peak_allocation_measures_one_call():
+    keep = []
+    assert bench.peak_allocation(lambda: None, calls=10) < 1024
+    assert bench.peak_allocation(lambda: keep.append(bytearray(100_000)), calls=10) >= 100_000
+
+
+def test_run_suite_writes_loadable_report(tmp_path):
+    selected = bench.select(["deck/", "Flush]"])
+    assert {b.group for b in selected} == {"deck", "scoring"}
+    report = bench.run_suite(selected, rounds=2, min_time=0.001)
+    assert len(report["benchmarks"]) == len(selected)
+    assert report["machine"]["python"]
+    peaks = {entry["name"]: entry["peak_bytes"] for entry in report["benchmarks"]}
+    assert peaks["reset+draw round"] > 0 and peaks["new deck+draw round"] > 0
+    assert peaks["evaluate_hand[Flush]"] is None
+
+    path = tmp_path / "bench.json"
+    bench.save(report, str(path))
+    assert bench.load(str(path)) == json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_missing_dependencies_are_skipped():
+    def setup():
+        raise bench.Skip("no display")
+
+    report = bench.run_suite([bench.Benchmark("ui", "fake", setup)], rounds=1, min_time=0.0)
+    assert report["benchmarks"] == []
+    assert report["skipped"] == {"ui/fake": "no display"}
+
+
+def _report(**medians):
+    return {
+        "version": bench.FORMAT_VERSION,
+        "benchmarks": [
+            {"group": "g", "name": name, "median": median} for name, median in medians.items()
+        ],
+    }
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    baseline = _report(fast=1.0, same=2.0, slow=1.0, gone=1.0)
+    current = _report(fast=0.5, same=2.1, slow=1.5, new=1.0)
+    comparisons = bench.compare(baseline, current, threshold=0.10)
+    assert [item.name for item in comparisons] == ["g/slow", "g/same", "g/fast"]
+    assert [item.regressed for item in comparisons] == [True, False, False]
+    assert comparisons[0].ratio == pytest.approx(1.5)
+
+
+def test_compare_command_exit_status(tmp_path, capsys):
+    base, good, bad = (tmp_path / name for name in ("base.json", "good.json", "bad.json"))
+    bench.save(_report(a=1.0), str(base))
+    bench.save(_report(a=1.05), str(good))
+    bench.save(_report(a=1.5), str(bad))
+
+    assert bench.main(["compare", str(base), str(good)]) == 0
+    assert bench.main(["compare", str(base), str(bad), "--threshold", "0.2"]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
@@ -0,0 +1,139 @@
+import random
+import threading
+from itertools import combinations
+
+import pytest
+
+from balatro import cache as cache_module
+from balatro.cache import EvaluationCache, hand_key, precompute_table
+from balatro.cards import CARDS, decode_cards
+from balatro.parallel import run_chunk, run_parallel
+from balatro.scoring import evaluate_hand, get_engine, set_engine
+from balatro.tables import evaluate_codes
+
+
+def _random_hands(count, seed=0):
+    rng = random.Random(seed)
+    return [rng.sample(range(52), 5) for _ in range(count)]
+
+
+def test_key_ignores_order_and_suit_relabelling():
+    codes = [0, 9, 18, 27, 44]
+    assert hand_key(codes) == hand_key(list(reversed(codes)))
+    relabelled = [code ^ 1 for code in codes]
+    assert hand_key(codes) == hand_key(relabelled)
+    flush = [code & ~3 for code in codes]
+    assert hand_key(flush) != hand_key(codes)
+
+
+def test_precomputed_table_covers_every_hand():
+    table = precompute_table()
+    assert sum(value != 0xFF for value in table) == 7462
+    # Every suit pattern of a few rank sets, plus random hands, agree with the table engine.
+    for codes in list(combinations(range(0, 52, 3), 5))[:2000] + _random_hands(5000):
+        assert evaluate_codes(codes).name == evaluate_hand(decode_cards(codes), engine="table").name
+        assert table[hand_key(codes)] != 0xFF
+
+
+def test_cache_matches_uncached_results_and_counts_hits():
+    cache = EvaluationCache()
+    hands = [decode_cards(codes) for codes in _random_hands(2000, seed=1)]
+    for hand in hands + hands:
+        assert cache.evaluate(hand) == evaluate_hand(hand, engine="table")
+    stats = cache.stats()
+    assert stats.hits + stats.misses == 4000
+    assert stats.misses == stats.size <= 2000
+    assert stats.hit_rate > 0.5
+
+
+def test_lru_eviction_is_bounded():
+    cache = EvaluationCache(maxsize=10)
+    for codes in _random_hands(500, seed=2):
+        cache.evaluate_codes(codes)
+    stats = cache.stats()
+    assert stats.size == 10
+    assert stats.evictions == stats.misses - 10
+    cache.clear()
+    assert cache.stats().size == cache.stats().hits == 0
+    with pytest.raises(ValueError):
+        EvaluationCache(maxsize=0)
+    with pytest.raises(ValueError):
+        cache.evaluate(list(CARDS[:4]))
+
+
+def test_read_only_table_mode():
+    cache = EvaluationCache(table=precompute_table())
+    for codes in _random_hands(1000, seed=3):
+        assert cache.evaluate_codes(codes) == evaluate_codes(codes)
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1000, 0, 0)
+    with pytest.raises(ValueError):
+        EvaluationCache(table=b"short")
+
+
+def test_concurrent_use_is_consistent():
+    cache = EvaluationCache(maxsize=64)
+    hands = _random_hands(3000, seed=4)
+    errors = []
+
+    def worker(offset):
+        for codes in hands[offset:] + hands[:offset]:
+            if cache.evaluate_codes(codes) != evaluate_codes(codes):
+                errors.append(codes)
+
+    threads = [threading.Thread(target=worker, args=(i * 500,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    stats = cache.stats()
+    assert stats.hits + stats.misses == 4 * 3000
+    assert stats.size <= 64
+
+
+def test_cached_engine_uses_installed_cache():
+    previous = get_engine()
+    try:
+        installed = cache_module.install(EvaluationCache(maxsize=100))
+        assert get_engine() == "cached"
+        hand = decode_cards([0, 4, 8, 12, 17])
+        assert evaluate_hand(hand).name == "Straight"
+        evaluate_hand(hand)
+        assert installed.stats().hits == 1
+    finally:
+        set_engine(previous)
+
+
+def test_parallel_workers_share_the_table():
+    local = run_parallel(40, "greedy", seed=5, workers=1, chunk_size=10)
+    shared = run_parallel(40, "greedy", seed=5, workers=2, chunk_size=10, shared_table=True)
+    assert shared.total_score == local.total_score
+    assert shared.categories == local.categories
+
+    # What each pool worker runs: every played hand is answered from the table.
+    previous, default = get_engine(), cache_module.default_cache()
+    try:
+        cache_module.init_worker(precompute_table())
+        chunk = run_chunk("greedy", 5, 0, 10)
+        stats = cache_module.default_cache().stats()
+        assert stats.hits == sum(chunk.categories) > 0
+        assert (stats.misses, stats.size) == (0, 0)
+        assert chunk.categories == run_parallel(10, "greedy", seed=5, workers=1, chunk_size=10).categories
+    finally:
+        cache_module._default = default
+        set_engine(previous)
+
+
+def test_misses_use_the_reference_evaluator(monkeypatch):
+    calls = []
+
+    def reference(cards):
+        calls.append(cards)
+        return evaluate_hand(cards, engine="reference")
+
+    monkeypatch.setattr(cache_module, "_evaluate_reference", reference)
+    cache = EvaluationCache()
+    hand = decode_cards([0, 4, 8, 12, 17])
+    assert cache.evaluate(hand) == cache.evaluate(hand) == evaluate_hand(hand, engine="table")
+    assert len(calls) == 1
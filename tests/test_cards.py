@@ -0,0 +1,71 @@
+import copy
+import random
+import pickle
+
+import pytest
+
+from balatro.cards import CARDS, DECK_SIZE, RANKS, SUITS, Card, Deck, decode_cards, encode_cards, rank_index, suit_index
+from balatro.scoring import evaluate_codes, evaluate_hand
+
+
+def test_cards_are_interned():
+    assert Card("A", "♠") is Card("A", "♠")
+    assert Card("A", "♠") != Card("A", "♥")
+    assert len({Card(rank, suit) for suit in SUITS for rank in RANKS}) == DECK_SIZE
+
+
+def test_unknown_card_rejected():
+    with pytest.raises(ValueError):
+        Card("1", "♠")
+
+
+def test_code_round_trip():
+    for code in range(DECK_SIZE):
+        card = Card.from_code(code)
+        assert card.code == code
+        assert RANKS[rank_index(code)] == card.rank
+        assert SUITS[suit_index(code)] == card.suit
+    assert decode_cards(encode_cards(CARDS)) == list(CARDS)
+
+
+def test_copy_and_pickle_preserve_identity():
+    card = Card("10", "♦")
+    assert copy.copy(card) is card
+    assert copy.deepcopy(card) is card
+    assert pickle.loads(pickle.dumps(card)) is card
+
+
+def test_card_has_no_instance_dict():
+    with pytest.raises(AttributeError):
+        Card("2", "♣").__dict__
+
+
+def test_deck_and_scoring_on_codes():
+    deck = Deck()
+    codes = deck.draw_codes(5)
+    assert deck.remaining() == DECK_SIZE - 5
+    assert evaluate_codes(codes) is evaluate_hand(decode_cards(codes))
+
+
+def test_seeded_deal_is_reproducible_and_reset_reuses_buffer():
+    deck = Deck(random.Random(11))
+    first = deck.draw(8) + deck.draw(5)
+    assert Deck(random.Random(11)).draw(13) == first
+    buffer = deck._cards
+    deck.reset(11)
+    assert deck._cards is buffer
+    assert deck.remaining() == DECK_SIZE
+    assert deck.draw(13) == first
+
+
+def test_draw_never_repeats_and_take_back_returns_cards():
+    deck = Deck(random.Random(2))
+    hand = deck.draw(10)
+    rest = deck.remaining_cards()
+    assert len(set(hand + rest)) == DECK_SIZE
+    deck.take_back(hand[:4])
+    assert deck.remaining() == DECK_SIZE - 6
+    assert set(deck.remaining_cards()) == set(rest) | set(hand[:4])
+    assert len(set(deck.draw(deck.remaining()))) == DECK_SIZE - 6
+    deck.reset()
+    assert sorted(card.code for card in deck.draw(DECK_SIZE)) == list(range(DECK_SIZE))
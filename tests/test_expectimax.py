@@ -0,0 +1,131 @@
+import random
+from itertools import combinations
+
+import pytest
+
+from balatro.cards import CARDS, Card
+from balatro.expectimax import ExpectimaxSolver, _canonical, solve
+from balatro.game import SimpleGame
+from balatro.scoring import evaluate_hand
+from test_game import FixedDeck
+
+
+def naive_value(hand, deck, plays, discards):
+    if plays <= 0 or len(hand) < 5:
+        return 0.0
+
+    def after_draw(kept, plays_left, discards_left):
+        if plays_left <= 0:
+            return 0.0
+        draw = min(8 - len(kept), len(deck))
+        outcomes = list(combinations(deck, draw))
+        return sum(
+            naive_value(kept + list(drawn), [c for c in deck if c not in drawn], plays_left, discards_left)
+            for drawn in outcomes
+        ) / len(outcomes)
+
+    best = 0.0
+    for played in combinations(hand, 5):
+        kept = [c for c in hand if c not in played]
+        best = max(best, evaluate_hand(list(played)).total + after_draw(kept, plays - 1, discards))
+    if discards:
+        for size in range(1, 6):
+            for discarded in combinations(hand, size):
+                kept = [c for c in hand if c not in discarded]
+                best = max(best, after_draw(kept, plays, discards - 1))
+    return best
+
+
+def deal(seed, deck_size):
+    codes = random.Random(seed).sample(range(52), 8 + deck_size)
+    return [CARDS[c] for c in codes[:8]], [CARDS[c] for c in codes[8:]]
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_matches_naive_enumeration(seed):
+    hand, deck = deal(seed, 3)
+    solver = ExpectimaxSolver()
+    assert solver.value(hand, deck, 2, 1) == pytest.approx(naive_value(hand, deck, 2, 1))
+    best = solver.discard_values(hand, deck, 2, 1)[0]
+    assert best.expected == pytest.approx(solver.value(hand, deck, 2, 1))
+
+
+def test_suit_relabelled_states_share_cache_entries():
+    hand, deck = deal(5, 3)
+    swap = {"♠": "♥", "♥": "♠", "♦": "♣", "♣": "♦"}
+    relabel = lambda cards: [Card(card.rank, swap[card.suit]) for card in cards]
+    solver = ExpectimaxSolver()
+    first = solver.value(hand, deck, 2, 1)
+    nodes = solver.stats.nodes
+    assert solver.value(relabel(hand), relabel(deck), 2, 1) == first
+    assert solver.stats.nodes == nodes
+    assert solver.stats.hits > 0
+    assert 0 < solver.stats.hit_rate < 1
+
+
+def _cards(text):
+    return [Card(token[:-1], token[-1]) for token in text.split()]
+
+
+def test_rank_relabelled_states_share_cache_entries():
+    # No five of these ranks are consecutive, so no straight can be formed and
+    # swapping two of them leaves every category unchanged.
+    hand, deck = _cards("2♠ 2♥ 2♦ 4♠ 4♥ 8♠ 8♥ Q♠"), _cards("4♦ Q♥ 6♣")
+    swap = {"2": "Q", "Q": "2"}
+    relabel = lambda cards: [Card(swap.get(card.rank, card.rank), card.suit) for card in cards]
+    codes = lambda cards: [card.code for card in cards]
+    assert _canonical(codes(hand), codes(deck)) == _canonical(codes(relabel(hand)), codes(relabel(deck)))
+    solver = ExpectimaxSolver()
+    first = solver.value(hand, deck, 2, 1)
+    assert first == pytest.approx(naive_value(hand, deck, 2, 1))
+    nodes = solver.stats.nodes
+    assert solver.value(relabel(hand), relabel(deck), 2, 1) == first
+    assert solver.stats.nodes == nodes
+
+
+def test_ranks_that_can_still_make_a_straight_are_not_merged():
+    hand, deck = _cards("5♠ 6♥ 7♦ 8♣ 2♠ 2♥ K♦ K♣"), _cards("9♠ A♥ 3♦")
+    codes = lambda cards: [card.code for card in cards]
+    # The 9 in the deck completes 5-9, the held 2s cannot join a straight:
+    # swapping the two ranks changes which cards are worth keeping.
+    swap = {"2": "9", "9": "2"}
+    relabel = lambda cards: [Card(swap.get(card.rank, card.rank), card.suit) for card in cards]
+    assert _canonical(codes(hand), codes(deck)) != _canonical(codes(relabel(hand)), codes(relabel(deck)))
+    solver = ExpectimaxSolver()
+    assert solver.value(hand, deck, 2, 1) == pytest.approx(naive_value(hand, deck, 2, 1))
+
+
+def test_absent_ranks_are_never_relabelled_into_a_straight():
+    low, high = _cards("2♠ 3♥ 4♠ 5♠ 7♠"), _cards("10♠ J♥ Q♠ K♠ A♠")
+    assert ExpectimaxSolver().value(low, [], 2, 1) == 10
+    assert ExpectimaxSolver().value(high, [], 2, 1) == 220
+    for first, second, expected in ((low, high, 220), (high, low, 10)):
+        solver = ExpectimaxSolver()
+        solver.value(first, [], 2, 1)
+        assert solver.value(second, [], 2, 1) == expected
+
+
+def test_shared_solver_matches_naive_enumeration():
+    solver = ExpectimaxSolver()
+    for seed in (6, 18, 28):
+        hand, deck = deal(seed, 2)
+        assert solver.value(hand, deck, 2, 1) == pytest.approx(naive_value(hand, deck, 2, 1))
+
+
+def test_bounded_cache_evicts():
+    hand, deck = deal(3, 3)
+    solver = ExpectimaxSolver(cache_size=10)
+    unbounded = ExpectimaxSolver().value(hand, deck, 2, 1)
+    assert solver.value(hand, deck, 2, 1) == pytest.approx(unbounded)
+    assert solver.stats.evictions > 0
+    assert len(solver._cache) <= 10
+
+
+def test_solve_game_without_discards_reports_only_playing():
+    hand, deck = deal(4, 2)
+    game = SimpleGame(deck=FixedDeck(hand + deck))
+    game.start()
+    game.discards_remaining = 0
+    options = solve(game)
+    assert [option.discard for option in options] == [()]
+    assert options[0].expected >= game.best_play().result.total
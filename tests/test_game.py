@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from balatro.cards import Card, Deck
@@ -79,3 +81,53 @@ def test_play_limits_and_reset():
 
     game.start()
     assert game.plays_remaining == game.max_plays
+
+
+def seeded_game(seed=7):
+    game = SimpleGame(deck=Deck(random.Random(seed)))
+    game.start()
+    return game
+
+
+def test_snapshot_restore_replays_the_same_future():
+    game = seeded_game()
+    game.discard_cards([0, 1])
+    snapshot = game.snapshot()
+
+    first = game.play_cards([0, 1, 2, 3, 4])
+    hand_after = list(game.hand)
+
+    game.restore(snapshot)
+    assert game.snapshot() == snapshot
+    assert game.play_cards([0, 1, 2, 3, 4]) is first
+    assert game.hand == hand_after
+
+
+def test_snapshot_is_hashable_transposition_key():
+    game = seeded_game()
+    table = {game.snapshot(): "root"}
+    twin = seeded_game()
+    assert table[twin.snapshot()] == "root"
+    twin.discard_cards([0])
+    assert twin.snapshot() not in table
+
+
+def test_clone_is_independent_and_deals_identically():
+    game = seeded_game()
+    before = game.snapshot()
+    clone = game.clone()
+
+    clone_result = clone.play_cards([0, 1, 2, 3, 4])
+    assert game.snapshot() == before
+    assert game.play_cards([0, 1, 2, 3, 4]) is clone_result
+    assert game.hand == clone.hand
+    assert game.snapshot() == clone.snapshot()
+
+
+def test_clone_of_fixed_deck_game():
+    game = SimpleGame(deck=FixedDeck(make_cards(20)))
+    game.start()
+    clone = game.clone()
+    clone.discard_cards([0, 1, 2])
+    assert len(game.deck.remaining_cards()) == 12
+    assert len(clone.deck.remaining_cards()) == 9
@@ -0,0 +1,50 @@
+import pstats
+
+from balatro import game, instrument, scoring
+from balatro.cards import Deck
+from balatro.simulate import POLICIES, run
+
+
+def test_disabled_instrumentation_leaves_originals_in_place():
+    originals = (scoring.evaluate_hand, game.evaluate_hand, Deck.draw, game.SimpleGame._refill, dict(POLICIES))
+    with instrument.instrumented():
+        assert instrument.is_enabled()
+        assert Deck.draw is not originals[2]
+    assert not instrument.is_enabled()
+    assert (scoring.evaluate_hand, game.evaluate_hand, Deck.draw, game.SimpleGame._refill, dict(POLICIES)) == originals
+
+
+def test_counts_calls_of_hot_paths():
+    with instrument.instrumented():
+        run(4, POLICIES["random"], seed=2)
+    stats = instrument.snapshot()
+
+    assert stats["policy:random"].calls >= 4 * 5
+    assert stats["evaluate_hand"].calls == 4 * 5
+    # Every play and discard refills the hand, and every refill and deal draws.
+    assert stats["refill"].calls == stats["policy:random"].calls
+    assert stats["Deck.draw"].calls >= 4
+    assert all(item.seconds >= 0 for item in stats.values())
+    assert "evaluate_hand" in instrument.format_report(stats)
+
+
+def test_counts_are_cleared_between_sessions():
+    with instrument.instrumented():
+        run(1, POLICIES["greedy"], seed=0)
+    with instrument.instrumented():
+        pass
+    assert instrument.snapshot() == {}
+
+    run(1, POLICIES["greedy"], seed=0)
+    assert instrument.snapshot() == {}
+
+
+def test_profile_session_dumps_cprofile_stats(tmp_path):
+    path = tmp_path / "session.prof"
+    lines = []
+    with instrument.profile_session(str(path), out=lines.append):
+        run(2, POLICIES["greedy"], seed=1)
+
+    assert "policy:greedy" in lines[0]
+    stats = pstats.Stats(str(path))
+    assert any(name == "play_game" for (_, _, name) in stats.stats)
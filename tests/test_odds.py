@@ -0,0 +1,79 @@
+import random
+from collections import Counter
+from itertools import combinations
+
+import pytest
+
+from balatro.cards import CARDS, Deck
+from balatro.game import SimpleGame
+from balatro.odds import CLASSIC_FREQUENCIES, _odds, category_odds, classic_table, game_odds, signature
+from balatro.scoring import CATEGORY_IDS
+from balatro.solver import best_play_codes
+
+
+def _brute_force(kept, deck, draws):
+    counts = Counter()
+    kept_codes = [card.code for card in kept]
+    for drawn in combinations([card.code for card in deck], draws):
+        counts[CATEGORY_IDS[best_play_codes(kept_codes + list(drawn)).result.name]] += 1
+    return counts
+
+
+def test_full_deck_matches_classic_frequencies():
+    assert classic_table() == CLASSIC_FREQUENCIES
+    assert sum(CLASSIC_FREQUENCIES.values()) == 2_598_960
+
+
+@pytest.mark.parametrize("seed,kept,deck_size,draws", [
+    (0, 5, 20, 3),
+    (1, 3, 16, 5),
+    (2, 7, 30, 1),
+    (3, 6, 24, 2),
+    (4, 0, 18, 5),
+    (5, 4, 14, 4),
+])
+def test_matches_enumeration(seed, kept, deck_size, draws):
+    rng = random.Random(seed)
+    cards = list(CARDS)
+    rng.shuffle(cards)
+    held, deck = cards[:kept], cards[kept : kept + deck_size]
+    odds = category_odds(held, deck, draws)
+    expected = _brute_force(held, deck, draws)
+    assert odds.counts == tuple(expected[i] for i in range(len(odds.counts)))
+    assert sum(odds.probabilities().values()) == pytest.approx(1.0)
+
+
+def test_flush_heavy_positions_match_enumeration():
+    # Two four-card suits held: both flushes can complete in the same draw.
+    by_code = {card.code: card for card in CARDS}
+    held = [by_code[code] for code in (0, 4, 8, 12, 1, 5, 9, 13)]
+    deck = [by_code[code] for code in (17, 21, 33, 37, 18, 22, 42, 46, 50, 51)]
+    odds = category_odds(held, deck, 3)
+    expected = _brute_force(held, deck, 3)
+    assert odds.counts == tuple(expected[i] for i in range(len(odds.counts)))
+
+
+def test_suit_relabelling_shares_a_cache_entry():
+    kept = [0, 4, 9]
+    deck = [16, 21, 26, 31, 36, 40]
+    swapped = [code ^ 1 for code in kept], [code ^ 1 for code in deck]
+    assert signature(kept, deck, 2) == signature(*swapped, 2)
+    _odds.cache_clear()
+    category_odds([CARDS[c] for c in kept], [CARDS[c] for c in deck], 2)
+    category_odds([CARDS[c] for c in swapped[0]], [CARDS[c] for c in swapped[1]], 2)
+    assert _odds.cache_info().hits == 1
+
+
+def test_game_odds_and_validation():
+    game = SimpleGame(deck=Deck(random.Random(6)))
+    game.start()
+    keep_all = game_odds(game, [])
+    assert keep_all.counts[CATEGORY_IDS[game.best_play().result.name]] == keep_all.total
+    after = game_odds(game, [0, 1, 2])
+    assert after.total == len(list(combinations(range(game.deck.remaining()), 3)))
+    fresh = game_odds(game)
+    assert fresh.expected_total > 0
+    with pytest.raises(ValueError):
+        game_odds(game, [0, 0])
+    with pytest.raises(ValueError):
+        category_odds(game.hand[:2], game.deck.remaining_cards(), 2)
@@ -0,0 +1,31 @@
+from balatro.parallel import MIN_CHUNK, auto_chunk_size, run_parallel, scaling_report
+from balatro.simulate import SimulationSummary, greedy_policy, run
+
+
+def totals(summary):
+    return summary.games, summary.total_score, summary.best_score, summary.categories, summary.scores
+
+
+def test_results_do_not_depend_on_workers_or_chunking():
+    expected = totals(run(120, greedy_policy, seed=9))
+    assert totals(run_parallel(120, "greedy", seed=9, workers=1)) == expected
+    assert totals(run_parallel(120, "greedy", seed=9, workers=2, chunk_size=17)) == expected
+    assert totals(run_parallel(120, greedy_policy, seed=9, workers=3)) == expected
+
+
+def test_on_chunk_sees_running_totals():
+    seen = []
+    run_parallel(100, "random", seed=1, workers=1, chunk_size=25, on_chunk=lambda s: seen.append(s.games))
+    assert seen == [25, 50, 75, 100]
+
+
+def test_auto_chunk_size_balances_and_clamps():
+    pilot = SimulationSummary(games=10, elapsed=0.01)  # 1 ms per game
+    assert auto_chunk_size(pilot, 1_000_000, workers=2) == 250
+    assert auto_chunk_size(pilot, 100, workers=4) == MIN_CHUNK
+
+
+def test_scaling_report_shape():
+    points = scaling_report(40, "greedy", seed=0, max_workers=2)
+    assert [point.workers for point in points] == [1, 2]
+    assert points[0].speedup == 1.0
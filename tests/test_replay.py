@@ -0,0 +1,119 @@
+import pytest
+
+from balatro.replay import (
+    END,
+    HEADER,
+    PLAY,
+    RECORD,
+    RecordedGame,
+    ReplayError,
+    ReplayWriter,
+    indices_to_mask,
+    mask_to_indices,
+    replay,
+    scan,
+    summarize,
+)
+from balatro.simulate import random_policy, run
+
+
+def test_mask_round_trip():
+    assert indices_to_mask([0, 3, 7]) == 0b10001001
+    assert mask_to_indices(0b10001001) == [0, 3, 7]
+
+
+def test_simulated_games_replay_and_summarize(tmp_path):
+    path = tmp_path / "games.blrp"
+    with ReplayWriter(path) as log:
+        summary = run(25, random_policy, seed=7, log=log)
+
+    assert replay(path) == 25
+    logged = summarize(path)
+    assert logged.games == summary.games
+    assert logged.total_score == summary.total_score
+    assert logged.categories == summary.categories
+    assert logged.hands == sum(summary.categories)
+
+
+def test_appending_keeps_one_header(tmp_path):
+    path = tmp_path / "games.blrp"
+    for seed in (1, 2):
+        with ReplayWriter(path) as log:
+            run(3, random_policy, seed=seed, log=log)
+    assert replay(path) == 6
+    assert (path.stat().st_size - HEADER.size) % RECORD.size == 0
+
+
+def test_recorded_game_logs_manual_session(tmp_path):
+    path = tmp_path / "session.blrp"
+    with ReplayWriter(path) as log:
+        game = RecordedGame(log, seed=123)
+        game.start()
+        game.discard_cards([0, 1])
+        result = game.play_cards(game.best_play().indices)
+        game.finish()
+
+    records = list(scan(path))
+    assert [record[0] for record in records] == [1, 3, PLAY, END]
+    assert records[0][4] == 123
+    assert records[-1][3] == result.total == game.score
+    assert replay(path) == 1
+
+
+def test_tampered_score_is_detected(tmp_path):
+    path = tmp_path / "games.blrp"
+    with ReplayWriter(path) as log:
+        run(2, random_policy, seed=3, log=log)
+
+    data = bytearray(path.read_bytes())
+    for offset in range(HEADER.size, len(data), RECORD.size):
+        kind, category, mask, total, seed = RECORD.unpack_from(data, offset)
+        if kind == PLAY:
+            RECORD.pack_into(data, offset, kind, category, mask, total + 1, seed)
+            break
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ReplayError):
+        replay(path)
+
+
+def test_torn_trailing_record_is_ignored(tmp_path):
+    path = tmp_path / "games.blrp"
+    with ReplayWriter(path) as log:
+        run(2, random_policy, seed=4, log=log)
+    with open(path, "ab") as handle:
+        handle.write(b"\x01\x02\x03")
+    assert replay(path) == 2
+
+
+def test_appending_after_a_torn_record_realigns(tmp_path):
+    path = tmp_path / "games.blrp"
+    with ReplayWriter(path) as log:
+        run(2, random_policy, seed=4, log=log)
+    intact = path.stat().st_size
+    with open(path, "ab") as handle:
+        handle.write(b"\x01\x02\x03")
+    with ReplayWriter(path) as log:
+        run(3, random_policy, seed=5, log=log)
+    assert (path.stat().st_size - intact) % RECORD.size == 0
+    assert replay(path) == 5
+    assert summarize(path).games == 5
+
+
+def test_empty_file_is_an_empty_log(tmp_path):
+    path = tmp_path / "games.blrp"
+    path.write_bytes(b"")
+    assert list(scan(path)) == []
+    assert replay(path) == 0
+    with ReplayWriter(path) as log:
+        run(1, random_policy, seed=6, log=log)
+    assert replay(path) == 1
+
+
+def test_rejects_foreign_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a replay log at all")
+    with pytest.raises(ReplayError):
+        list(scan(path))
+    with pytest.raises(ReplayError):
+        ReplayWriter(path)
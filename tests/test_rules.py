@@ -0,0 +1,98 @@
+import random
+from itertools import combinations
+
+import pytest
+
+from balatro.cards import CARDS, Deck
+from balatro.game import SimpleGame
+from balatro.rules import (
+    ALL_CATEGORY_IDS,
+    DEFAULT_RULES,
+    Rules,
+    classify_extended,
+    evaluate_variants,
+    sample_hands,
+)
+from balatro.scoring import HAND_RESULTS, evaluate_hand
+from balatro.solver import _exhaustive, best_play_codes
+from balatro.tables import classify_codes
+
+EXTRAS = (
+    DEFAULT_RULES.with_score("Five of a Kind", 120, 12)
+    .with_score("Flush House", 140, 14)
+    .with_score("Flush Five", 160, 16)
+    .with_options(decks=2)
+)
+
+
+def test_default_rules_match_builtin_scoring():
+    compiled = DEFAULT_RULES.compile()
+    assert compiled.results[: len(HAND_RESULTS)] == HAND_RESULTS
+    rng = random.Random(0)
+    for _ in range(500):
+        hand = rng.sample(CARDS, 5)
+        assert evaluate_hand(hand, rules=DEFAULT_RULES) == evaluate_hand(hand)
+    assert DEFAULT_RULES.compile() is Rules().compile()
+
+
+def test_custom_scores_change_best_play():
+    rules = Rules.from_scores({"Flush": (200, 10)})
+    compiled = rules.compile()
+    assert evaluate_hand([CARDS[c] for c in (0, 4, 8, 12, 20)], rules=rules).total == 2000
+    rng = random.Random(1)
+    for _ in range(500):
+        codes = rng.sample(range(52), 8)
+        assert best_play_codes(codes, rules).result.total == _exhaustive(codes, compiled.results).result.total
+
+
+def test_extra_categories_need_duplicates():
+    ace = 12 << 2
+    assert classify_extended([ace] * 5) == ALL_CATEGORY_IDS["Flush Five"]
+    assert classify_extended([ace, ace, ace + 1, ace + 2, ace + 3]) == ALL_CATEGORY_IDS["Five of a Kind"]
+    assert classify_extended([0, 0, 4, 4, 4]) == ALL_CATEGORY_IDS["Flush House"]
+    assert classify_extended([0, 0, 4, 8, 12]) == ALL_CATEGORY_IDS["Flush"]
+    rng = random.Random(2)
+    for _ in range(500):
+        codes = rng.sample(range(52), 5)
+        assert classify_extended(codes) == classify_codes(codes)
+
+
+def test_disabled_extras_score_as_standard_categories():
+    two_decks = Rules(decks=2)
+    assert two_decks.compile().evaluate_codes([0, 0, 4, 4, 4]).name == "Full House"
+    assert two_decks.compile().evaluate_codes([0] * 5).name == "Four of a Kind"
+    assert EXTRAS.compile().evaluate_codes([0] * 5).name == "Flush Five"
+
+
+def test_game_applies_rules():
+    rules = EXTRAS.with_options(hand_size=10, max_plays=2, max_discards=1)
+    game = SimpleGame(deck=Deck(random.Random(3)), rules=rules)
+    game.start()
+    assert len(game.hand) == 10 and game.deck.remaining() == 94
+    assert (game.max_plays, game.max_discards) == (2, 1)
+    best = game.best_play()
+    expected = max(rules.compile().evaluate([game.hand[i] for i in five]).total for five in combinations(range(10), 5))
+    assert best.result.total == expected
+    assert game.play_cards(list(best.indices)) == best.result
+    assert len(game.hand) == 10
+
+
+def test_evaluate_variants_matches_per_hand_scoring():
+    hands = sample_hands(EXTRAS, 300, seed=4)
+    assert all(len(hand) == 8 for hand in hands)
+    variants = [EXTRAS, Rules(decks=2), Rules.from_scores({"One Pair": (5, 1)}, decks=2)]
+    for score in evaluate_variants(hands, variants):
+        expected = sum(best_play_codes(hand, score.rules).result.total for hand in hands)
+        assert score.total == expected and score.hands == 300
+        assert sum(score.categories) == 300
+
+
+def test_rules_validation():
+    with pytest.raises(ValueError):
+        Rules.from_scores({"Royal Flush": (1, 1)})
+    with pytest.raises(ValueError):
+        Rules(scores=(("High Card", 1, 1),))
+    with pytest.raises(ValueError):
+        Rules(hand_size=4)
+    with pytest.raises(ValueError):
+        Rules(decks=0)
@@ -1,7 +1,9 @@
+from itertools import combinations
+
 import pytest
 
-from balatro.cards import Card
-from balatro.scoring import evaluate_hand
+from balatro.cards import RANKS, SUITS, Card
+from balatro.scoring import HAND_LOOKUP, evaluate_hand, get_engine, set_engine
 
 
 def make_hand(descriptors):
@@ -58,3 +60,59 @@ def test_high_card():
 def test_invalid_hand_size():
     with pytest.raises(ValueError):
         evaluate_hand(make_hand([("2", "♠"), ("5", "♥")]))
+
+
+def test_unknown_engine_rejected():
+    hand = make_hand([("2", "♠"), ("5", "♥"), ("9", "♣"), ("J", "♦"), ("K", "♣")])
+    with pytest.raises(ValueError):
+        evaluate_hand(hand, engine="nope")
+    with pytest.raises(ValueError):
+        set_engine("nope")
+
+
+def test_set_engine_switches_default():
+    hand = make_hand([("A", "♠"), ("2", "♥"), ("3", "♣"), ("4", "♦"), ("5", "♠")])
+    previous = get_engine()
+    set_engine("table")
+    try:
+        assert get_engine() == "table"
+        assert evaluate_hand(hand) is HAND_LOOKUP["Straight"]
+    finally:
+        set_engine(previous)
+
+
+def test_table_engine_matches_reference_on_every_hand():
+    deck = [Card(rank, suit) for suit in SUITS for rank in RANKS]
+    mismatches = [
+        hand
+        for hand in combinations(deck, 5)
+        if evaluate_hand(list(hand), engine="table") is not evaluate_hand(list(hand), engine="reference")
+    ]
+    assert mismatches == []
+
+
+def test_precomputed_tables_match_the_hand_rules():
+    from pathlib import Path
+
+    from balatro import tables
+
+    generated = Path(tables.__file__).with_name("_table_data.py").read_text(encoding="utf-8")
+    assert generated == tables.render_table_data(), "stale: regenerate with python -m balatro.tables"
+    loaded, computed = tables._Tables.load(), tables._Tables.compute()
+    assert loaded.flushes == computed.flushes and loaded.unique5 == computed.unique5
+    assert loaded.products == computed.products
+
+
+def test_evaluate_hands_only_blames_missing_numpy(monkeypatch):
+    import sys
+
+    from balatro.scoring import evaluate_hands
+
+    monkeypatch.delitem(sys.modules, "balatro.batch", raising=False)
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    with pytest.raises(ImportError, match="requires NumPy"):
+        evaluate_hands([[0, 1, 2, 3, 4]])
+    monkeypatch.setitem(sys.modules, "balatro.batch", None)  # e.g. a broken import inside balatro
+    with pytest.raises(ImportError) as excinfo:
+        evaluate_hands([[0, 1, 2, 3, 4]])
+    assert "NumPy" not in str(excinfo.value)
@@ -0,0 +1,142 @@
+import asyncio
+import json
+import os
+import socket
+import tempfile
+
+import pytest
+
+from balatro.server import GameClient, GameServer, SessionManager, load_test
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_dispatch_commands_and_errors():
+    server = GameServer()
+    started = server.dispatch(json.dumps({"id": 1, "op": "start", "seed": 7}))
+    assert started["ok"] and started["id"] == 1 and len(started["hand"]) == 8
+    session = started["session"]
+    again = server.dispatch(json.dumps({"op": "start", "session": session, "seed": 7}))
+    assert again["codes"] == started["codes"]
+    hint = server.dispatch(json.dumps({"op": "hint", "session": session}))
+    played = server.dispatch(json.dumps({"op": "play", "session": session, "indices": hint["indices"]}))
+    assert played["result"]["total"] == hint["total"] == played["score"]
+    assert played["plays_remaining"] == 4
+    discarded = server.dispatch(json.dumps({"op": "discard", "session": session, "indices": [0]}))
+    assert discarded["discards_remaining"] == 4
+    for bad in ("{", "[]", '{"op": "fly"}', json.dumps({"op": "state", "session": "nope"})):
+        assert not server.dispatch(bad)["ok"]
+    error = server.dispatch(json.dumps({"id": 9, "op": "play", "session": session, "indices": [0, 0, 1, 2, 3]}))
+    assert error == {"ok": False, "error": "Card indices must be unique.", "id": 9}
+    assert server.dispatch(json.dumps({"op": "close", "session": session}))["ok"]
+    assert len(server.sessions) == 0
+
+
+def test_dispatch_rejects_malformed_fields():
+    server = GameServer()
+    session = server.dispatch(json.dumps({"op": "start", "seed": 7}))["session"]
+    for indices in ([-1, 0, 1, 2, 3], [0, 1, 2, 3, 8], [True, 1, 2, 3, 4], [0.0]):
+        response = server.dispatch(json.dumps({"op": "play", "session": session, "indices": indices}))
+        assert not response["ok"] and "indices" in response["error"]
+    for field in (5, ["a"], {"x": 1}):
+        response = server.dispatch(json.dumps({"op": "start", "session": field}))
+        assert response == {"ok": False, "error": "session must be a string"}
+    assert not server.dispatch(json.dumps({"op": "start", "seed": True}))["ok"]
+    assert server.dispatch(json.dumps({"op": "state", "session": session}))["plays_remaining"] == 5
+    assert len(server.sessions) == 1
+
+
+def test_dispatch_reports_unexpected_errors():
+    server = GameServer()
+
+    def broken(request):
+        raise KeyError("boom")
+
+    server._ops["broken"] = broken
+    assert server.dispatch(json.dumps({"id": 3, "op": "broken"})) == {
+        "ok": False,
+        "error": "Internal error: KeyError",
+        "id": 3,
+    }
+    assert server.dispatch(json.dumps({"op": "ping"}))["ok"]
+
+
+def test_idle_sessions_are_evicted():
+    clock = FakeClock()
+    sessions = SessionManager(max_sessions=3, idle_timeout=10, clock=clock)
+    first = sessions.start(seed=1)
+    clock.now = 5
+    second = sessions.start(seed=2)
+    clock.now = 12
+    sessions.get(second.id)
+    assert sessions.evict_idle() == 1
+    with pytest.raises(ValueError):
+        sessions.get(first.id)
+    sessions.start(seed=3)
+    sessions.start(seed=4)
+    with pytest.raises(ValueError):
+        sessions.start(seed=5)
+    clock.now = 30
+    sessions.start(seed=6)  # full, but idle sessions make room
+    assert len(sessions) == 1 and sessions.evicted == 4
+
+
+def test_pipelined_requests_over_tcp_and_unix_socket():
+    async def scenario(**options):
+        async with GameServer(**options) as server:
+            client = await GameClient.connect(server.address)
+            session = (await client.request("start", seed=3))["session"]
+            futures = [client.send("play", session=session, indices=[0, 1, 2, 3, 4]) for _ in range(6)]
+            futures.append(client.send("state", session=session))
+            await client.drain()
+            responses = await asyncio.gather(*futures)
+            await client.close()
+            return responses
+
+    for options in ({}, {"path": os.path.join(tempfile.mkdtemp(), "game.sock")}):
+        responses = asyncio.run(scenario(**options))
+        assert [r["plays_remaining"] for r in responses[:5]] == [4, 3, 2, 1, 0]
+        assert responses[5] == {"ok": False, "error": "No plays remaining in this round.", "id": 7}
+        assert responses[6]["score"] == sum(r["result"]["total"] for r in responses[:5])
+        assert not os.path.exists(options.get("path", "/nonexistent"))
+
+
+def test_backpressure_stops_reading_from_slow_clients():
+    sent = 20_000
+
+    async def scenario():
+        async with GameServer(write_high_water=16 * 1024) as server:
+            sock = socket.socket()
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+            sock.connect(server.address)
+            reader, writer = await asyncio.open_connection(sock=sock)
+            started = server.dispatch(json.dumps({"op": "start", "seed": 1}))["session"]
+            writer.write((json.dumps({"op": "state", "session": started}) + "\n").encode() * sent)
+            await asyncio.sleep(0.3)
+            handled_while_stalled = server.requests
+            for _ in range(sent):
+                assert json.loads(await reader.readline())["ok"]
+            writer.close()
+            return handled_while_stalled, server.requests
+
+    stalled, total = asyncio.run(scenario())
+    assert stalled < total == sent + 1
+
+
+def test_load_test_reports_latency_percentiles():
+    async def scenario():
+        async with GameServer() as server:
+            report = await load_test(server.address, connections=4, rounds=2, pipeline=4)
+            return report, len(server.sessions)
+
+    report, remaining = asyncio.run(scenario())
+    assert report.errors == 0 and remaining == 0
+    assert report.requests == 4 * (2 * 9 + 1)
+    assert 0 < report.percentile(50) <= report.percentile(99) <= report.latencies[-1]
+    assert report.requests_per_second > 0
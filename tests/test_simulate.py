@@ -0,0 +1,44 @@
+import io
+import json
+
+import pytest
+
+from balatro.simulate import game_seed, greedy_policy, iter_games, play_game, random_policy, run
+
+
+def test_games_are_reproducible_and_sliceable():
+    first = list(iter_games(20, random_policy, seed=42))
+    again = list(iter_games(20, random_policy, seed=42))
+    tail = list(iter_games(5, random_policy, seed=42, start=15))
+    assert first == again
+    assert first[15:] == tail
+    assert len({record.seed for record in first}) == 20
+    assert game_seed(42, 0) != game_seed(43, 0)
+
+
+def test_records_are_consistent():
+    for record in iter_games(50, greedy_policy, seed=1):
+        assert record.plays == sum(record.categories) == 5
+        assert record.discards == 0
+        assert record.score > 0
+
+
+def test_run_streams_json_lines():
+    out = io.StringIO()
+    summary = run(10, greedy_policy, seed=3, out=out)
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [line["index"] for line in lines] == list(range(10))
+    assert summary.games == 10
+    assert summary.total_score == sum(line["score"] for line in lines)
+    assert sum(summary.categories) == sum(sum(line["categories"].values()) for line in lines)
+    assert summary.games_per_second > 0
+
+
+def test_unknown_action_rejected():
+    with pytest.raises(ValueError):
+        play_game(lambda game, rng: ("pass", []), seed=0)
+
+
+def test_reused_game_deals_like_a_fresh_one():
+    records = list(iter_games(10, random_policy, seed=5))
+    assert records == [play_game(random_policy, record.seed, record.index) for record in records]
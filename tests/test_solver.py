@@ -0,0 +1,73 @@
+import random
+from itertools import combinations
+
+import pytest
+
+from balatro.cards import Card
+from balatro.game import SimpleGame
+from balatro.scoring import evaluate_hand
+from balatro.solver import best_play, best_play_codes
+from test_game import FixedDeck
+
+
+def make_hand(descriptors):
+    return [Card(rank, suit) for rank, suit in descriptors]
+
+
+def brute_force_total(hand):
+    return max(evaluate_hand(list(combo)).total for combo in combinations(hand, 5))
+
+
+def test_matches_brute_force_on_random_hands():
+    rng = random.Random(1234)
+    for _ in range(2000):
+        codes = rng.sample(range(52), rng.choice([5, 6, 7, 8]))
+        hand = [Card.from_code(code) for code in codes]
+        play = best_play(hand)
+        assert len(set(play.indices)) == 5
+        assert evaluate_hand([hand[i] for i in play.indices]) is play.result
+        assert play.result.total == brute_force_total(hand)
+
+
+def test_finds_wheel_straight_flush_among_distractors():
+    hand = make_hand(
+        [("A", "♥"), ("K", "♠"), ("2", "♥"), ("K", "♦"), ("3", "♥"), ("4", "♥"), ("K", "♣"), ("5", "♥")]
+    )
+    play = best_play(hand)
+    assert play.result.name == "Straight Flush"
+    assert play.indices == (0, 2, 4, 5, 7)
+
+
+def test_requires_five_cards():
+    with pytest.raises(ValueError):
+        best_play_codes([0, 1, 2, 3])
+
+
+def test_game_best_play_is_playable():
+    game = SimpleGame(
+        deck=FixedDeck(make_hand([("9", "♣"), ("9", "♦"), ("2", "♠"), ("9", "♠"), ("4", "♥"), ("4", "♣"), ("J", "♦"), ("K", "♥")]))
+    )
+    game.start()
+    play = game.best_play()
+    assert play.result.name == "Full House"
+    assert game.play_cards(list(play.indices)) is play.result
+
+
+def test_matches_exhaustive_search_under_random_rules():
+    from balatro.rules import CATEGORY_NAMES, Rules
+    from balatro.solver import _exhaustive, choose_play, play_options
+
+    rng = random.Random(7)
+    variants = [Rules.from_scores({"High Card": (100, 5)}), Rules.from_scores({"Straight": (0, 1)})]
+    variants += [
+        Rules.from_scores({name: (rng.randrange(0, 200), rng.randrange(1, 10)) for name in CATEGORY_NAMES[:9]})
+        for _ in range(20)
+    ]
+    for rules in variants:
+        compiled = rules.compile()
+        for _ in range(300):
+            codes = rng.sample(range(52), 8)
+            expected = _exhaustive(codes, compiled.results).result.total
+            assert best_play_codes(codes, rules).result.total == expected, (rules, codes)
+            shared = choose_play(codes, play_options(codes), compiled.results, compiled.search_order)
+            assert shared.result.total == expected, (rules, codes)
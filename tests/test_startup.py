@@ -0,0 +1,39 @@
+import os
+
+import pytest
+
+from balatro.bench import STARTUP_COMMANDS, format_startup, measure_startup
+
+HEAVY = {"PIL", "tkinter", "numpy", "sqlite3", "asyncio", "concurrent.futures"}
+
+
+# Wall-clock budgets depend on the machine and its load, so they are opt-in
+# (like ``balatro bench startup --check``); the import sets below always run.
+@pytest.mark.skipif(not os.environ.get("BALATRO_CHECK_BUDGETS"), reason="set BALATRO_CHECK_BUDGETS=1 to check timings")
+@pytest.mark.parametrize("name", sorted(STARTUP_COMMANDS))
+def test_startup_within_import_budget(name):
+    result = measure_startup(name, runs=3)
+    assert not result.over_budget, format_startup([result])
+
+
+def test_help_imports_no_game_code():
+    modules = set(measure_startup("balatro --help", runs=1).modules)
+    assert "balatro.cli" in modules
+    assert not modules & (HEAVY | {"balatro.game", "balatro.scoring", "balatro.cards"})
+
+
+def test_scoring_imports_only_what_it_needs():
+    modules = set(measure_startup("import balatro.scoring", runs=1).modules)
+    assert {m for m in modules if m.startswith("balatro")} == {
+        "balatro", "balatro.cards", "balatro.scoring", "balatro.tables"
+    }
+    assert not modules & HEAVY
+
+
+def test_package_exports_resolve_lazily():
+    import balatro
+
+    assert balatro.Rules.__module__ == "balatro.rules"
+    assert set(balatro.__all__) <= set(dir(balatro))
+    with pytest.raises(AttributeError):
+        balatro.missing_name
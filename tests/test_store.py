@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from balatro.cards import Deck
+from balatro.game import SimpleGame
+from balatro.replay import DISCARD, PLAY
+from balatro.scoring import HAND_SCORES
+from balatro.server import SessionManager
+from balatro.simulate import POLICIES, iter_games
+from balatro.store import GameStore
+
+
+def test_simulator_sink_and_queries(tmp_path):
+    path = tmp_path / "games.db"
+    with GameStore(path, batch_size=50, policy="random") as store:
+        records = list(iter_games(60, POLICIES["random"], seed=3, log=store))
+    with GameStore(path) as store:
+        assert store._db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert store.game_count() == 60
+        top = store.leaderboard(5)
+        expected = sorted(records, key=lambda record: (-record.score, record.index))[:5]
+        assert [entry.score for entry in top] == [record.score for record in expected]
+        assert [entry.seed for entry in top] == [record.seed for record in expected]
+        assert store.leaderboard(5, policy="greedy") == []
+        histogram = store.category_histogram()
+        totals = [sum(record.categories[i] for record in records) for i in range(len(HAND_SCORES))]
+        assert histogram == {name: count for (name, _, _), count in zip(HAND_SCORES, totals) if count}
+        assert store.category_histogram("random") == histogram
+        actions = store.hands(top[0].game_id)
+        assert sum(total for kind, _, _, total in actions if kind == PLAY) == top[0].score
+        assert any(kind == DISCARD for record in records for kind, *_ in store.hands(record.index + 1))
+
+
+def test_game_ids_continue_after_reopening(tmp_path):
+    path = tmp_path / "games.db"
+    for _ in range(2):
+        with GameStore(path, policy="greedy") as store:
+            list(iter_games(3, POLICIES["greedy"], seed=1, log=store))
+    with GameStore(path) as store:
+        assert store.game_count() == 6
+        assert {entry.game_id for entry in store.leaderboard(10)} == set(range(1, 7))
+
+
+def test_sessions_round_trip_and_keep_dealing_identically(tmp_path):
+    game = SimpleGame(deck=Deck(random.Random(11)))
+    game.start()
+    game.discard_cards([0, 3])
+    with GameStore(tmp_path / "s.db") as store:
+        store.save_session("abc", game, score=120, seed=2**64 - 1)
+        pending = store.load_session("abc")  # served from the write buffer
+    with GameStore(tmp_path / "s.db") as store:
+        stored = store.load_session("abc")
+        assert store.load_session("missing") is None
+        store.delete_session("abc")
+        assert store.load_session("abc") is None
+    for restored in (pending, stored):
+        assert (restored.score, restored.seed) == (120, 2**64 - 1)
+        assert restored.game.hand == game.hand
+        assert restored.game.discards_remaining == game.discards_remaining
+    copy = game.clone()
+    copy.discard_cards([1, 2, 4])
+    stored.game.discard_cards([1, 2, 4])
+    assert stored.game.hand == copy.hand
+
+
+def test_server_sessions_survive_a_restart(tmp_path):
+    path = tmp_path / "server.db"
+    with GameStore(path) as store:
+        sessions = SessionManager(store=store)
+        session = sessions.start("table-1", seed=5)
+        result = session.game.play_cards([0, 1, 2, 3, 4])
+        session.score += result.total
+        sessions.save(session)
+        state = session.state()
+    with GameStore(path) as store:
+        resumed = SessionManager(store=store).get("table-1")
+        assert resumed.state() == state
+        with pytest.raises(ValueError):
+            SessionManager(store=store).get("table-2")
+
+
+def test_validation(tmp_path):
+    with pytest.raises(ValueError):
+        GameStore(batch_size=0)
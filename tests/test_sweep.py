@@ -0,0 +1,93 @@
+import csv
+import io
+import random
+
+import pytest
+
+from balatro.cards import Deck
+from balatro.game import SimpleGame
+from balatro.rules import ALL_CATEGORY_IDS, DEFAULT_RULES, Rules
+from balatro.simulate import game_seed
+from balatro.sweep import (
+    POLICIES,
+    _Runner,
+    apply_params,
+    grid,
+    parse_space,
+    random_configs,
+    sweep,
+)
+
+
+def _play_alone(rules, seed, policy):
+    game = SimpleGame(deck=Deck(random.Random(seed)), rules=rules)
+    game.start()
+    score = 0
+    while game.plays_remaining > 0 and len(game.hand) >= 5:
+        kind, indices = policy(game, game.best_play())
+        if kind == "discard":
+            game.discard_cards(list(indices))
+        else:
+            score += game.play_cards(list(indices)).total
+    return score
+
+
+@pytest.mark.parametrize("policy", sorted(POLICIES))
+def test_shared_classification_matches_independent_games(policy):
+    configs = grid({"Flush.chips": [10, 400], "max_discards": [0, 3]})
+    configs += grid({"Five of a Kind.mult": [30]}, base=Rules(decks=2))
+    results = sweep(configs, 12, seed=5, policy=policy, early_stop=False)
+    for stats in results:
+        expected = [_play_alone(stats.config.rules, game_seed(5, i), POLICIES[policy]) for i in range(12)]
+        assert stats.total == sum(expected)
+        assert stats.best == max(expected)
+        assert stats.games == 12 and stats.status == "complete"
+
+
+def test_options_are_reused_across_configurations():
+    configs = grid({"Straight.mult": [1, 4, 9]})
+    runner = _Runner(POLICIES["greedy"])
+    from balatro.sweep import ConfigStats
+
+    for stats in map(ConfigStats, configs):
+        runner.play(stats, 1)
+    # Every configuration gets the same first hand.
+    assert runner.hits >= 2 and runner.misses < 3 * DEFAULT_RULES.max_plays
+
+
+def test_early_stopping_and_streamed_csv():
+    configs = grid({"Flush.chips": [5, 2000]})
+    out = io.StringIO()
+    results = sweep(configs, 5000, seed=2, batch=50, out=out)
+    assert all(stats.games < 5000 for stats in results)
+    assert {stats.status for stats in results} <= {"stopped", "separated"}
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert [int(row["config"]) for row in rows] == [0, 1]
+    assert float(rows[1]["mean"]) > float(rows[0]["mean"])
+    assert int(rows[0]["games"]) == results[0].games
+    assert sum(int(rows[1][name]) for name in ALL_CATEGORY_IDS) >= results[1].games
+
+
+def test_single_configuration_plays_every_game():
+    (stats,) = sweep(grid({"Flush.chips": [65]}), 2000, seed=3, batch=100)
+    assert stats.games == 2000
+    assert stats.status == "complete"
+
+
+def test_parameter_spaces():
+    space = parse_space(["Flush.chips=50,60", "max_plays=3:7:2"])
+    assert space == {"Flush.chips": [50, 60], "max_plays": [3, 5, 7]}
+    configs = grid(space)
+    assert len(configs) == 6
+    assert configs[5].rules.max_plays == 7 and dict(configs[5].params)["Flush.chips"] == 60
+    sampled = random_configs(space, 4, seed=1)
+    assert len({config.params for config in sampled}) == 4
+    assert len(random_configs(space, 100, seed=1)) == 6
+    rules = apply_params(DEFAULT_RULES, [("Flush House.mult", 20), ("decks", 2)])
+    assert ("Flush House", 140, 20) in rules.scores and rules.decks == 2
+    with pytest.raises(ValueError):
+        apply_params(DEFAULT_RULES, [("Flush.colour", 1)])
+    with pytest.raises(ValueError):
+        parse_space(["Flush.chips"])
+    with pytest.raises(ValueError):
+        sweep([], 10)
@@ -0,0 +1,98 @@
+import pytest
+
+ui = pytest.importorskip("balatro.ui")
+
+
+def test_changed_slots_only_reports_differences():
+    shown = [(0, False, True), (5, False, False), (9, True, True), None]
+    assert ui.changed_slots(shown, shown) == []
+    wanted = [(0, False, True), (5, False, True), (9, False, True), (12, False, True)]
+    assert ui.changed_slots(shown, wanted) == [1, 2, 3]
+    assert ui.changed_slots(wanted, wanted[:2] + [None, None]) == [2, 3]
+
+
+def test_scale_snaps_to_steps_and_clamps():
+    assert ui.scale_for(ui.BACKGROUND_SIZE) == 1.0
+    assert ui.scale_for((1280, 720)) == ui.scale_for((1285, 724)) == 0.65
+    assert ui.scale_for((1920, 540)) == ui.scale_for((960, 1080)) == 0.5  # the tighter side wins
+    assert ui.scale_for((10, 10)) == ui.MIN_SCALE and ui.scale_for((10_000, 10_000)) == ui.MAX_SCALE
+
+
+def test_photo_cache_evicts_least_recently_used_within_budget():
+    from PIL import Image
+
+    made = []
+
+    def make(width):
+        def render():
+            made.append(width)
+            return Image.new("RGBA", (width, 10))
+
+        return render
+
+    cache = ui.PhotoCache(budget=3 * 400, factory=lambda image: image.size)
+    for key in ("a", "b", "c"):
+        cache.get(key, make(10))
+    cache.get("a", make(10))  # refresh "a"; "b" is now the oldest
+    cache.get("d", make(10))
+    assert "b" not in cache and "a" in cache and len(cache) == 3
+    assert cache.size == 1200 and cache.evictions == 1 and cache.hits == 1
+    assert cache.get("huge", make(500)) == (500, 10)  # larger than the budget: kept alone
+    assert len(cache) == 1 and made == [10, 10, 10, 10, 500]
+
+
+def test_art_library_resamples_for_the_window(tmp_path):
+    from balatro.assets import AssetCache
+    from balatro.cards import Card
+
+    art = ui.ArtLibrary(AssetCache(tmp_path, enabled=False))
+    assert art.scaled_background_image((960, 540)).size == (960, 540)
+    assert art.set_scale(0.5) and not art.set_scale(0.5)
+    assert art.card_size == (75, 115)
+    assert art.scaled_face_image(Card("K", "♣"), selected=True).size == (75, 115)
+
+
+def _wait_for(worker, timeout=5.0):
+    import time
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        finished = worker.poll()
+        if finished is not None:
+            return finished
+        time.sleep(0.005)
+    raise AssertionError("odds worker did not finish")
+
+
+def test_odds_worker_computes_off_thread_and_keeps_only_the_newest():
+    import threading
+
+    from balatro.game import SimpleGame
+    from balatro.odds import game_odds
+
+    release = threading.Event()
+    threads = []
+
+    def compute(game, discard):
+        threads.append(threading.current_thread())
+        release.wait(5)
+        return game_odds(game, discard)
+
+    game = SimpleGame()
+    game.start()
+    worker = ui.OddsWorker(compute)
+    worker.submit(game, [0], tag="first")
+    worker.submit(game, [0, 1], tag="second")
+    assert worker.poll() is None
+    expected = game_odds(game, [0, 1])
+    game.discard_cards([0, 1, 2])  # the worker keeps its own snapshot
+    release.set()
+    tag, odds = _wait_for(worker)
+    assert threads[-1] is not threading.main_thread()
+    assert (tag, odds) == ("second", expected)
+    assert worker.poll() is None
+
+    worker.submit(game, [0, 0], tag="invalid")
+    assert _wait_for(worker) == ("invalid", None)
+    worker.cancel()
+    assert worker.poll() is None